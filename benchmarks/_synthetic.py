@@ -0,0 +1,24 @@
+import os
+from typing import List
+
+EPISODE_NAME = '[Judas] Synthetic Show {show:03d} - S{season:02d}E{episode:02d} [1080p][HEVC x265 10bit].mkv'
+
+
+def episode_names(show: int, season: int, episodes: int) -> List[str]:
+    return [EPISODE_NAME.format(show=show, season=season, episode=e) for e in range(1, episodes + 1)]
+
+
+def create_tree(path: str, shows: int, seasons: int, episodes: int) -> int:
+    """
+    Creates a library like tree of empty files: <path>/<show>/<season>/<episode>.
+    :return: number of created files
+    """
+    created = 0
+    for show in range(shows):
+        for season in range(1, seasons + 1):
+            season_path = os.path.join(path, f'Synthetic Show {show:03d}', f'Season {season}')
+            os.makedirs(season_path, exist_ok=True)
+            for name in episode_names(show, season, episodes):
+                open(os.path.join(season_path, name), 'w').close()
+                created += 1
+    return created
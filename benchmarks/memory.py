@@ -0,0 +1,113 @@
+"""
+Measures with 'tracemalloc' the memory used by an in-memory synthetic tree built with the legacy dataclass nodes
+against the slotted 'File' and 'Directory' nodes.
+
+    python -m benchmarks.memory [--files=1000000] [--files-per-season=25] [--seasons-per-show=4]
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from typing import Optional
+
+from src.filemapper.tbuilder.models import Directory
+from src.filemapper.tbuilder.models import File
+
+EPISODE_NAME = '[Judas] Synthetic Show {show:05d} - S{season:02d}E{episode:02d} [1080p][HEVC x265 10bit].mkv'
+ROOT = '/mnt/nfs/library/anime'
+
+
+@dataclass
+class LegacyFile:
+    base_path: str
+    name: str
+    parent: Optional['LegacyDirectory'] = None
+
+
+@dataclass
+class LegacyDirectory:
+    base_path: str
+    name: str
+    parent: Optional['LegacyDirectory'] = None
+    childs: list = field(default_factory=list)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.base_path, self.name)
+
+
+def build_legacy(files: int, files_per_season: int, seasons_per_show: int) -> LegacyDirectory:
+    # the legacy builder joined the directory path again for every listed entry
+    root = LegacyDirectory(base_path=os.path.dirname(ROOT), name=os.path.basename(ROOT))
+    for show, season, names in __layout(files, files_per_season, seasons_per_show):
+        if season == 1:
+            show_directory = LegacyDirectory(base_path=root.path, name=f'Synthetic Show {show:05d}', parent=root)
+            root.childs.append(show_directory)
+        season_directory = LegacyDirectory(base_path=show_directory.path, name=f'Season {season}', parent=show_directory)
+        show_directory.childs.append(season_directory)
+        season_directory.childs.extend(
+            LegacyFile(base_path=season_directory.path, name=n, parent=season_directory) for n in names
+        )
+    return root
+
+
+def build_slotted(files: int, files_per_season: int, seasons_per_show: int) -> Directory:
+    root = Directory(base_path=os.path.dirname(ROOT), name=os.path.basename(ROOT))
+    for show, season, names in __layout(files, files_per_season, seasons_per_show):
+        if season == 1:
+            show_directory = Directory(name=f'Synthetic Show {show:05d}', parent=root)
+            root.childs.append(show_directory)
+        season_directory = Directory(name=f'Season {season}', parent=show_directory)
+        show_directory.childs.append(season_directory)
+        season_directory.childs.extend(File(name=n, parent=season_directory) for n in names)
+    return root
+
+
+def __layout(files: int, files_per_season: int, seasons_per_show: int):
+    created = 0
+    show = 0
+    while created < files:
+        for season in range(1, seasons_per_show + 1):
+            count = min(files_per_season, files - created)
+            if count <= 0:
+                break
+            yield show, season, [EPISODE_NAME.format(show=show, season=season, episode=e) for e in range(1, count + 1)]
+            created += count
+        show += 1
+
+
+def measure(builder, *args) -> (int, float):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = builder(*args)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return size, elapsed
+
+
+def main(files: int, files_per_season: int, seasons_per_show: int):
+    print(f'synthetic tree: {files} files\n')
+    print(f'{"nodes":<10}{"MiB":>10}{"bytes/file":>12}{"seconds":>10}')
+    for name, builder in [('legacy', build_legacy), ('slotted', build_slotted)]:
+        size, elapsed = measure(builder, files, files_per_season, seasons_per_show)
+        print(f'{name:<10}{size / 2 ** 20:>10.1f}{size / files:>12.1f}{elapsed:>10.2f}')
+
+
+def __parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', default=1_000_000, type=int)
+    parser.add_argument('--files-per-season', default=25, type=int)
+    parser.add_argument('--seasons-per-show', default=4, type=int)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = __parse_arguments()
+    main(args.files, args.files_per_season, args.seasons_per_show)
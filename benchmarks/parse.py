@@ -0,0 +1,70 @@
+"""
+Times parsing episode names with the single pass lexer, one by one and in a batch sharing the scans of similar names,
+against parsing each field on its own, checking all of them give the same results.
+
+    python -m benchmarks.parse [--names=20000] [--runs=3]
+"""
+import argparse
+import time
+from typing import Callable
+from typing import List
+
+from benchmarks._synthetic import episode_names
+from src.core.models import Episode
+from src.core.models import ParsedInfo
+from src.core.parsers import Parser
+from src.core.parsers.lexer import ReleaseName
+from src.core.types import MediaType
+
+EPISODE_NAMES = [
+    '[SubsPlease] Tate no Yuusha no Nariagari S2 - {episode:02d} (1080p) [1B2526A8].mkv',
+    '[Cleo]Great_Pretender_-_{episode:02d}_(Dual Audio_10bit_1080p_x265).mkv',
+    'The Case Study of Vanitas S01E{episode:02d}.5-Recap [E94DA148].mkv',
+    '[Anipakku] Overlord E{episode:02d}.mkv',
+]
+
+
+def names(size: int) -> List[str]:
+    synthetic = episode_names(show=0, season=1, episodes=size)
+    mixed = [EPISODE_NAMES[e % len(EPISODE_NAMES)].format(episode=e % 100) for e in range(size)]
+    return [n for pair in zip(synthetic, mixed) for n in pair][:size]
+
+
+def timed(
+        fn: Callable[[List[Episode]], List[ParsedInfo]], items: List[Episode], runs: int
+) -> (float, List[ParsedInfo]):
+    best, results = float('inf'), []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = fn(items)
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main(size: int, runs: int):
+    parser = Parser(media_type=MediaType.ANIME)
+    items = [Episode(base_path='/', item_name=n, parsed=None, _media_type=MediaType.ANIME) for n in names(size)]
+
+    field_by_field, expected = timed(lambda items_: [Parser.parsed_info(parser, i) for i in items_], items, runs)
+    single_pass, results = timed(lambda items_: [parser.parsed_info(i) for i in items_], items, runs)
+    batch, batch_results = timed(parser.parse_many, items, runs)
+    fallbacks = sum(not ReleaseName(i.item_name).is_stable for i in items)
+
+    assert results == expected, 'the lexer results differ from the field by field ones'
+    assert batch_results == expected, 'the batch results differ from the field by field ones'
+    print(f'{"parser":>16}{"seconds":>10}{"names/s":>12}{"speedup":>10}')
+    for name, seconds in [('field by field', field_by_field), ('single pass', single_pass), ('parse_many', batch)]:
+        print(f'{name:>16}{seconds:>10.4f}{size / seconds:>12.0f}{field_by_field / seconds:>9.2f}x')
+    print(f'names parsed field by field: {fallbacks}')
+
+
+def __parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--names', default=20000, type=int)
+    parser.add_argument('--runs', default=3, type=int, help='Best of this many runs is reported')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = __parse_arguments()
+    main(args.names, args.runs)
@@ -0,0 +1,58 @@
+"""
+Micro-benchmarks of the cleaning, parsing and matching functions run for every name, reporting the time per call.
+
+    python -m benchmarks.patterns [--calls=20000]
+"""
+import argparse
+import re
+import timeit
+from typing import Callable
+from typing import Dict
+
+from src.core.matchers import AnimeTypeMatcher
+from src.core.matchers import FilmTypeMatcher
+from src.core.parsers import Parser
+from src.core.types import MediaType
+from src.core.utils import patterns
+from src.core.utils import strings
+
+NAME = '[SubsPlease] Tate no Yuusha no Nariagari S2 - 08.5 (1080p) [1B2526A8].mkv'
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    parser = Parser(media_type=MediaType.ANIME)
+    untagged = strings.remove_extension(strings.remove_tracker(strings.generic_clean(NAME)))
+    functions = [
+        strings.generic_clean, strings.remove_tracker, strings.remove_parenthesis, strings.remove_episode,
+        strings.remove_episode_name, strings.remove_season, strings.remove_extension, strings.retrieve_extension,
+    ]
+    benchmarks = {f.__name__: (lambda f=f: f(NAME)) for f in functions}
+    benchmarks.update({
+        '_parse_episode': lambda: parser._parse_episode(NAME),
+        '_parse_episode_part': lambda: parser._parse_episode_part(untagged, 8),
+        '_parse_season': lambda: parser._parse_season(NAME),
+        'AnimeTypeMatcher': lambda: AnimeTypeMatcher().matches(NAME),
+        'FilmTypeMatcher': lambda: FilmTypeMatcher().matches(NAME),
+        'season (dynamic)': lambda: patterns.season(2).search(untagged),
+        're.search (string)': lambda: re.search(r'S\d+E\d+', NAME, re.IGNORECASE),
+        're.search (compiled)': lambda: patterns.SEASON_EPISODE.search(NAME),
+    })
+    return benchmarks
+
+
+def main(calls: int):
+    print(f'{"benchmark":>24}{"us/call":>10}')
+    for name, fn in cases().items():
+        seconds = timeit.timeit(fn, number=calls)
+        print(f'{name:>24}{seconds / calls * 1e6:>10.2f}')
+
+
+def __parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', default=20000, type=int)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = __parse_arguments()
+    main(args.calls)
@@ -0,0 +1,65 @@
+"""
+Times 'Directory.can_be_season' on season folders of growing size, against the legacy pairwise similarity check.
+
+    python -m benchmarks.similarity [--sizes=10,100,1000,5000] [--legacy-max=100]
+"""
+import argparse
+import itertools
+import re
+import time
+from difflib import SequenceMatcher
+from typing import List
+
+from src import settings
+from src.core.utils.strings import apply
+from src.core.utils.strings import generic_clean
+from src.core.utils.strings import remove_episode
+from src.core.utils.strings import remove_extension
+from src.core.utils.strings import remove_parenthesis
+from src.core.utils.strings import remove_tracker
+from src.filemapper.tbuilder.models import Directory
+from src.filemapper.tbuilder.models import File
+
+EPISODE_NAME = '[Erai-raws] One Piece - {episode:04d} [1080p][Multiple Subtitle][{crc:08X}].mkv'
+
+
+def episode_names(size: int) -> List[str]:
+    return [EPISODE_NAME.format(episode=e, crc=e * 2654435761 % 2 ** 32) for e in range(1, size + 1)]
+
+
+def legacy_can_share_season(names: List[str]) -> bool:
+    items = apply([generic_clean, remove_tracker, remove_parenthesis, remove_episode, remove_extension], names)
+    ratios = [SequenceMatcher(None, i[0], i[1]).ratio() for i in itertools.permutations(items, 2)]
+    se = re.compile(r'^(S\d+E\d+|E\d+).*')
+    return all(r >= settings.SIMILARITY_THRESHOLD for r in ratios) or all(se.match(s) for s in items)
+
+
+def main(sizes: List[int], legacy_max: int):
+    print(f'{"files":>8}{"legacy (s)":>14}{"current (s)":>14}')
+    for size in sizes:
+        names = episode_names(size)
+        directory = Directory(base_path='/', name='One Piece', childs=[File(base_path='/', name=n) for n in names])
+
+        start = time.perf_counter()
+        assert directory.can_be_season
+        current = time.perf_counter() - start
+
+        legacy = '-'
+        if size <= legacy_max:
+            start = time.perf_counter()
+            assert legacy_can_share_season(names)
+            legacy = f'{time.perf_counter() - start:.4f}'
+
+        print(f'{size:>8}{legacy:>14}{current:>14.4f}')
+
+
+def __parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='10,100,1000,5000', type=lambda s: [int(i) for i in s.split(',')])
+    parser.add_argument('--legacy-max', default=100, type=int, help='Biggest size timed with the legacy check')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = __parse_arguments()
+    main(args.sizes, args.legacy_max)
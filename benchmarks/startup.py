@@ -0,0 +1,79 @@
+"""
+Measures the import time of the CLIs with 'python -X importtime', running them with '--help' so nothing but the imports
+is measured. The modules already imported by the bare interpreter (site, ...) are not counted.
+
+Fails when a CLI goes over the budget or imports any of the heavy dependencies only needed to process items.
+
+    python -m benchmarks.startup [--budget=] [--runs=] [--top=]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIS = ['file-mapper.py', 'manual-mapper.py']
+HEAVY = ['aiohttp', 'bs4', 'html5lib', 'inquirer', 'polyglot', 'requests']
+
+
+def importtime(*arguments: str) -> Dict[str, Tuple[int, int]]:
+    """
+    :return: (self, cumulative) microseconds by imported module
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', *arguments],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(own), int(cumulative))
+    return modules
+
+
+def measure(script: str, runs: int) -> (float, Dict[str, Tuple[int, int]]):
+    """
+    :return: the fastest total milliseconds and its modules
+    """
+    baseline = importtime('-c', 'pass')
+    results = [
+        {n: t for n, t in importtime(script, '--help').items() if n not in baseline}
+        for _ in range(runs)
+    ]
+    best = min(results, key=lambda m: sum(own for own, _ in m.values()))
+    return sum(own for own, _ in best.values()) / 1000, best
+
+
+def main(budget: float, runs: int, top: int) -> int:
+    failed = False
+    for script in CLIS:
+        total, modules = measure(script, runs)
+        heavy: List[str] = [m for m in HEAVY if m in modules]
+        over = total > budget
+        failed = failed or over or bool(heavy)
+
+        print(f'{script}: {total:.1f}ms (budget {budget:.0f}ms){" OVER BUDGET" if over else ""}')
+        print(f'  heavy imports: {", ".join(heavy) if heavy else "none"}')
+        slowest = sorted(((c, n) for n, (_, c) in modules.items() if '.' not in n), reverse=True)[:top]
+        for cumulative, name in slowest:
+            print(f'  {cumulative / 1000:>8.1f}ms  {name}')
+        print()
+    return 1 if failed else 0
+
+
+def __parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget', default=150, type=float, help='Milliseconds allowed to import each CLI')
+    parser.add_argument('--runs', default=5, type=int)
+    parser.add_argument('--top', default=10, type=int, help='Slowest top-level imports shown')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = __parse_arguments()
+    sys.exit(main(args.budget, args.runs, args.top))
@@ -0,0 +1,86 @@
+"""
+Compares the filesystem calls issued by the legacy 'os.listdir' + 'os.path.isfile' walk against the 'os.scandir' based
+'Tree' builder on a synthetic library.
+
+    python -m benchmarks.walk [--shows=] [--seasons=] [--episodes=]
+"""
+import argparse
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import Callable
+from unittest import mock
+
+from benchmarks._synthetic import create_tree
+from src.filemapper.tbuilder import Tree
+from src.filemapper.tbuilder.models import Directory
+from src.filemapper.tbuilder.models import File
+
+COUNTED_CALLS = ['stat', 'lstat', 'listdir', 'scandir']
+
+
+def legacy_build(directory: Directory):
+    for item in os.listdir(directory.path):
+        full_path = os.path.join(directory.path, item)
+
+        if os.path.isfile(full_path):
+            directory.childs.append(File(base_path=directory.path, name=item, parent=directory))
+            continue
+
+        new_directory = Directory(base_path=directory.path, name=item, parent=directory)
+        legacy_build(new_directory)
+        directory.childs.append(new_directory)
+
+
+def legacy_tree(path: str):
+    legacy_build(Directory(base_path=os.path.dirname(path), name=os.path.basename(path), parent=None))
+
+
+def scandir_tree(path: str):
+    Tree(path=path)
+
+
+def measure(fn: Callable[[str], None], path: str) -> (Counter, float):
+    calls = Counter()
+    patches = []
+    for name in COUNTED_CALLS:
+        original = getattr(os, name)
+
+        def counted(*args, __name=name, __original=original, **kwargs):
+            calls[__name] += 1
+            return __original(*args, **kwargs)
+
+        patches.append(mock.patch.object(os, name, counted))
+
+    [p.start() for p in patches]
+    try:
+        start = time.perf_counter()
+        fn(path)
+        elapsed = time.perf_counter() - start
+    finally:
+        [p.stop() for p in patches]
+    return calls, elapsed
+
+
+def main(shows: int, seasons: int, episodes: int):
+    with tempfile.TemporaryDirectory() as path:
+        files = create_tree(path, shows, seasons, episodes)
+        print(f'synthetic tree: {files} files in {shows * seasons} seasons\n')
+        print(f'{"walker":<10}{"stat":>10}{"lstat":>10}{"listdir":>10}{"scandir":>10}{"seconds":>10}')
+        for name, fn in [('legacy', legacy_tree), ('scandir', scandir_tree)]:
+            calls, elapsed = measure(fn, path)
+            print(f'{name:<10}' + ''.join(f'{calls[c]:>10}' for c in COUNTED_CALLS) + f'{elapsed:>10.3f}')
+
+
+def __parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--shows', default=20, type=int)
+    parser.add_argument('--seasons', default=4, type=int)
+    parser.add_argument('--episodes', default=24, type=int)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = __parse_arguments()
+    main(args.shows, args.seasons, args.episodes)
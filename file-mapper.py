@@ -1,30 +1,111 @@
 import argparse
 import logging
 import os
+import sqlite3
 import sys
+from typing import List
+from typing import Optional
 
 from src import runner
 from src import settings
 from src.core.types import Language
 from src.core.types import MediaType
+from src.core.utils.strings import CleanCache
+from src.core.utils.timings import Timings
+from src.filemapper.cache import ParseCache
+from src.filemapper.engine import AsyncEngine
 from src.filemapper.engine import Engine
+from src.filemapper.journal import Journal
+from src.filemapper.plan import Plan
+from src.filemapper.tbuilder import WalkRules
+from src.filemapper.watcher import Watcher
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 logger.addHandler(logging.StreamHandler(sys.stdout))
 
 
-def main(path: str, media_type: str, lang: str):
-    if not os.path.exists(path):
-        raise ValueError(f'\'{path}\' does not exist')
-
-    engine = Engine(path=path, media_type=media_type, language=lang)
-    engine.run()
+def main(
+        paths: List[str],
+        media_type: str,
+        lang: str,
+        asynchronous: bool = False,
+        plan_file: Optional[str] = None,
+        timings_file: Optional[str] = None,
+        journaled: bool = True,
+        resume: bool = False,
+        parse_cached: bool = False,
+        **options,
+):
+    """
+    :param paths: paths handled by the same engine, the missing ones are logged and skipped by the engine
+    :param asynchronous: use the #AsyncEngine
+    :param plan_file: if given the renames are stored in this file instead of done
+    :param timings_file: if given the time spent in each stage is stored in this file
+    :param journaled: store the progress of the run next to the first path, dropped once the run completes
+    :param resume: skip the items finished by the previous run and reuse its metadata
+    :param parse_cached: reuse the classification and parsing results of the names handled by previous runs
+    :param options: #Engine options
+    """
+    plan = Plan() if plan_file else None
+    journal = None
+    if journaled and plan is None and not settings.DEBUG:  # nothing to resume if nothing is renamed
+        try:
+            journal = Journal.for_library(paths[0], resume=resume)
+        except (OSError, sqlite3.Error) as e:  # i.e. the library is in a read-only folder
+            logger.warning(f'{os.path.basename(__file__)}:: running without a progress journal :: {e}')
+    parse_cache = ParseCache.open() if parse_cached else None
+    engine_class = AsyncEngine if asynchronous else Engine
+    engine = engine_class(
+        path=paths, media_type=media_type, language=lang, plan=plan, journal=journal, parse_cache=parse_cache, **options
+    )
+    try:
+        engine.run()
+        if journal is not None:
+            journal.remove()
+    except Exception:
+        if journal is not None:
+            logger.error(f'{os.path.basename(__file__)}:: run again with \'--resume\' to continue where it stopped')
+        raise
+    finally:
+        if plan is not None:  # the renames of the paths that didn't fail are still valid
+            plan.save(plan_file)
+        if parse_cache is not None:
+            parse_cache.close()
+        if timings_file:
+            Timings().dump(timings_file)
+        if CleanCache().maxsize:
+            logger.info(f'{os.path.basename(__file__)}:: clean cache :: {CleanCache().stats()}')
+
+
+def apply(plan_file: str):
+    if not os.path.isfile(plan_file):
+        raise ValueError(f'\'{plan_file}\' does not exist')
+
+    Plan.load(plan_file).apply()
+
+
+def watch(path: str, media_type: str, lang: str, settle: float, **options):
+    if not os.path.isdir(path):
+        raise ValueError(f'\'{path}\' is not a directory')
+
+    watcher = Watcher(path=path, settle=settle)
+    logger.info(f'{os.path.basename(__file__)}:: watching :: {path}')
+    try:
+        for paths in watcher.changes():
+            try:
+                main([p for p in paths if os.path.exists(p)], media_type, lang, journaled=False, **options)
+            except Exception as e:  # keep watching, the errors of each path are already logged
+                logger.error(f'{os.path.basename(__file__)}:: {paths} :: {e}')
+    finally:
+        watcher.close()
 
 
 def __parse_arguments():
     parser = argparse.ArgumentParser()
-    parser.add_argument('path', help='Path to be handled')
+    parser.add_argument('paths', nargs='*', metavar='path', help='Paths to be handled')
+    parser.add_argument('--paths-from', default=None, type=str,
+                        help='File listing the paths to be handled, one per line. Use \'-\' to read them from stdin')
     parser.add_argument('--type', default=None, help=f'Preset type to be used. Valid: {MediaType.__members__.keys()}')
     parser.add_argument('--lang', default=None,
                         help=f'Preset language to be used. Valid: {Language.__members__.values()}')
@@ -32,9 +113,67 @@ def __parse_arguments():
                         help=f'Predefined Wikipedia URL')
     parser.add_argument('--mal', default=None, type=str,
                         help=f'Predefined MAL URL')
+    parser.add_argument('--async', action='store_true', default=False, dest='asynchronous',
+                        help='Process all the items concurrently in a single event loop')
+    parser.add_argument('--jobs', default=1, type=int,
+                        help='Number of independent files and directories processed concurrently')
+    parser.add_argument('--walk-jobs', default=1, type=int,
+                        help='Number of directories listed concurrently while building the file tree')
+    parser.add_argument('--cpu-jobs', default=1, type=int,
+                        help='Number of processes classifying and parsing the items before they are looked up')
+    parser.add_argument('--stream', action='store_true', default=False,
+                        help='Start processing directories while the file tree is still being listed')
+    parser.add_argument('--snapshot', action='store_true', default=False,
+                        help='Keep a snapshot of the library listings so next runs only list the modified directories')
+    parser.add_argument('--include', action='append', default=None,
+                        help='Only handle the files matching the glob, can be repeated')
+    parser.add_argument('--exclude', action='append', default=None,
+                        help='Skip the files and directories matching the glob, can be repeated')
+    parser.add_argument('--extensions', default=None, type=lambda e: e.split(','),
+                        help='Comma separated list of the file extensions to handle')
+    parser.add_argument('--max-depth', default=None, type=int,
+                        help='Maximum depth of the handled files, being 1 the files directly in the path')
+    parser.add_argument('--symlinks', default='follow', choices=['follow', 'skip'],
+                        help='Follow or skip the symlinked files and directories')
+    parser.add_argument('--watch', action='store_true', default=False,
+                        help='Keep running and only handle the files arriving to the path')
+    parser.add_argument('--settle', default=60, type=float,
+                        help='Seconds without changes before handling the arrived files in watch mode')
+    parser.add_argument('--plan', default=None, type=str,
+                        help='Look up the new names and store the renames in the file without doing them')
+    parser.add_argument('--apply', default=None, type=str,
+                        help='Do the renames stored in a plan file, without handling any path')
+    parser.add_argument('--resume', action='store_true', default=False,
+                        help='Continue an interrupted run skipping the finished items and reusing their metadata')
+    parser.add_argument('--timings', default=None, type=str,
+                        help='Store the time spent in each stage of the run in the file, as JSON')
+    parser.add_argument('--parse-cache', action='store_true', default=False,
+                        help='Keep the parsed names between runs so next runs only parse the new ones')
+    parser.add_argument('--clean-cache', default=0, type=int,
+                        help='Remember this many cleaned names instead of cleaning them again for each field')
     parser.add_argument('--prefill', action='store_true', default=False)
     parser.add_argument('--debug', action='store_true', default=False)
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.paths_from:
+        args.paths += __read_paths(args.paths_from)
+    if not args.paths and not args.apply:
+        parser.error('no paths to be handled')
+    if args.watch and len(args.paths) > 1:
+        parser.error('only one path can be watched')
+    if args.watch and args.plan:
+        parser.error('a watched path can not be planned')
+    if args.resume and (args.watch or args.plan):
+        parser.error('only the runs renaming the files can be resumed')
+    return args
+
+
+def __read_paths(file_name: str) -> List[str]:
+    """
+    :return: the paths listed in the file, ignoring the blank and '#' commented lines
+    """
+    with (open(file_name) if file_name != '-' else sys.stdin) as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith('#')]
 
 
 def __parse_global_datasource(parsed_args):
@@ -61,20 +200,43 @@ if __name__ == '__main__':
         settings.DEBUG = True
         settings.ENABLE_PROFILE = True
 
+    if args.apply:
+        apply(os.path.abspath(args.apply))
+        sys.exit(0)
+
     if args.prefill:
         __prefill()
 
-    __parse_global_datasource(args)
+    if args.clean_cache:
+        CleanCache().enable(maxsize=args.clean_cache)
 
-    if settings.ENABLE_PROFILE:
+    __parse_global_datasource(args)
+    engine_options = dict(
+        asynchronous=args.asynchronous,
+        jobs=args.jobs,
+        walk_jobs=args.walk_jobs,
+        cpu_jobs=args.cpu_jobs,
+        rules=WalkRules(include=args.include, exclude=args.exclude, extensions=args.extensions,
+                        max_depth=args.max_depth)
+        if any([args.include, args.exclude, args.extensions, args.max_depth is not None]) else None,
+        symlinks=args.symlinks,
+        timings_file=args.timings,
+        parse_cached=args.parse_cache,
+    )
+
+    if args.watch:  # runs until stopped, never profiled
+        watch(os.path.abspath(args.paths[0]), args.type, args.lang, args.settle, **engine_options)
+    elif settings.ENABLE_PROFILE:
         import cProfile
         import pstats
 
         with cProfile.Profile() as pr:
-            main(os.path.abspath(args.path), args.type, args.lang)
+            main([os.path.abspath(p) for p in args.paths], args.type, args.lang, plan_file=args.plan,
+                 resume=args.resume, streaming=args.stream, snapshot=args.snapshot, **engine_options)
 
         stats = pstats.Stats(pr)
         stats.sort_stats(pstats.SortKey.TIME)
         stats.dump_stats(filename='profiling.prof')
     else:
-        main(os.path.abspath(args.path), args.type, args.lang)
+        main([os.path.abspath(p) for p in args.paths], args.type, args.lang, plan_file=args.plan,
+             resume=args.resume, streaming=args.stream, snapshot=args.snapshot, **engine_options)
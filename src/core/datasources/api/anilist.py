@@ -3,10 +3,11 @@ import logging
 from typing import List
 from typing import Optional
 
-import requests
+from aiohttp import ClientSession
 from requests import RequestException
 
 from src.core.datasources.datasource import AnimeAPI
+from src.core.datasources.datasource import cached_search
 from src.core.datasources.models import AnilistData
 from src.core.models.metadata import AnimeMetadata
 from src.core.types import DatasourceName
@@ -45,9 +46,10 @@ class AnilistAPI(AnimeAPI):
             }
         }"""
 
+    @cached_search
     def search_anime(self, keyword: str, lang: Language, season: int, season_name: str) -> Optional[AnimeMetadata]:
         variables = {'query': keyword}
-        response = requests.post(
+        response = self._session.post(
             self.BASE_URL,
             headers={},
             json={'query': self.ANIME_SEARCH_QUERY, 'variables': variables}
@@ -55,22 +57,41 @@ class AnilistAPI(AnimeAPI):
         logger.info(f'{self._class}:: searching for :: {keyword}')
 
         if response.status_code == 200:
-            # data format: [{'id': int, 'title': {'romaji': str, 'english': str}}
-            content = json.loads(response.content)['data']['Page']['media']
+            return self.__parse_search(response.content, keyword, lang, season, season_name)
 
-            if not content:
-                logger.error(f'{self._class}:: no match')
-                return None
+        raise RequestException(response=response)
+
+    @cached_search
+    async def search_anime_async(
+            self, session: ClientSession, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        variables = {'query': keyword}
+        async with session.post(self.BASE_URL, json={'query': self.ANIME_SEARCH_QUERY, 'variables': variables}) \
+                as response:
+            logger.info(f'{self._class}:: searching for :: {keyword}')
 
-            # parse data into Python objects
-            data: List[AnilistData] = [AnilistData(d) for d in content]
-            match = self._best_match(keyword, lang, data, season, season_name)
+            if response.status == 200:
+                return self.__parse_search(await response.read(), keyword, lang, season, season_name)
 
-            logger.info(f'{self._class}:: matching result :: {match}')
-            return AnimeMetadata(
-                datasource_data=(self.DATASOURCE, match),
-                title=match.title(Language.JA),
-                title_lang=match.title_lang,
-            )
+            raise RequestException(f'{self._class}:: {response.status} :: {keyword}')
 
-        raise RequestException(response=response)
+    def __parse_search(
+            self, content: bytes, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        # data format: [{'id': int, 'title': {'romaji': str, 'english': str}}
+        content = json.loads(content)['data']['Page']['media']
+
+        if not content:
+            logger.error(f'{self._class}:: no match')
+            return None
+
+        # parse data into Python objects
+        data: List[AnilistData] = [AnilistData(d) for d in content]
+        match = self._best_match(keyword, lang, data, season, season_name)
+
+        logger.info(f'{self._class}:: matching result :: {match}')
+        return AnimeMetadata(
+            datasource_data=(self.DATASOURCE, match),
+            title=match.title(Language.JA),
+            title_lang=match.title_lang,
+        )
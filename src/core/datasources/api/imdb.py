@@ -3,11 +3,12 @@ import logging
 from typing import List
 from typing import Optional
 
-import requests
+from aiohttp import ClientSession
 from requests import RequestException
 
 from src import settings
 from src.core.datasources.datasource import AnimeAPI
+from src.core.datasources.datasource import cached_search
 from src.core.datasources.models import ImdbData
 from src.core.models.metadata import AnimeMetadata
 from src.core.types import DatasourceName
@@ -28,31 +29,53 @@ class ImdbAPI(AnimeAPI):
         'User-Agent': 'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:52.0) Gecko/20100101 Firefox/52.0',
     }
 
+    @cached_search
     def search_anime(self, keyword: str, lang: Language, season: int, season_name: str) -> Optional[AnimeMetadata]:
-        url = self.BASE_URL.format(
-            lang=lang.value,
-            api_key=settings.IMDB_API_KEY,
-            search_expression=keyword,
-        )
-        response = requests.get(url, headers=self.HEADERS)
+        url = self.__get_url(keyword, lang)
+        response = self._session.get(url, headers=self.HEADERS)
         logger.info(f'{self._class}:: searching for :: {url}')
 
         if response.status_code == 200:
-            content = json.loads(response.content)['results']
+            return self.__parse_search(response.content, keyword, lang, season, season_name)
 
-            if not content:
-                logger.error(f'{self._class}:: no match')
-                return None
+        raise RequestException(response=response)
 
-            # parse data into Python objects
-            data: List[ImdbData] = [ImdbData(d) for d in content]
-            match = self._best_match(keyword, lang, data, season, season_name)
+    @cached_search
+    async def search_anime_async(
+            self, session: ClientSession, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        url = self.__get_url(keyword, lang)
+        async with session.get(url, headers=self.HEADERS) as response:
+            logger.info(f'{self._class}:: searching for :: {url}')
 
-            logger.info(f'{self._class}:: matching result :: {match}')
-            return AnimeMetadata(
-                datasource_data=(self.DATASOURCE, match),
-                title=match.title(Language.JA),
-                title_lang=match.title_lang,
-            )
+            if response.status == 200:
+                return self.__parse_search(await response.read(), keyword, lang, season, season_name)
 
-        raise RequestException(response=response)
+            raise RequestException(f'{self._class}:: {response.status} :: {url}')
+
+    def __parse_search(
+            self, content: bytes, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        content = json.loads(content)['results']
+
+        if not content:
+            logger.error(f'{self._class}:: no match')
+            return None
+
+        # parse data into Python objects
+        data: List[ImdbData] = [ImdbData(d) for d in content]
+        match = self._best_match(keyword, lang, data, season, season_name)
+
+        logger.info(f'{self._class}:: matching result :: {match}')
+        return AnimeMetadata(
+            datasource_data=(self.DATASOURCE, match),
+            title=match.title(Language.JA),
+            title_lang=match.title_lang,
+        )
+
+    def __get_url(self, keyword: str, lang: Language) -> str:
+        return self.BASE_URL.format(
+            lang=lang.value,
+            api_key=settings.IMDB_API_KEY,
+            search_expression=keyword,
+        )
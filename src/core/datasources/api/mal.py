@@ -3,12 +3,13 @@ import logging
 from typing import List
 from typing import Optional
 
-import requests
+from aiohttp import ClientSession
 from requests import RequestException
 
 from src import runner
 from src import settings
 from src.core.datasources.datasource import AnimeAPI
+from src.core.datasources.datasource import cached_search
 from src.core.datasources.exceptions import InvalidConfiguration
 from src.core.datasources.exceptions import NotFound
 from src.core.datasources.models import MalData
@@ -38,34 +39,53 @@ class MalAPI(AnimeAPI):
         if settings.MAL_CLIENT_ID is None:
             raise InvalidConfiguration('MAL_CLIENT_ID')
 
+    @cached_search
     def search_anime(self, keyword: str, lang: Language, season: int, season_name: str) -> Optional[AnimeMetadata]:
         url = self.__get_url(keyword)
-        response = requests.get(url, headers=self.HEADERS)
+        response = self._session.get(url, headers=self.HEADERS)
         logger.debug(f'{self._class}:: searching for :: {url}')
 
         if response.status_code == 200:
-            # data format: [{'node': {'id': int, 'alternative_titles': {'en': '', 'ja': ''}, 'title': 'str'}}]
-            content = json.loads(response.content)['data']
+            return self.__parse_search(response.content, keyword, lang, season, season_name)
 
-            if not content:
-                logger.error(f'{self._class}:: no match')
-                return None
+        raise RequestException(response=response)
 
-            # parse data into Python objects
-            data: List[MalData] = [MalData(d['node']) for d in content]
-            match = self._best_match(keyword, lang, data, season, season_name)
+    @cached_search
+    async def search_anime_async(
+            self, session: ClientSession, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        url = self.__get_url(keyword)
+        async with session.get(url, headers=self.HEADERS) as response:
+            logger.debug(f'{self._class}:: searching for :: {url}')
 
-            logger.debug(f'{self._class}:: matching result :: {match}')
-            return AnimeMetadata(
-                datasource_data=(self.DATASOURCE, match),
-                title=match.title(Language.JA),
-                title_lang=match.title_lang,
-            )
+            if response.status == 200:
+                return self.__parse_search(await response.read(), keyword, lang, season, season_name)
 
-        raise RequestException(response=response)
+            raise RequestException(f'{self._class}:: {response.status} :: {url}')
+
+    def __parse_search(
+            self, content: bytes, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        # data format: [{'node': {'id': int, 'alternative_titles': {'en': '', 'ja': ''}, 'title': 'str'}}]
+        content = json.loads(content)['data']
+
+        if not content:
+            logger.error(f'{self._class}:: no match')
+            return None
+
+        # parse data into Python objects
+        data: List[MalData] = [MalData(d['node']) for d in content]
+        match = self._best_match(keyword, lang, data, season, season_name)
+
+        logger.debug(f'{self._class}:: matching result :: {match}')
+        return AnimeMetadata(
+            datasource_data=(self.DATASOURCE, match),
+            title=match.title(Language.JA),
+            title_lang=match.title_lang,
+        )
 
     def options(self, url: str) -> List[AnimeMetadata]:
-        response = requests.get(url, headers=self.HEADERS)
+        response = self._session.get(url, headers=self.HEADERS)
         logger.debug(f'{self._class}:: searching for :: {url}')
 
         if response.status_code == 200:
@@ -91,7 +111,7 @@ class MalAPI(AnimeAPI):
 
     def anime_by_id(self, mal_id: str) -> AnimeMetadata:
         url = self.BY_ID_URL.format(anime_id=mal_id)
-        response = requests.get(url, headers=self.HEADERS)
+        response = self._session.get(url, headers=self.HEADERS)
         logger.debug(f'{self._class}:: searching for :: {url}')
 
         if response.status_code == 200:
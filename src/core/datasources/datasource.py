@@ -1,15 +1,24 @@
+import asyncio
+import functools
 import logging
-import re
+import threading
 from abc import ABC
 from abc import abstractmethod
+from typing import Callable
+from typing import Dict
 from typing import Generic
 from typing import List
 from typing import Optional
 from typing import Protocol
+from typing import Tuple
 from typing import TypeVar
 
+import requests
+from aiohttp import ClientSession
+
 from src.core.datasources.models import APIData
 from src.core.models import Episode
+from src.core.models import MediaItem
 from src.core.models import Season
 from src.core.models import Show
 from src.core.models.metadata import AnimeMetadata
@@ -17,13 +26,28 @@ from src.core.models.metadata import Metadata
 from src.core.types import DatasourceName
 from src.core.types import Language
 from src.core.types import Object
+from src.core.utils import patterns
 from src.core.utils.strings import closest_result
 
 logger = logging.getLogger()
 
+_SEARCHES_SIZE = 1024  # search results kept by each API
+
 
 class Datasource(ABC, Object):
     DATASOURCE: DatasourceName
+    __local = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        """
+        :return: session shared by all the datasources of the thread to keep the connections alive between requests,
+            one per thread as sessions are not thread-safe
+        """
+        session = getattr(Datasource.__local, 'session', None)
+        if session is None:
+            session = Datasource.__local.session = requests.Session()
+        return session
 
 
 class AnimeDatasource(Protocol):
@@ -39,6 +63,13 @@ class AnimeDatasource(Protocol):
     def fill_episode_name(self, episode: Episode) -> Episode:
         raise NotImplemented
 
+    @abstractmethod
+    async def fill_names_async(self, item: MediaItem, session: ClientSession) -> MediaItem:
+        """
+        Same as the 'fill_*' methods for any item using the given session.
+        """
+        raise NotImplemented
+
 
 M = TypeVar('M', bound=Metadata)
 
@@ -50,10 +81,24 @@ class API(Datasource, ABC, Generic[M]):
 
 
 class AnimeAPI(API[Optional[AnimeMetadata]], ABC):
+    def __init__(self):
+        super().__init__()
+        self._searches: Dict[Tuple, Optional[AnimeMetadata]] = {}  # search results by arguments
+        self._searches_lock = threading.Lock()  # the API instances are shared by the jobs threads
+
     @abstractmethod
     def search_anime(self, keyword: str, lang: Language, season: int, season_name: str) -> Optional[AnimeMetadata]:
         pass
 
+    @abstractmethod
+    async def search_anime_async(
+            self, session: ClientSession, keyword: str, lang: Language, season: int, season_name: str
+    ) -> Optional[AnimeMetadata]:
+        """
+        Same as #search_anime using the given session.
+        """
+        pass
+
     def _best_match(
             self, keyword: str, lang: Language, options: List[APIData], season: int, season_name: str
     ) -> APIData:
@@ -65,12 +110,52 @@ class AnimeAPI(API[Optional[AnimeMetadata]], ABC):
 
     @staticmethod
     def __match_season(name: str, season: int, season_name: str) -> bool:
-        season_re = f's(eason )?{season}'
+        season_re = patterns.season(season)
         if season > 1:
             return season_name in name \
-                   or re.search(season_re, name, re.IGNORECASE) is not None
-        return re.search(season_re, name, re.IGNORECASE) is None  # simple no season check
+                   or season_re.search(name) is not None
+        return season_re.search(name) is None  # simple no season check
 
 
 class Scrapper(Datasource, ABC):
     pass
+
+
+def cached_search(search: Callable) -> Callable:
+    """
+    Caches the results of an #AnimeAPI search by its arguments, so the items of the same media only search once while
+    the API instance lives. Both the sync and async variants share the results. Searches without results are not
+    cached, so they are retried, and only the #_SEARCHES_SIZE most recent results are kept.
+    """
+    if asyncio.iscoroutinefunction(search):
+        @functools.wraps(search)
+        async def search_async(
+                self, session: ClientSession, keyword: str, lang: Language, season: int, season_name: str
+        ):
+            key = (keyword, lang, season, season_name)
+            result = _recall(self, key)
+            return result if result is not None else _remember(self, key, await search(self, session, *key))
+
+        return search_async
+
+    @functools.wraps(search)
+    def search_sync(self, keyword: str, lang: Language, season: int, season_name: str):
+        key = (keyword, lang, season, season_name)
+        result = _recall(self, key)
+        return result if result is not None else _remember(self, key, search(self, *key))
+
+    return search_sync
+
+
+def _recall(api: AnimeAPI, key: Tuple) -> Optional[AnimeMetadata]:
+    with api._searches_lock:
+        return api._searches.get(key)
+
+
+def _remember(api: AnimeAPI, key: Tuple, result: Optional[AnimeMetadata]) -> Optional[AnimeMetadata]:
+    if result is not None:
+        with api._searches_lock:
+            api._searches[key] = result
+            if len(api._searches) > _SEARCHES_SIZE:
+                api._searches.pop(next(iter(api._searches)))  # the oldest one
+    return result
@@ -1,8 +1,11 @@
+import asyncio
 import logging
 from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 
 from src.core.datasources.api import ImdbAPI
@@ -33,14 +36,7 @@ class ImdbScrapper(Scrapper, AnimeDatasource):
     def __init__(self, format_fn: Callable[[MediaItem], str], **kwargs):
         super().__init__(**kwargs)
         self.format_fn = format_fn
-
-    @property
-    def is_valid(self) -> bool:
-        return (
-                self.soup is not None
-                and self.soup.find('div', {'id': 'episodes_content'}) is not None
-                and self.soup.find('div', {'id': 'episodes_content'}).find_all('a', {'itemprop': 'name'})
-        )
+        self.__api = ImdbAPI()
 
     def fill_show_names(self, show: Show) -> Show:
         for season in show.seasons:
@@ -61,6 +57,20 @@ class ImdbScrapper(Scrapper, AnimeDatasource):
 
         return episode
 
+    async def fill_names_async(self, item: MediaItem, session: aiohttp.ClientSession) -> MediaItem:
+        match item:
+            case Show():
+                await asyncio.gather(*[self.fill_names_async(season, session) for season in item.seasons])
+            case Season():
+                page = await self.__load_page_async(item, item.parsed.season, session)
+                self.__fill_episodes(page, item.episodes)
+                self.__fill_season(page, item)
+            case Episode():
+                page = await self.__load_page_async(item, item.parsed.season, session)
+                self.__fill_episodes(page, [item])
+
+        return item
+
     def __retrieve_anime_id(self, item: MediaItem) -> str:
         # try to find IMDB anime ID in the existing metadata
         data = as_anime(item.metadata).datasource_data[ImdbAPI.DATASOURCE]
@@ -68,14 +78,20 @@ class ImdbScrapper(Scrapper, AnimeDatasource):
             return data.id
 
         # use IMDB API to find the IMDB anime ID
+        return self.__api.search_anime(**self.__search_arguments(item)).datasource_data[1].id
+
+    async def __retrieve_anime_id_async(self, item: MediaItem, session: aiohttp.ClientSession) -> str:
+        data = as_anime(item.metadata).datasource_data[ImdbAPI.DATASOURCE]
+        if data is not None:
+            return data.id
+
+        metadata = await self.__api.search_anime_async(session, **self.__search_arguments(item))
+        return metadata.datasource_data[1].id
+
+    def __search_arguments(self, item: MediaItem) -> Dict:
         season = item.parsed.season if not isinstance(item, Show) else 1
         season_name = item.parsed.season_name if not isinstance(item, Show) else None
-        return ImdbAPI().search_anime(
-            keyword=self.format_fn(item),
-            lang=item.language,
-            season=season,
-            season_name=season_name,
-        ).datasource_data[1].id
+        return dict(keyword=self.format_fn(item), lang=item.language, season=season, season_name=season_name)
 
     def __load_page(self, item: MediaItem, season: int) -> BeautifulSoup:
         url = self.BASE_URL.format(
@@ -83,17 +99,37 @@ class ImdbScrapper(Scrapper, AnimeDatasource):
             season=season,
         )
 
-        response = requests.get(url, headers=self.HEADERS)
+        response = self._session.get(url, headers=self.HEADERS)
         logger.info(f'{self._class}:: searching for :: {url}')
 
-        if response.status_code == 200:
-            self.soup = BeautifulSoup(response.content, 'html5lib')
+        return self.__parse_page(item, response.status_code, response.content)
+
+    async def __load_page_async(self, item: MediaItem, season: int, session: aiohttp.ClientSession) -> BeautifulSoup:
+        url = self.BASE_URL.format(
+            anime_id=await self.__retrieve_anime_id_async(item, session),
+            season=season,
+        )
+
+        async with session.get(url, headers=self.HEADERS) as response:
+            logger.info(f'{self._class}:: searching for :: {url}')
+            return self.__parse_page(item, response.status, await response.read())
 
-        if self.is_valid:
-            return self.soup
+    def __parse_page(self, item: MediaItem, status: int, content: bytes) -> BeautifulSoup:
+        # the page is not kept in the instance as the scrapper is shared by the items processed concurrently
+        soup = BeautifulSoup(content, 'html5lib') if status == 200 else None
+        if self.__is_valid(soup):
+            return soup
 
         raise NotFound(f'{self._class}:: matching page for :: {item}')
 
+    @staticmethod
+    def __is_valid(soup: Optional[BeautifulSoup]) -> bool:
+        return (
+                soup is not None
+                and soup.find('div', {'id': 'episodes_content'}) is not None
+                and bool(soup.find('div', {'id': 'episodes_content'}).find_all('a', {'itemprop': 'name'}))
+        )
+
     def __fill_episodes(self, page: BeautifulSoup, episodes: List[Episode]):
         not_found = []
         episode_divs = [i.text for i in page.find_all('a', {'itemprop': 'name'})]
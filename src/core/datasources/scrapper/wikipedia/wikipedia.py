@@ -2,6 +2,7 @@ import asyncio
 import logging
 import re
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 import aiohttp
@@ -43,8 +44,7 @@ class WikipediaScrapper(Scrapper, AnimeDatasource):
         """
 
         page = asyncio.run(self.__load_page(show))
-        self.__fill_episodes(page, [f for s in [s.episodes for s in show.seasons] for f in s])
-        self.__fill_seasons(page, show.seasons)
+        self.__fill_names(page, show)
 
         return show
 
@@ -54,8 +54,7 @@ class WikipediaScrapper(Scrapper, AnimeDatasource):
         """
 
         page = asyncio.run(self.__load_page(season))
-        self.__fill_episodes(page, season.episodes)
-        self.__fill_seasons(page, [season])
+        self.__fill_names(page, season)
 
         return season
 
@@ -65,17 +64,31 @@ class WikipediaScrapper(Scrapper, AnimeDatasource):
         """
 
         page = asyncio.run(self.__load_page(episode))
-        self.__fill_episodes(page, [episode])
+        self.__fill_names(page, episode)
 
         return episode
 
-    async def __load_page(self, item: MediaItem, languages: List[Language] = None) -> WikipediaPage:
+    async def fill_names_async(self, item: MediaItem, session: aiohttp.ClientSession) -> MediaItem:
+        page = await self.__load_page(item, session=session)
+        self.__fill_names(page, item)
+
+        return item
+
+    async def __load_page(
+            self, item: MediaItem, languages: List[Language] = None, session: Optional[aiohttp.ClientSession] = None
+    ) -> WikipediaPage:
+        """
+        :param session: session used to load the pages, if None a new one is opened
+        """
         keywords, pages = self.__get_preconfigured_pages() \
             if runner.wikipedia_url \
             else self.__get_pages(item, languages)
 
-        async with aiohttp.ClientSession() as session:
+        if session is not None:
             pages = await asyncio.gather(*[page.load(session) for page in pages], return_exceptions=True)
+        else:
+            async with aiohttp.ClientSession() as session:
+                pages = await asyncio.gather(*[page.load(session) for page in pages], return_exceptions=True)
 
         try:
             page = next(p for p in pages if p.is_valid)
@@ -84,6 +97,17 @@ class WikipediaScrapper(Scrapper, AnimeDatasource):
         except StopIteration:
             raise NotFound(f'{self._class}:: matching page for :: {keywords}')
 
+    def __fill_names(self, page: WikipediaPage, item: MediaItem):
+        match item:
+            case Show():
+                self.__fill_episodes(page, [f for s in [s.episodes for s in item.seasons] for f in s])
+                self.__fill_seasons(page, item.seasons)
+            case Season():
+                self.__fill_episodes(page, item.episodes)
+                self.__fill_seasons(page, [item])
+            case Episode():
+                self.__fill_episodes(page, [item])
+
     def __fill_episodes(self, page: WikipediaPage, episodes: List[Episode]):
         not_found = []
 
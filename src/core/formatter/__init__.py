@@ -1,7 +1,4 @@
 from src.core.formatter._formatter import Formatter
-from src.core.formatter.anime import AnimeFormatter
-from src.core.formatter.subs import SubsFormatter
-
 
 __all__ = [
     Formatter
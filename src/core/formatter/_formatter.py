@@ -1,3 +1,4 @@
+import importlib
 from abc import ABC
 from abc import abstractmethod
 
@@ -9,6 +10,10 @@ from src.core.types import Object
 
 class Formatter(ABC, Object):
     _registry = {}
+    _modules = {
+        MediaType.ANIME: 'src.core.formatter.anime',
+        MediaType.SUBS: 'src.core.formatter.subs',
+    }
     media_type: MediaType
 
     def __init_subclass__(cls, **kwargs):
@@ -17,6 +22,8 @@ class Formatter(ABC, Object):
         cls._registry[media_type] = cls
 
     def __new__(cls, *args, media_type: MediaType, **kwargs):  # pragma: no cover
+        if media_type not in cls._registry:  # implementations, and their dependencies, are imported on first use
+            importlib.import_module(cls._modules[media_type])
         subclass = cls._registry[media_type]
         final_obj = object.__new__(subclass)
         final_obj.media_type = media_type
@@ -10,6 +10,7 @@ from src.core.models import Show
 from src.core.models.metadata import as_anime
 from src.core.types import Language
 from src.core.types import MediaType
+from src.core.utils import patterns
 from src.core.utils.strings import accepts
 from src.core.utils.strings import clean_output
 from src.core.utils.strings import RomanNumbers
@@ -29,7 +30,7 @@ class AnimeFormatter(Formatter, media_type=MediaType.ANIME):
         exceptions = ['no', 'san', 'and', 'to', 'of', 'the', 'in', 'de'] \
                      + [el.name for el in RomanNumbers] \
                      + (exceptions or [])
-        word_list = re.split(' ', word)
+        word_list = word.split(' ')
         final = [word_list[0].capitalize()]
         for word in word_list[1:]:
             final.append(word if word in exceptions else word.capitalize())
@@ -58,7 +59,7 @@ class AnimeFormatter(Formatter, media_type=MediaType.ANIME):
         media_name = episode = episode_name = episode_part = season = None
         if '{media_name}' in pattern:
             media_name = as_anime(item.metadata).media_name(lang=lang)
-        if re.search(r'\{episode(:\d+d)?}', pattern):
+        if patterns.EPISODE_FIELD.search(pattern):
             episode = item.parsed.episode
         if '{episode_name}' in pattern:
             episode_name = as_anime(item.metadata).episode_name
@@ -86,30 +87,30 @@ class AnimeFormatter(Formatter, media_type=MediaType.ANIME):
         should_remove_season = False
         if not season or not season_name:
             should_remove_season = True
-        elif season <= 1 and re.match(r'^S(eason )?\d+$', season_name, re.IGNORECASE):
+        elif season <= 1 and patterns.NUMBERED_SEASON_NAME.match(season_name):
             # No meaningful season name for season 1
             should_remove_season = True
         elif '{media_name}' in pattern:
             media_name = as_anime(item.metadata).media_name(lang=lang)
-            re_se = f'S(eason )?{season}'
-            if re.search(re_se, media_name, re.IGNORECASE) or re.search(season_name, media_name, re.IGNORECASE):
+            season_re = patterns.season(season)
+            if season_re.search(media_name) or patterns.compiled(season_name, re.IGNORECASE).search(media_name):
                 # Season name is already contained in the media_name
                 should_remove_season = True
 
         if should_remove_season:
-            pattern = whitespaces_clean(re.sub(r'( S(eason)?)? ?{season(_name)?}', '', pattern).strip())
+            pattern = whitespaces_clean(patterns.SEASON_FIELDS.sub('', pattern).strip())
         return pattern
 
     @staticmethod
     def __remove_episode_if_required(item: MediaItem, pattern: str) -> str:
         if isinstance(item, Show) or isinstance(item, Season):
-            pattern = whitespaces_clean(re.sub(r'( E(pisode)?)? ?{episode(_name)?(:\d+d)?}', '', pattern).strip())
+            pattern = whitespaces_clean(patterns.EPISODE_FIELDS.sub('', pattern).strip())
         return pattern
 
     @staticmethod
     def __remove_episode_part_if_required(item: MediaItem, pattern: str) -> str:
         if not isinstance(item, Episode) or item.parsed.episode_part is None:
-            pattern = re.sub(r'\.\{episode_part}', '', pattern).strip()
+            pattern = patterns.EPISODE_PART_FIELD.sub('', pattern).strip()
         return pattern
 
     @staticmethod
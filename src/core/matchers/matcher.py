@@ -1,10 +1,10 @@
 import logging
-import re
 from abc import ABC
 from abc import abstractmethod
 
 from src.core.types import MediaType
 from src.core.types import Object
+from src.core.utils import patterns
 from src.core.utils.strings import apply_clean
 from src.core.utils.strings import generic_clean
 
@@ -31,11 +31,7 @@ class AnimeTypeMatcher(TypeMatcher):
 
     def __full_match(self, name: str) -> bool:
         try:
-            re.search(
-                r'\[(\w+-?)*](\s\w+)*\s(.?\s)?(\d{0,3}|E\w{0,6}.?\d{0,3})\s?\(?\[?(\d{3,4}p|.*)\)?]?',
-                name,
-                re.IGNORECASE
-            ).group(0)
+            patterns.ANIME.search(name).group(0)
 
             logger.debug(f'{self._class}: \'{name}\' matches full regex')
             return True
@@ -44,8 +40,8 @@ class AnimeTypeMatcher(TypeMatcher):
 
     def __partial_match(self, name: str) -> bool:
         try:
-            re.search(r'(^\[(\w+(\s?|-|.?))+])', name, re.IGNORECASE).group(0)
-            re.search(r'-(.?)\d{1,3}|(x|E(pisode)?)(\s|\.|-)?\d{1,3}', name, re.IGNORECASE).group(0)
+            patterns.ANIME_TRACKER.search(name).group(0)
+            patterns.ANIME_EPISODE.search(name).group(0)
 
             logger.debug(f'{self._class}: \'{name}\' matches partial regex')
             return True
@@ -65,12 +61,7 @@ class FilmTypeMatcher(TypeMatcher):
 
     def __matches(self, name: str) -> bool:
         try:
-            # (?:19|20|21)\d{2}(?!p): matches a year between 1900 and 2199 and avoid matching the quality XXXXp
-            re.search(
-                r'(.*)(?:19|20|21)\d{2}(?!p)',
-                name,
-                re.IGNORECASE
-            ).group(0)
+            patterns.FILM.search(name).group(0)
 
             logger.debug(f'{self._class}: \'{name}\' matches')
             return True
@@ -4,7 +4,8 @@ from src.core.models.models import ParsedInfo
 from src.core.models.models import Season
 from src.core.models.models import Show
 from src.core.models.models import SubsFile
+from src.core.models.models import VirtualSeason
 
 __all__ = [
-    MediaItem, Episode, Season, Show, SubsFile, ParsedInfo,
+    MediaItem, Episode, Season, Show, SubsFile, ParsedInfo, VirtualSeason,
 ]
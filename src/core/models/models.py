@@ -9,13 +9,12 @@ from typing import List
 from typing import Optional
 from typing import TypeVar
 
-from polyglot.text import Text
-
 from src import settings
 from src.core.models.metadata import Metadata
 from src.core.types import Language
 from src.core.types import MediaType
 from src.core.types import Object
+from src.core.utils.language import LanguageDetector
 from src.core.utils.strings import generic_clean
 from src.core.utils.strings import remove_brackets
 from src.core.utils.strings import retrieve_extension
@@ -48,33 +47,16 @@ class ParsedInfo:
         parser = parser if parser is not None else Parser(media_type=item.media_type)
         assert isinstance(parser, Parser)
 
-        media_title = parser.media_title(item)
-        episode = episode_part = season = season_name = extension = None
         match item:
-            case Episode() | SubsFile():
-                episode = parser.episode(item)
-                episode_part = parser.episode_part(item)
-                season = parser.season(item)
-                season_name = parser.season_name(item)
-                extension = parser.extension(item)
             case Season():
                 assert isinstance(item, Season)
-                [cls.parse(e, parser=parser) for e in item.episodes]
-
-                season = parser.season(item)
-                season_name = parser.season_name(item)
+                for episode, parsed in zip(item.episodes, parser.parse_many(item.episodes)):
+                    episode.parsed = parsed
             case Show():
                 assert isinstance(item, Show)
                 [cls.parse(s, parser=parser) for s in item.seasons]
 
-        item.parsed = ParsedInfo(
-            episode=episode,
-            episode_part=episode_part,
-            season=season,
-            season_name=season_name,
-            media_title=media_title,
-            extension=extension,
-        )
+        item.parsed = parser.parsed_info(item)
         return item
 
 
@@ -233,6 +215,41 @@ class Season(MediaItem):
         OutputLog().update(id(self), self.path)
 
 
+@dataclass
+class VirtualSeason(Season):
+    """
+    Season grouping loose episodes of the same media found in a folder that is not a season itself, so they are looked
+    up together. Only the episodes are renamed.
+    """
+
+    @classmethod
+    def from_episodes(cls, directory: Directory, episodes: List[Episode]) -> 'VirtualSeason':
+        """
+        :param episodes: parsed episodes sharing media type, language, media title and season.
+        """
+        obj = object.__new__(cls)
+        obj.base_path = directory.base_path
+        obj.item_name = directory.name
+        obj.show = None
+        obj.episodes = episodes
+        obj.media_type = episodes[0].media_type
+        obj.language = episodes[0].language
+        obj.parsed = ParsedInfo(
+            episode=None,
+            episode_part=None,
+            season=episodes[0].parsed.season,
+            season_name=episodes[0].parsed.season_name,
+            media_title=episodes[0].parsed.media_title,
+            extension=None,
+        )
+        for episode in episodes:
+            episode.season = obj
+        return obj
+
+    def rename(self, new_name):
+        pass  # the folder belongs to other items
+
+
 @dataclass
 class Show(MediaItem):
     seasons: List[Season] = field(default_factory=list)
@@ -343,7 +360,7 @@ class SubsFile(MediaItem):
 
             events = text.split('[Events]')[1].split('\n')
             events = [remove_brackets(e.split(',')[-1]).strip() for e in events if ',' in e]
-            languages = [Text(e).language.code for e in events]
+            languages = LanguageDetector().detect_many(events)
             language = max(languages, key=languages.count)
 
             if language and language.upper() in Language.__members__.values():
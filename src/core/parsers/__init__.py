@@ -1,5 +1,4 @@
 from src.core.parsers._parser import Parser
-from src.core.parsers.anime import AnimeParser
 
 __all__ = [
     Parser
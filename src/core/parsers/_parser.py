@@ -1,8 +1,14 @@
+import importlib
 from abc import ABC
 from abc import abstractmethod
+from typing import List
 from typing import Optional
 
+from src.core.models import Episode
 from src.core.models import MediaItem
+from src.core.models import ParsedInfo
+from src.core.models import Season
+from src.core.models import SubsFile
 from src.core.types import MediaType
 from src.core.types import Object
 from src.core.utils.strings import generic_clean
@@ -11,6 +17,9 @@ from src.core.utils.strings import retrieve_extension
 
 class Parser(ABC, Object):
     _registry = {}
+    _modules = {
+        MediaType.ANIME: 'src.core.parsers.anime',
+    }
     media_type: MediaType
 
     def __init_subclass__(cls, **kwargs):
@@ -19,11 +28,47 @@ class Parser(ABC, Object):
         cls._registry[media_type] = cls
 
     def __new__(cls, *args, media_type: MediaType, **kwargs):  # pragma: no cover
+        if media_type not in cls._registry:  # implementations, and their dependencies, are imported on first use
+            importlib.import_module(cls._modules[media_type])
         subclass = cls._registry[media_type]
         final_obj = object.__new__(subclass)
         final_obj.media_type = media_type
         return final_obj
 
+    def parsed_info(self, item: MediaItem) -> ParsedInfo:
+        """
+        :return: all the data found in the name of the item, without its childs
+        """
+        media_title = self.media_title(item)
+        episode = episode_part = season = season_name = extension = None
+        match item:
+            case Episode() | SubsFile():
+                episode = self.episode(item)
+                episode_part = self.episode_part(item)
+                season = self.season(item)
+                season_name = self.season_name(item)
+                extension = self.extension(item)
+            case Season():
+                season = self.season(item)
+                season_name = self.season_name(item)
+
+        return ParsedInfo(
+            episode=episode,
+            episode_part=episode_part,
+            season=season,
+            season_name=season_name,
+            media_title=media_title,
+            extension=extension,
+        )
+
+    def parse_many(self, items: List[MediaItem]) -> List[ParsedInfo]:
+        """
+        Parses the names of many items at once, like the episodes of a season, allowing the implementations to share the
+        work between similar names.
+        :return: the #parsed_info of each item, in the same order
+        """
+        return [self.parsed_info(i) for i in items]
+
     @abstractmethod
     def episode(self, item: MediaItem) -> int:
         pass
@@ -1,14 +1,18 @@
 import logging
-import re
+from typing import Dict
+from typing import List
 from typing import Optional
 
 from src.core.models import Episode
 from src.core.models import MediaItem
+from src.core.models import ParsedInfo
 from src.core.models import Season
 from src.core.models import Show
 from src.core.models import SubsFile
 from src.core.parsers._parser import Parser
+from src.core.parsers.lexer import ReleaseName
 from src.core.types import MediaType
+from src.core.utils import patterns
 from src.core.utils.strings import accepts
 from src.core.utils.strings import apply
 from src.core.utils.strings import apply_clean
@@ -27,22 +31,65 @@ logger = logging.getLogger()
 
 class AnimeParser(Parser, media_type=MediaType.ANIME):
     _instance = None
+    __TITLE_CLEAN_FUNCTIONS = [generic_clean, remove_tracker, remove_parenthesis, remove_extension]
+    __TITLE_FUNCTIONS = [remove_episode_name, remove_season, remove_episode, remove_trailing_hyphen]
 
     def __new__(cls, *args, **kwargs):  # pragma: no cover
         if cls._instance is None:
             cls._instance = super().__new__(cls, *args, media_type=MediaType.ANIME, **kwargs)
         return cls._instance
 
+    def parsed_info(self, item: MediaItem) -> ParsedInfo:
+        """
+        Same as parsing each field on its own, but the name is only scanned and cleaned once. Names where removing a tag
+        makes a new one are parsed field by field.
+        """
+        return self.__parsed_info(item, ReleaseName(item.item_name))
+
+    def parse_many(self, items: List[MediaItem]) -> List[ParsedInfo]:
+        """
+        Names only differing in their numbers, like '[Judas] Show - S01E01 [1080p].mkv' and the rest of the episodes of
+        its season, are only scanned once.
+        """
+        scans: Dict = {}
+        return [self.__parsed_info(i, ReleaseName(i.item_name, scans=scans)) for i in items]
+
+    def __parsed_info(self, item: MediaItem, name: ReleaseName) -> ParsedInfo:
+        if not name.is_stable:
+            return super().parsed_info(item)
+
+        episode = episode_part = season = season_name = extension = None
+        if isinstance(item, (Episode, SubsFile)):
+            episode = self._parse_episode.__wrapped__(name.untagged)
+            episode_part = self._parse_episode_part(item.item_name, episode)
+            extension = name.extension
+        if isinstance(item, (Episode, SubsFile, Season)):
+            season = self._parse_season.__wrapped__(name.unbracketed)
+            is_clean = generic_clean(name.unbracketed) == name.unbracketed  # cleaning it again changes nothing
+            season_name = self._parse_season_name.__wrapped__(self, name.unbracketed, season if is_clean else None)
+
+        if season_name is not None:  # removed from the name before cleaning it, nothing to reuse
+            media_title = item.item_name.replace(season_name, '')
+            media_title = apply(self.__TITLE_CLEAN_FUNCTIONS + self.__TITLE_FUNCTIONS, media_title)
+        else:
+            media_title = apply(self.__TITLE_FUNCTIONS, name.untagged)
+
+        return ParsedInfo(
+            episode=episode,
+            episode_part=episode_part,
+            season=season,
+            season_name=season_name,
+            media_title=media_title,
+            extension=extension,
+        )
+
     @accepts((SubsFile, Episode))
     def episode(self, item: MediaItem) -> int:
         return self._parse_episode(item.item_name)
 
     @accepts((SubsFile, Episode))
     def episode_part(self, item: MediaItem) -> Optional[int]:
-        episode = self.episode(item)
-        match = re.search(rf'{episode}\.\d+', item.item_name)
-        if match is not None:
-            return int(match.group(0).split('.')[1])
+        return self._parse_episode_part(item.item_name, self.episode(item))
 
     @accepts((SubsFile, Episode), bool)
     def episode_name(self, item: MediaItem, use_metadata: bool = True) -> Optional[str]:
@@ -66,55 +113,55 @@ class AnimeParser(Parser, media_type=MediaType.ANIME):
             if season_name is not None:
                 media_title = media_title.replace(season_name, '')
 
-        return apply(
-            functions=[
-                generic_clean, remove_tracker, remove_parenthesis,
-                remove_extension, remove_episode_name, remove_season, remove_episode,
-                remove_trailing_hyphen,
-            ],
-            arg=media_title
-        )
+        return apply(functions=self.__TITLE_CLEAN_FUNCTIONS + self.__TITLE_FUNCTIONS, arg=media_title)
 
     @staticmethod
     @apply_clean(clean_functions=[generic_clean, remove_tracker, remove_parenthesis, remove_extension])
     def _parse_episode(word: str) -> int:
-        match = re.search(r'S\d+E\d+', word, re.IGNORECASE)
+        match = patterns.SEASON_EPISODE.search(word)
         if match is not None:
             # Matches S1E1
-            return int(re.findall(r'\d+', match.group(0))[1])
+            return int(patterns.NUMBER.findall(match.group(0))[1])
 
-        match = re.search(r'E\d+', word, re.IGNORECASE)
+        match = patterns.EPISODE_NUMBER.search(word)
         if match is not None:
             # Matches E1 -
-            return int(re.findall(r'\d+', match.group(0))[0])
+            return int(patterns.NUMBER.findall(match.group(0))[0])
         # Returns first number found
-        return int(re.findall(r'\d+', word)[-1])
+        return int(patterns.NUMBER.findall(word)[-1])
+
+    @staticmethod
+    def _parse_episode_part(word: str, episode: int) -> Optional[int]:
+        if f'{episode}.' not in word:  # skips looking up the pattern of each episode number
+            return None
+        match = patterns.episode_part(episode).search(word)
+        if match is not None:
+            return int(match.group(0).split('.')[1])
 
     @staticmethod
     @apply_clean(clean_functions=[generic_clean, remove_tracker, remove_extension])
     def _parse_season(word: str) -> int:
-        match = re.search(r'Season \d+', word, re.IGNORECASE)
+        match = patterns.SEASON_NUMBER.search(word)
         if match is not None:
             # Matches Season 1
-            s_re = re.compile(r'season ', re.IGNORECASE)
-            return int(s_re.sub('', match.group(0)))
+            return int(patterns.SEASON_WORD.sub('', match.group(0)))
 
-        match = re.search(r'S\d+E\d+', word, re.IGNORECASE)
+        match = patterns.SEASON_EPISODE.search(word)
         if match is not None:
             # Matches S1E1
-            return int(re.findall(r'\d+', match.group(0))[0])
+            return int(patterns.NUMBER.findall(match.group(0))[0])
 
-        match = re.search(r'S\d+ -', word, re.IGNORECASE)
+        match = patterns.SEASON_SEPARATOR.search(word)
         if match is not None:
             # Matches S1 -
-            return int(re.findall(r'\d+', match.group(0))[0])
+            return int(patterns.NUMBER.findall(match.group(0))[0])
 
-        match = re.search(r'S\d+$', word, re.IGNORECASE)
+        match = patterns.TRAILING_SEASON.search(word)
         if match is not None:
             # Matches S1
-            return int(re.findall(r'\d+', match.group(0))[0])
+            return int(patterns.NUMBER.findall(match.group(0))[0])
 
-        match = re.search(r' (IX|IV|V?I{0,3})( |$)', word)
+        match = patterns.ROMAN_NUMBER.search(word)
         if match is not None:
             # Matches roman numbers
             return RomanNumbers[match.group(0).strip()].value
@@ -122,13 +169,16 @@ class AnimeParser(Parser, media_type=MediaType.ANIME):
         return 1
 
     @apply_clean(clean_functions=[generic_clean, remove_tracker, remove_extension])
-    def _parse_season_name(self, word: str) -> Optional[str]:
-        match = re.search(r' (IX|IV|V?I{0,3})( |$)', word)
+    def _parse_season_name(self, word: str, season: Optional[int] = None) -> Optional[str]:
+        """
+        :param season: season already parsed from the clean #word
+        """
+        match = patterns.ROMAN_NUMBER.search(word)
         if match is not None:
             # Matches roman numbers
             return match.group(0).strip()
         # TODO: Try to parse a season name from the file name
 
-        season = self._parse_season(word)
+        season = season if season is not None else self._parse_season(word)
         if season > 1:
             return f'S{season}'
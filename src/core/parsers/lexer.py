@@ -0,0 +1,170 @@
+import re
+from enum import Enum
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from src.core.types import Object
+from src.core.utils import patterns
+from src.core.utils.strings import generic_clean
+
+
+class TokenType(Enum):
+    GROUP = 'group'  # [Judas]
+    CRC = 'crc'  # [1B2526A8]
+    QUALITY = 'quality'  # [1080p], (Dual Audio 10bit 1080p x265)
+    TAG = 'tag'  # [Multi-Subs]
+    PARENTHESIS = 'parenthesis'  # (The Rising of the Shield Hero)
+    SEASON = 'season'  # Season 2, S2
+    EPISODE = 'episode'  # E01
+    PART = 'part'  # E12.5
+    NUMBER = 'number'
+    EXTENSION = 'extension'  # .mkv
+    SEPARATOR = 'separator'  # -
+    SPACE = 'space'
+    WORD = 'word'
+    OTHER = 'other'
+
+
+class Token(NamedTuple):
+    type: TokenType
+    text: str
+
+
+# Tags, parenthesis and extensions match exactly what 'remove_tracker', 'remove_parenthesis' and 'remove_extension'
+# remove, so joining the other tokens gives the same text as running them.
+_TAG = patterns.TRACKER.pattern
+_PARENTHESIS = patterns.PARENTHESIS.pattern
+_EXTENSION = patterns.EXTENSION.pattern
+_TOKENS = re.compile(
+    rf'(?P<tag>{_TAG})'
+    rf'|(?P<parenthesis>{_PARENTHESIS})'
+    r'|(?P<part>e?\d+\.\d{1,2}(?!\w))'  # shorter than an extension
+    rf'|(?P<extension>{_EXTENSION})'
+    r'|(?P<season>season \d+|s\d+)'
+    r'|(?P<episode>e\d+)'
+    r'|(?P<number>\d+)'
+    r'|(?P<separator>-)'
+    r'|(?P<space>\s+)'
+    r'|(?P<word>[^\W\d_]+)'
+    r'|(?P<other>.)',
+    re.IGNORECASE,
+)
+_TAGS_AND_EXTENSIONS = re.compile(rf'{_TAG}|{_EXTENSION}')
+_REMOVABLE = re.compile(rf'{_TAG}|{_PARENTHESIS}|{_EXTENSION}')
+_TOKEN_TYPES = {t.value: t for t in TokenType}
+_CRC = re.compile(r'[0-9A-F]{8}', re.IGNORECASE)
+_QUALITY = re.compile(r'\b(\d{3,4}p|\d+bit|x26[45]|hevc|avc|bd|web(-?dl|rip)?|dual audio)\b', re.IGNORECASE)
+_DIGITS = str.maketrans('123456789', '000000000')  # names with the same shape scan alike
+
+
+class _Scan(NamedTuple):
+    """
+    Token spans of a name, the same for all the names only differing in their digits as the token patterns treat every
+    digit alike.
+    """
+    tokens: List[Tuple[str, int, int]]  # kind, start and end of each token
+    untagged: List[List[int]]  # spans of the text without tags, parenthesis or extensions, the contiguous ones merged
+    unbracketed: List[List[int]]  # spans of the text without tags or extensions, the contiguous ones merged
+    is_stable: bool
+
+
+class ReleaseName(Object):
+    """
+    Release name scanned once into typed tokens, giving the cleaned texts the parsers work on without cleaning the name
+    once per field.
+    """
+
+    def __init__(self, name: str, scans: Optional[Dict[str, _Scan]] = None):
+        """
+        :param scans: scans of the previous names by their shape, shared by similar names (like the episodes of a
+            season) to only scan the names differing in more than their numbers
+        """
+        self.name = generic_clean(name)
+        if scans is not None:
+            shape = self.name.translate(_DIGITS)
+            scan = scans.get(shape)
+            if scan is None:
+                scan = scans[shape] = self.__tokenize(self.name)
+        else:
+            scan = self.__tokenize(self.name)
+
+        self.__scan = scan
+        self.__tokens: Optional[List[Token]] = None
+        self.untagged = self.__text(scan.untagged)  # without tags, parenthesis or extensions
+        self.unbracketed = self.__text(scan.unbracketed)  # without tags or extensions, keeping the parenthesis
+
+    def __str__(self):  # pragma: no cover
+        return self.name
+
+    @property
+    def tokens(self) -> List[Token]:
+        if self.__tokens is None:
+            self.__tokens = [
+                Token(self.__token_type(kind, self.name[start:end], first=index == 0), self.name[start:end])
+                for index, (kind, start, end) in enumerate(self.__scan.tokens)
+            ]
+        return self.__tokens
+
+    @property
+    def is_stable(self) -> bool:
+        """
+        Removing a tag can join the text around it into a new one, or make a short extension before it longer, which
+        the cleaning functions would remove as they run one after the other. The cleaned texts are only valid if that
+        can't happen.
+        """
+        return self.__scan.is_stable
+
+    @property
+    def extension(self) -> Optional[str]:
+        tokens = self.__scan.tokens
+        return self.name[tokens[-1][1] + 1:tokens[-1][2]] if tokens and tokens[-1][0] == 'extension' else None
+
+    def __text(self, spans: List[List[int]]) -> str:
+        return ''.join([self.name[start:end] for start, end in spans]).strip()
+
+    @staticmethod
+    def __tokenize(name: str) -> _Scan:
+        tokens, untagged, unbracketed = [], [], []
+        extends_extension = False
+        for match in _TOKENS.finditer(name):
+            kind, (start, end) = match.lastgroup, match.span()
+            if kind == 'tag' or kind == 'parenthesis':
+                if kind == 'parenthesis':
+                    _extend(unbracketed, start, end)
+                if tokens and tokens[-1][0] == 'extension' and tokens[-1][2] - tokens[-1][1] < 5:
+                    extends_extension = True
+            elif kind != 'extension':
+                _extend(untagged, start, end)
+                _extend(unbracketed, start, end)
+            tokens.append((kind, start, end))
+
+        untagged_text = ''.join([name[start:end] for start, end in untagged]).strip()
+        unbracketed_text = ''.join([name[start:end] for start, end in unbracketed]).strip()
+        is_stable = not extends_extension \
+            and _REMOVABLE.search(untagged_text) is None and _TAGS_AND_EXTENSIONS.search(unbracketed_text) is None
+        return _Scan(tokens, untagged, unbracketed, is_stable)
+
+    @staticmethod
+    def __token_type(kind: str, text: str, first: bool) -> TokenType:
+        match kind:
+            case 'tag':
+                inner = text[1:-1]
+                if _CRC.fullmatch(inner):
+                    return TokenType.CRC
+                if _QUALITY.search(inner):
+                    return TokenType.QUALITY
+                return TokenType.GROUP if first else TokenType.TAG
+            case 'parenthesis':
+                return TokenType.QUALITY if _QUALITY.search(text) else TokenType.PARENTHESIS
+            case _:
+                return _TOKEN_TYPES[kind]
+
+
+def _extend(spans: List[List[int]], start: int, end: int):
+    if spans and spans[-1][1] == start:
+        spans[-1][1] = end
+    else:
+        spans.append([start, end])
@@ -45,6 +45,11 @@ class SubtitleAction(Enum):
     MERGE = 1
 
 
+class SymlinkPolicy(Enum):
+    FOLLOW = 0
+    SKIP = 1
+
+
 class Object:
     @property
     def _class(self) -> str:
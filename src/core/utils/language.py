@@ -0,0 +1,80 @@
+import logging
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+UNKNOWN = 'un'
+
+
+class LanguageDetector(Object):
+    """
+    Detects the language code ('en', 'ja', ...) of texts. Results are cached by normalized text, so the episodes of a
+    show (differing only in numbers) or repeated subtitle lines are only detected once.
+
+    Texts written in kana are Japanese without running the full detector. Kanji alone are shared with Chinese and Latin
+    letters with most languages (romaji included), so those are left to the detector.
+    """
+    _instance = None
+
+    __NON_LETTERS = re.compile(r'[\W\d_]+')
+
+    def __new__(cls, *args, **kwargs):  # pragma: no cover
+        if cls._instance is None:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def detect(self, text: str) -> str:
+        """
+        :return: the detected language code or 'un' if unknown
+        """
+        return self.__detect(self.normalize(text))
+
+    def detect_many(self, texts: List[str]) -> List[str]:
+        """
+        Detects the language of all the texts, running the detector once per distinct normalized text.
+        :return: the detected language codes in the same order as the texts
+        """
+        keys = [self.normalize(t) for t in texts]
+        languages: Dict[str, str] = {k: self.__detect(k) for k in dict.fromkeys(keys)}
+        return [languages[k] for k in keys]
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        """
+        :return: the lowercase words of the text, without numbers or punctuation
+        """
+        return ' '.join(cls.__NON_LETTERS.split(unicodedata.normalize('NFKC', text).casefold())).strip()
+
+    @staticmethod
+    def script(text: str) -> Optional[str]:
+        """
+        :return: 'ja' when the text contains kana, None when no fast answer is possible
+        """
+        for char in text:
+            if '぀' <= char <= 'ヿ' or 'ㇰ' <= char <= 'ㇿ' or 'ｦ' <= char <= 'ﾟ':
+                return 'ja'
+        return None
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def __detect(cls, key: str) -> str:
+        if not key:
+            return UNKNOWN
+
+        language = cls.script(key)
+        if language is not None:
+            return language
+
+        from polyglot.detect import Detector  # imported on the first miss, loading its models is slow
+        return Detector(key, quiet=True).language.code
+
+    @classmethod
+    def cache_clear(cls):  # pragma: no cover
+        cls.__detect.cache_clear()
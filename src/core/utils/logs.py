@@ -0,0 +1,44 @@
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger()
+
+
+class GroupedLogs(logging.Filter):
+    """
+    Holds back the records logged by a thread inside a #group block and emits them together once the block ends, so
+    the logs of items processed concurrently are not interleaved.
+    """
+    _instance = None
+    __emit_lock = threading.Lock()
+    __local = threading.local()
+
+    def __new__(cls, *args, **kwargs):  # pragma: no cover
+        if cls._instance is None:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+            logger.addFilter(cls._instance)
+        return cls._instance
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = getattr(self.__local, 'buffer', None)
+        if buffer is None:
+            return True
+
+        buffer.append(record)
+        return False
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        if getattr(self.__local, 'buffer', None) is not None:  # nested groups are part of the outer one
+            yield
+            return
+
+        self.__local.buffer = []
+        try:
+            yield
+        finally:
+            records, self.__local.buffer = self.__local.buffer, None
+            with self.__emit_lock:
+                [logger.handle(r) for r in records]
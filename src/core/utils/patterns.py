@@ -0,0 +1,76 @@
+"""
+Compiled regular expressions of the parsers, matchers, formatters and string utilities.
+
+Patterns built from runtime values (season numbers, episode numbers, titles...) are compiled through #compiled, which
+keeps the most recently used ones instead of sharing the small internal cache of the 're' module with every other
+pattern.
+"""
+import re
+from functools import lru_cache
+
+########################
+#       Strings        #
+########################
+
+WHITESPACES = re.compile(r' +')
+TRACKER = re.compile(r'\[[\w\d\-_−–#: !+]*]')
+PARENTHESIS = re.compile(r'\([\w\d\-_−–#: !+]*\)')
+BRACKETS = re.compile(r'\{[\w\d\-_−–#: !+]*}')
+EPISODE = re.compile(r'( - )?e(pisode )?\d+| - \d+', re.IGNORECASE)
+EPISODE_NAME = re.compile(r'\d+([\s-]+[\w\s]*)', re.IGNORECASE)
+SEASON = re.compile(r's(eason )?\d+', re.IGNORECASE)
+EXTENSION = re.compile(r'\.[\w\d]{3,4}')
+TRAILING_EXTENSION = re.compile(r'\.[\w\d]{3,4}$', re.IGNORECASE)
+TRAILING_HYPHEN = re.compile(r'- ?$')
+
+########################
+#       Parsers        #
+########################
+
+NUMBER = re.compile(r'\d+')
+SEASON_EPISODE = re.compile(r'S\d+E\d+', re.IGNORECASE)  # S1E1
+EPISODE_NUMBER = re.compile(r'E\d+', re.IGNORECASE)  # E1
+SEASON_NUMBER = re.compile(r'Season \d+', re.IGNORECASE)  # Season 1
+SEASON_WORD = re.compile(r'season ', re.IGNORECASE)
+SEASON_SEPARATOR = re.compile(r'S\d+ -', re.IGNORECASE)  # S1 -
+TRAILING_SEASON = re.compile(r'S\d+$', re.IGNORECASE)  # S1
+ROMAN_NUMBER = re.compile(r' (IX|IV|V?I{0,3})( |$)')
+
+########################
+#       Matchers       #
+########################
+
+ANIME = re.compile(r'\[(\w+-?)*](\s\w+)*\s(.?\s)?(\d{0,3}|E\w{0,6}.?\d{0,3})\s?\(?\[?(\d{3,4}p|.*)\)?]?', re.IGNORECASE)
+ANIME_TRACKER = re.compile(r'(^\[(\w+(\s?|-|.?))+])', re.IGNORECASE)
+ANIME_EPISODE = re.compile(r'-(.?)\d{1,3}|(x|E(pisode)?)(\s|\.|-)?\d{1,3}', re.IGNORECASE)
+# (?:19|20|21)\d{2}(?!p): matches a year between 1900 and 2199 and avoid matching the quality XXXXp
+FILM = re.compile(r'(.*)(?:19|20|21)\d{2}(?!p)', re.IGNORECASE)
+
+########################
+#      Formatters      #
+########################
+
+EPISODE_FIELD = re.compile(r'\{episode(:\d+d)?}')
+EPISODE_FIELDS = re.compile(r'( E(pisode)?)? ?{episode(_name)?(:\d+d)?}')
+EPISODE_PART_FIELD = re.compile(r'\.\{episode_part}')
+SEASON_FIELDS = re.compile(r'( S(eason)?)? ?{season(_name)?}')
+NUMBERED_SEASON_NAME = re.compile(r'^S(eason )?\d+$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def compiled(pattern: str, flags: int = 0) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+def season(number: int) -> re.Pattern:
+    """
+    :return: pattern matching 'S2' or 'Season 2' for the season #number
+    """
+    return compiled(rf's(eason )?{number}', re.IGNORECASE)
+
+
+def episode_part(episode: int) -> re.Pattern:
+    """
+    :return: pattern matching '12.5' for the #episode 12
+    """
+    return compiled(rf'{episode}\.\d+')
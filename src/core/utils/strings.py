@@ -1,9 +1,15 @@
-import re
 from collections.abc import Iterable
 from enum import Enum
+from functools import lru_cache
+from functools import wraps
 from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+
+from src.core.types import Object
+from src.core.utils import patterns
 
 
 class RomanNumbers(Enum):
@@ -19,7 +25,7 @@ class RomanNumbers(Enum):
 
 
 def whitespaces_clean(word: str) -> str:
-    return re.sub(r' +', ' ', word).strip()
+    return patterns.WHITESPACES.sub(' ', word).strip()
 
 
 def generic_clean(word: str) -> str:
@@ -30,42 +36,42 @@ def generic_clean(word: str) -> str:
 
 
 def remove_tracker(word: str) -> str:
-    return re.sub(r'\[[\w\d\-_−–#: !+]*]', '', word).strip()
+    return patterns.TRACKER.sub('', word).strip()
 
 
 def remove_parenthesis(word: str) -> str:
-    return re.sub(r'\([\w\d\-_−–#: !+]*\)', '', word).strip()
+    return patterns.PARENTHESIS.sub('', word).strip()
 
 
 def remove_brackets(word: str) -> str:
-    return re.sub(r'\{[\w\d\-_−–#: !+]*}', '', word).strip()
+    return patterns.BRACKETS.sub('', word).strip()
 
 
 def remove_episode(word: str) -> str:
-    match = re.search(r'( - )?e(pisode )?\d+| - \d+', word, re.IGNORECASE)
+    match = patterns.EPISODE.search(word)
     return word.replace(match.group(0), '').strip() if match is not None else word
 
 
 def remove_episode_name(word: str) -> str:
-    match = re.search(r'\d+([\s-]+[\w\s]*)', word, re.IGNORECASE)
+    match = patterns.EPISODE_NAME.search(word)
     return word.split(match.group(1))[0].strip() if match is not None else word
 
 
 def remove_season(word: str) -> str:
-    match = re.search(r's(eason )?\d+', word, re.IGNORECASE)
+    match = patterns.SEASON.search(word)
     return word.replace(match.group(0), '').strip() if match is not None else word
 
 
 def remove_extension(word: str) -> str:
-    return re.sub(r'\.[\w\d]{3,4}', '', word).strip()
+    return patterns.EXTENSION.sub('', word).strip()
 
 
 def remove_trailing_hyphen(word: str) -> str:
-    return re.sub(r'- ?$', '', word).strip()
+    return patterns.TRAILING_HYPHEN.sub('', word).strip()
 
 
 def retrieve_extension(word: str) -> Optional[str]:
-    match = re.search(r'\.[\w\d]{3,4}$', word, re.IGNORECASE)
+    match = patterns.TRAILING_EXTENSION.search(word)
     if match is not None:
         return match.group(0)[1:]
 
@@ -116,7 +122,53 @@ def closest_result(keyword: str, elements: List[str]) -> str:
     return best_word
 
 
+class CleanCache(Object):
+    """
+    Opt-in LRU of the cleaned texts by (cleaning functions, text), shared by every #apply and #apply_clean pipeline, as
+    the matchers, the parsers and the tree similarity clean the same names with the same functions. Disabled until
+    #enable is called.
+    """
+    _instance = None
+    _lookup: Optional[Callable[[Tuple[Callable[[str], str], ...], str], str]] = None
+
+    def __new__(cls, *args, **kwargs):  # pragma: no cover
+        if cls._instance is None:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    @property
+    def maxsize(self) -> int:
+        return self._lookup.cache_info().maxsize if self._lookup is not None else 0
+
+    def enable(self, maxsize: int = 8192):
+        self._lookup = lru_cache(maxsize=maxsize)(_clean) if maxsize > 0 else None
+
+    def disable(self):
+        self._lookup = None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: hits, misses and size of the cache
+        """
+        if self._lookup is None:
+            return {'hits': 0, 'misses': 0, 'size': 0}
+        info = self._lookup.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
+
+    def clean(self, functions: Tuple[Callable[[str], str], ...], word: str) -> str:
+        return self._lookup(functions, word) if self._lookup is not None else _clean(functions, word)
+
+
+def _clean(functions: Tuple[Callable[[str], str], ...], word: str) -> str:
+    for f in functions:
+        word = f(word)
+    return word
+
+
 def apply(functions: Iterable[Callable[[str], str]], arg: Iterable[str] | str):
+    if CleanCache()._lookup is not None:  # the uncached calls skip building a pipeline
+        return _pipeline(tuple(functions))(arg)
+
     if type(arg) == str:
         for f in functions:
             arg = f(arg)
@@ -126,13 +178,32 @@ def apply(functions: Iterable[Callable[[str], str]], arg: Iterable[str] | str):
     return arg
 
 
+def _pipeline(functions: Tuple[Callable[[str], str], ...]) -> Callable:
+    """
+    :return: function cleaning a text, or each text of an iterable, with all the #functions
+    """
+    cache = CleanCache()
+
+    def pipeline(arg):
+        if type(arg) == str:
+            return cache.clean(functions, arg)
+        if isinstance(arg, Iterable):
+            return [pipeline(a) for a in arg]
+        return arg
+
+    return pipeline
+
+
 # decorator
 def apply_clean(clean_functions: Iterable[Callable[[str], str]]):
+    pipeline = _pipeline(tuple(clean_functions))  # built once for all the calls
+
     def decorator(func):
+        @wraps(func)  # '__wrapped__' skips the cleaning for already clean args
         def wrapper(*args, **kwargs):
-            args = [apply(clean_functions, arg) for arg in args]
-            kwargs = {key: apply(clean_functions, value) for key, value in kwargs.items()}
-            return func(*args, **kwargs)
+            if kwargs:
+                return func(*map(pipeline, args), **{key: pipeline(value) for key, value in kwargs.items()})
+            return func(*map(pipeline, args))
 
         return wrapper
 
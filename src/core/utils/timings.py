@@ -0,0 +1,75 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+
+class Timings(Object):
+    """
+    Wall time spent in each stage of a run (tree listing, classification, lookups, renames...). Cheap enough to be
+    always on: recording a stage is two clock reads and an append.
+
+    Stages are recorded with #stage, used as a context manager or as a decorator of sync functions.
+    """
+    _instance = None
+    _samples: Dict[str, List[float]]  # seconds by stage
+    __lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):  # pragma: no cover
+        if cls._instance is None:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+            cls._instance._samples = {}
+        return cls._instance
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.__lock:
+                self._samples.setdefault(name, []).append(elapsed)
+
+    def reset(self):
+        with self.__lock:
+            self._samples = {}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        :return: count, total, p50, p95 and max seconds by stage
+        """
+        with self.__lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+
+        return {
+            name: {
+                'count': len(values),
+                'total': round(sum(values), 6),
+                'p50': round(self.__percentile(values, 50), 6),
+                'p95': round(self.__percentile(values, 95), 6),
+                'max': round(values[-1], 6),
+            } for name, values in sorted(samples.items())
+        }
+
+    def dump(self, file_name: str):
+        with open(file_name, 'w') as file:
+            json.dump(self.summary(), file, indent=2)
+        logger.info(f'{self._class}:: stored in :: {file_name}')
+
+    @staticmethod
+    def __percentile(values: List[float], percentile: int) -> float:
+        """
+        :param values: sorted values
+        :return: nearest-rank percentile
+        """
+        rank = max(-(-len(values) * percentile // 100), 1)  # ceil
+        return values[rank - 1]
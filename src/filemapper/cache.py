@@ -0,0 +1,179 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import asdict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from src import runner
+from src import settings
+from src.core.models import MediaItem
+from src.core.models import ParsedInfo
+from src.core.parsers import Parser
+from src.core.types import Language
+from src.core.types import MediaType
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+# sources of the media type, language and parsed info of a name, any change in them invalidates the cache
+_SOURCES = [
+    os.path.join('core', 'parsers'),
+    os.path.join('core', 'matchers'),
+    os.path.join('core', 'models', 'models.py'),
+    os.path.join('core', 'utils', 'language.py'),
+    os.path.join('core', 'utils', 'patterns.py'),
+    os.path.join('core', 'utils', 'strings.py'),
+]
+
+
+class ParseCache(Object):
+    """
+    On-disk results of classifying and parsing the names of the items (media type, language and parsed info), kept
+    between runs so the names that didn't change since the previous run skip all the CPU bound work.
+
+    The results only depend on the name, the kind of item, if it was classified on its own or as a child of another
+    one (only the first ones get a language) and the media type and language presets. They are stamped with a hash of
+    the parsing sources, so any change in the parsers discards them.
+    """
+    __SCHEMA_VERSION = 2
+
+    def __init__(self, path: str):
+        """
+        :param path: cache file path
+        """
+        self._path = path
+        self.stats = Counter()
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+
+        version = self.__connection.execute('PRAGMA user_version').fetchone()[0]
+        stamp = None
+        if version == self.__SCHEMA_VERSION:
+            stamp = self.__connection.execute('SELECT parser FROM stamp').fetchone()[0]
+        if stamp != parser_version():
+            if version:
+                logger.info(f'{self._class}:: discarding outdated cache :: {self._path}')
+            self.__create()
+
+    @classmethod
+    def open(cls) -> 'ParseCache':
+        """
+        :return: the cache stored in the cache directory
+        """
+        os.makedirs(settings.CACHE_DIR, exist_ok=True)
+        return cls(os.path.join(settings.CACHE_DIR, 'parsed.sqlite'))
+
+    def restore(self, item: MediaItem) -> bool:
+        """
+        Sets the stored media type, language and parsed info of the item and its childs. The childs not stored, like
+        the new episodes of a season, are parsed and stored.
+        :return: if the item was classified by a previous run
+        """
+        nodes = item.flatten()
+        with self.__lock:
+            rows = [self.__row(i, is_child=index > 0) for index, i in enumerate(nodes)]
+            self.stats['misses' if rows[0] is None else 'hits'] += 1
+        if rows[0] is None:
+            return False
+
+        media_type = rows[0][0]
+        item.media_type = media_type
+        missing = []
+        for node, row in zip(nodes, rows):
+            if row is None or row[0] != media_type:
+                missing.append(node)
+                continue
+            node._language, node.parsed = row[1], row[2]
+
+        if missing:
+            parser = Parser(media_type=media_type)
+            for node, parsed in zip(missing, parser.parse_many(missing)):
+                node.parsed = parsed
+            self.__insert(missing, is_child=True)
+        return True
+
+    def store(self, item: MediaItem):
+        """
+        Stores the media type, language and parsed info of the classified item and its childs.
+        """
+        nodes = item.flatten()
+        self.__insert(nodes[:1], is_child=False)
+        self.__insert(nodes[1:], is_child=True)
+
+    def close(self):
+        """
+        Commits the stored results.
+        """
+        logger.info(f'{self._class}:: saving :: {self._path} :: {dict(self.stats)}')
+        with self.__lock:
+            self.__connection.commit()
+            self.__connection.close()
+
+    def __insert(self, items: List[MediaItem], is_child: bool):
+        presets = self.__presets()
+        rows = [
+            (
+                i._class, i.item_name, is_child, presets,
+                i.media_type.name, i._language.name if i._language is not None else None,
+                json.dumps(asdict(i.parsed), separators=(',', ':')),
+            ) for i in items
+        ]
+        with self.__lock:
+            self.__connection.executemany('INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def __row(self, item: MediaItem, is_child: bool) -> Optional[Tuple[MediaType, Optional[Language], ParsedInfo]]:
+        row = self.__connection.execute(
+            'SELECT media_type, language, parsed FROM items '
+            'WHERE kind = ? AND name = ? AND is_child = ? AND presets = ?',
+            (item._class, item.item_name, is_child, self.__presets()),
+        ).fetchone()
+        if row is None:
+            return None
+        media_type, language, parsed = row
+        return MediaType[media_type], Language[language] if language is not None else None, \
+            ParsedInfo(**json.loads(parsed))
+
+    @staticmethod
+    def __presets() -> str:
+        return f'{runner.media_type}:{runner.language}'
+
+    def __create(self):
+        with self.__lock:
+            self.__connection.execute('DROP TABLE IF EXISTS items')
+            self.__connection.execute('DROP TABLE IF EXISTS stamp')
+            self.__connection.execute(
+                'CREATE TABLE items ('
+                'kind TEXT, name TEXT, is_child INTEGER, presets TEXT, '
+                'media_type TEXT NOT NULL, language TEXT, parsed TEXT NOT NULL, '
+                'PRIMARY KEY (kind, name, is_child, presets))'
+            )
+            self.__connection.execute('CREATE TABLE stamp (parser TEXT NOT NULL)')
+            self.__connection.execute('INSERT INTO stamp VALUES (?)', (parser_version(),))
+            self.__connection.execute(f'PRAGMA user_version = {self.__SCHEMA_VERSION}')
+            self.__connection.commit()
+
+
+def parser_version() -> str:
+    """
+    :return: hash of the sources classifying and parsing the names
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # src
+    files: List[str] = []
+    for source in _SOURCES:
+        path = os.path.join(root, source)
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, f) for f in os.listdir(path) if f.endswith('.py'))
+        else:
+            files.append(path)
+
+    digest = hashlib.sha1()
+    for file in sorted(files):
+        with open(file, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
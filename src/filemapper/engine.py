@@ -1,9 +1,17 @@
+import asyncio
+import json
 import logging
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 from typing import List
 from typing import Optional
-
-from polyglot.text import Text
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
 
 from src import runner
 from src import settings
@@ -16,13 +24,28 @@ from src.core.models import MediaItem
 from src.core.models import ParsedInfo
 from src.core.models import Season
 from src.core.models import Show
+from src.core.models import VirtualSeason
 from src.core.types import Language
 from src.core.types import MediaType
 from src.core.types import Object
+from src.core.types import SymlinkPolicy
+from src.core.utils.language import LanguageDetector
+from src.core.utils.logs import GroupedLogs
+from src.core.utils.strings import CleanCache
+from src.core.utils.timings import Timings
+from src.filemapper.cache import ParseCache
+from src.filemapper.journal import Journal
+from src.filemapper.plan import Plan
 from src.filemapper.processors import Processor
+from src.filemapper.tbuilder import Snapshot
 from src.filemapper.tbuilder import Tree
+from src.filemapper.tbuilder import WalkRules
 from src.filemapper.tbuilder.models import Directory
 from src.filemapper.tbuilder.models import File
+from src.filemapper.tbuilder.models import Item
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientSession
 
 logger = logging.getLogger()
 
@@ -31,24 +54,120 @@ class Engine(Object):
     _tree: Tree
     __TYPE_MATCHERS: List[TypeMatcher] = [AnimeTypeMatcher(), FilmTypeMatcher()]
 
-    def __init__(self, path: str, media_type: Optional[str] = None, language: Optional[str] = None):
-        if not os.path.isabs(path):
-            path = os.path.abspath(path)
-
+    def __init__(
+            self,
+            path: Union[str, List[str]],
+            media_type: Optional[str] = None,
+            language: Optional[str] = None,
+            walk_jobs: int = 1,
+            streaming: bool = False,
+            snapshot: bool = False,
+            rules: Optional[WalkRules] = None,
+            symlinks: str = 'follow',
+            jobs: int = 1,
+            plan: Optional[Plan] = None,
+            cpu_jobs: int = 1,
+            journal: Optional[Journal] = None,
+            parse_cache: Optional[ParseCache] = None,
+    ):
+        """
+        :param path: path or paths to handle. Paths are handled one after the other by the same processors, so their
+            connections and search results are reused.
+        :param streaming: start processing the directories as soon as they are listed instead of waiting for the whole
+            tree to be built.
+        :param snapshot: keep the directory listings next to the library so later runs only list the directories
+            modified since.
+        :param rules: include/exclude rules applied while building the tree.
+        :param symlinks: symlinks policy, 'follow' or 'skip'.
+        :param jobs: number of items processed concurrently when a directory is handled as separated files.
+        :param plan: if given the renames are added to the plan instead of done.
+        :param cpu_jobs: number of processes classifying and parsing the items, done for all the items of a path before
+            any of them is processed. Ignored when streaming.
+        :param journal: if given the finished items are skipped and the progress of the run is stored on it.
+        :param parse_cache: if given the items classified by previous runs reuse their results, and the new ones are
+            stored on it.
+        """
         try:
             runner.media_type = MediaType[media_type.upper()] if media_type else None
             runner.language = Language[language.upper()] if language else None
         except KeyError as ke:
             raise UnsupportedMediaType(ke)
 
-        self._tree = Tree(path=path)
+        self._paths = self.__roots([path] if isinstance(path, str) else path)
+        self._walk_jobs = walk_jobs
+        self._streaming = streaming
+        self._snapshot = snapshot
+        self._rules = rules
+        self._symlinks = SymlinkPolicy[symlinks.upper()]
+        self._jobs = jobs
+        self._plan = plan
+        self._cpu_jobs = cpu_jobs
+        self._journal = journal
+        self._parse_cache = parse_cache
+        self.__pending: Optional[List[Union[MediaItem, Tuple[Directory, List[Episode]]]]] = None
+        self.__handled: Set[int] = set()
+        self.__local = threading.local()
+        self.__processors: Dict[MediaType, Processor] = {}
 
     def run(self):
         logger.info(f'{self._class}:: running with configuration::{settings}')
-        if self._tree.is_file:
-            self.handle_file()
-        if self._tree.is_directory:
-            self.handle_directory()
+        Timings().reset()
+        errors = []
+        for path in self._paths:
+            try:
+                self._load(path)
+                if self._cpu_jobs > 1 and not self._streaming:
+                    self.__run_in_stages()
+                    continue
+
+                if self._tree.is_file:
+                    self.handle_file()
+                if self._tree.is_directory:
+                    self.handle_directory() if not self._streaming else self.__stream()
+            except Exception as e:  # keep handling the other paths
+                logger.error(f'{self._class}:: {path} :: {e}')
+                errors.append(e)
+
+        if settings.DEBUG:
+            logger.info(f'{self._class}:: directory predicates cache :: {dict(Directory.predicates_stats)}')
+            logger.info(f'{self._class}:: timings :: {json.dumps(Timings().summary())}')
+        if errors:
+            raise errors[0]
+
+    def __run_in_stages(self):
+        """
+        Collects the items of the tree, classifies and parses all of them in a pool of processes and only then processes
+        them, so the CPU bound work uses all the cores and is done before the network one.
+        """
+        self.__pending = []
+        try:
+            self.handle_file() if self._tree.is_file else self.handle_directory()
+            pending = self.__pending
+        finally:
+            self.__pending = None
+
+        items = [p for p in pending if isinstance(p, MediaItem)]
+        loose = [e for p in pending if isinstance(p, tuple) for e in p[1]]
+        with Timings().stage('classify.pool'):
+            self.__classify_many([i for i in items + loose if not self.__restore(i)])
+
+        self.__handle_separately(items + [i for p in pending if isinstance(p, tuple) for i in self.__group(*p)])
+
+    def __classify_many(self, items: List[MediaItem]):
+        """
+        Classifies the items in the process pool and copies the results back into them.
+        """
+        with ProcessPoolExecutor(
+                max_workers=self._cpu_jobs,
+                initializer=_init_worker,
+                initargs=(runner.media_type, runner.language, CleanCache().maxsize),
+        ) as executor:
+            chunksize = max(len(items) // (self._cpu_jobs * 4), 1)
+            for item, classified in zip(items, executor.map(_classify, items, chunksize=chunksize)):
+                for node, result in zip(item.flatten(), classified.flatten()):
+                    node._media_type, node._language, node.parsed = result._media_type, result._language, result.parsed
+                if self._parse_cache is not None:
+                    self._parse_cache.store(item)
 
     def handle_file(self, file: File = None):
         logger.info(f'{self._class}:: working on :: \'{self._tree.path}\'')
@@ -58,13 +177,7 @@ class Engine(Object):
         assert isinstance(file, File), f'invalid file {file}'
         assert file.is_valid, f'invalid file {file}'
 
-        episode = Episode.from_file(file=file)
-        episode.media_type = self.__categorize(episode)
-        episode.language = self.__language(episode)
-        ParsedInfo.parse(episode)
-
-        processor = Processor(media_type=episode.media_type)
-        processor.process_episode(episode)
+        self.__submit(Episode.from_file(file=file))
 
     def handle_directory(self, directory: Directory = None):
         logger.info(f'{self._class}:: working on :: \'{self._tree.path}\'')
@@ -74,6 +187,10 @@ class Engine(Object):
         assert isinstance(directory, Directory), f'invalid directory {directory}'
         assert directory.is_valid, f'invalid directory {directory}'
 
+        if id(directory) in self.__handled:  # already handled while streaming
+            return
+        self.__handled.add(id(directory))
+
         if len(directory.childs) == 1:
             lonely_item = directory.childs[0]
             if isinstance(lonely_item, File):
@@ -85,46 +202,287 @@ class Engine(Object):
 
         # Check for show
         if directory.can_be_show:
-            show = Show.from_directory(directory=directory)
-            show.media_type = self.__categorize(show)
-            show.language = self.__language(show)
-            ParsedInfo.parse(show)
-
-            processor = Processor(media_type=show.media_type)
-            processor.process_show(show)
+            self.__submit(Show.from_directory(directory=directory))
             return
 
             # Check for season
         if directory.can_be_season:
             # If we only have files or files and a sub folder we assume we are in a season
-            season = Season.from_directory(directory=directory)
-            season.media_type = self.__categorize(season)
-            season.language = self.__language(season)
-            ParsedInfo.parse(season)
-
-            processor = Processor(media_type=season.media_type)
-            processor.process_season(season)
+            self.__submit(Season.from_directory(directory=directory))
             return
 
         # Handle independent files
         logger.info(f'{self._class}:: as separated files')
-        [self.handle_file(item) for item in directory.childs if isinstance(item, File) and item.is_valid]
-        [self.handle_directory(item) for item in directory.childs if isinstance(item, Directory) and item.is_valid]
+        episodes = [Episode.from_file(file=f) for f in directory.childs if isinstance(f, File) and f.is_valid]
+        directories = [item for item in directory.childs if isinstance(item, Directory) and item.is_valid]
+        if self.__pending is not None:  # grouped once classified
+            self.__pending.append((directory, episodes))
+            [self.handle_directory(d) for d in directories]
+            return
+
+        self.__handle_separately(self.__group(directory, [self.__classified(e) for e in episodes]) + directories)
+
+    def __submit(self, item: MediaItem):
+        """
+        Classifies and processes the item, or keeps it to be classified with the rest when running in stages.
+        """
+        if self.__pending is not None:
+            self.__pending.append(item)
+            return
+        self._process(self.__classified(item))
+
+    def __classified(self, item: MediaItem) -> MediaItem:
+        """
+        :return: the item classified, reusing the results of previous runs if possible
+        """
+        if not self.__restore(item):
+            self._classify(item)
+            if self._parse_cache is not None:
+                self._parse_cache.store(item)
+        return item
+
+    def __restore(self, item: MediaItem) -> bool:
+        """
+        :return: if the item was classified with the results of a previous run
+        """
+        if self._parse_cache is None:
+            return False
+        with Timings().stage('classify.cache'):
+            return self._parse_cache.restore(item)
+
+    def __group(self, directory: Directory, episodes: List[Episode]) -> List[MediaItem]:
+        """
+        Groups the loose files of the same media and season into virtual seasons, so their metadata and episode names
+        are only looked up once.
+        :return: the virtual seasons and the episodes that don't share their season with other files.
+        """
+        groups: Dict[Tuple, List[Episode]] = {}
+        for episode in episodes:
+            key = (episode.media_type, episode.language, episode.parsed.media_title, episode.parsed.season)
+            groups.setdefault(key, []).append(episode)
+
+        items = []
+        for episodes in groups.values():
+            if len(episodes) > 1:
+                logger.info(f'{self._class}:: grouped :: {[e.item_name for e in episodes]}')
+                items.append(VirtualSeason.from_episodes(directory, episodes))
+            else:
+                items.extend(episodes)
+        return items
+
+    def __handle_separately(self, items: List[Union[Item, MediaItem]]):
+        """
+        Handles independent items, concurrently if more than one job is allowed. The logs of each item are grouped and
+        items found while handling one in a worker are handled inline by that worker, so workers never wait for each
+        other.
+        """
+        if self._jobs <= 1 or getattr(self.__local, 'is_worker', False):
+            [self.__handle(item) for item in items]
+            return
+
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            futures = [executor.submit(self.__handle_in_worker, item) for item in items]
+        [f.result() for f in futures]  # raise the workers exceptions
+
+    def __handle_in_worker(self, item: Union[Item, MediaItem]):
+        self.__local.is_worker = True
+        with GroupedLogs().group():
+            self.__handle(item)
+
+    def __handle(self, item: Union[Item, MediaItem]):
+        if isinstance(item, MediaItem):  # already parsed
+            self._process(item)
+        else:
+            assert isinstance(item, Directory)
+            self.handle_directory(item)
+
+    def __stream(self):
+        for directory in self._tree.walk():
+            self._handle_listed(directory)
+
+    def _handle_listed(self, directory: Directory):
+        """
+        Handles the tree directories bottom-up while it is being built.
 
-    def __categorize(self, item: MediaItem) -> MediaType:
+        A valid directory that can not be a season can't be part of a show or season either, so it is handled as soon
+        as its subtree is complete. Season candidates wait for their parent, which decides if they belong to a show.
+        """
+        if directory is self._tree.root:
+            self.handle_directory(directory)
+            return
+
+        if self.__is_reachable(directory) and not directory.can_be_season:
+            self.handle_directory(directory)
+
+    def _load(self, path: str):
+        """
+        Builds the tree of the next path to handle.
+        """
+        self.__handled.clear()  # nodes of the previous trees are gone, their ids can be reused
+        with Timings().stage('tree'):
+            self._tree = Tree(
+                path=path,
+                walk_jobs=self._walk_jobs,
+                lazy=self._streaming,
+                snapshot=Snapshot.for_library(path) if self._snapshot and os.path.isdir(path) else None,
+                rules=self._rules,
+                symlinks=self._symlinks,
+            )
+
+    def _processor(self, media_type: MediaType) -> Processor:
+        """
+        :return: the processor of the media type, created once so its datasources are reused by all the paths.
+        """
+        if media_type not in self.__processors:
+            self.__processors[media_type] = Processor(media_type=media_type, plan=self._plan, journal=self._journal)
+        return self.__processors[media_type]
+
+    def _process(self, item: MediaItem):
+        if self._is_done(item):
+            return
+
+        processor = self._processor(item.media_type)
+        match item:
+            case Show():
+                processor.process_show(item)
+            case Season():
+                processor.process_season(item)
+            case Episode():
+                processor.process_episode(item)
+
+        if self._journal is not None:
+            self._journal.done(item)
+
+    def _is_done(self, item: MediaItem) -> bool:
+        """
+        :return: if the item was finished by the interrupted run being resumed
+        """
+        if self._journal is None or not self._journal.is_done(item):
+            return False
+        logger.info(f'{self._class}:: already done :: {item.path}')
+        return True
+
+    def __roots(self, paths: List[str]) -> List[str]:
+        """
+        :return: the absolute paths, without the repeated ones or the ones inside another path
+        """
+        paths = list(dict.fromkeys(os.path.abspath(p) for p in paths))
+        roots = [p for p in paths if not any(p != o and p.startswith(os.path.join(o, '')) for o in paths)]
+        [logger.info(f'{self._class}:: handled as part of another path :: {p}') for p in paths if p not in roots]
+        return roots
+
+    @staticmethod
+    def __is_reachable(directory: Directory) -> bool:
+        while directory is not None:
+            if not directory.is_valid:
+                return False
+            directory = directory.parent
+        return True
+
+    @classmethod
+    def _classify(cls, item: MediaItem) -> MediaItem:
+        """
+        CPU bound stage of the item: media type, language and parsed info. Only depends on the item and the runner
+        presets so it can run in another process.
+        """
+        item.media_type = cls.__categorize(item)
+        item.language = cls.__language(item)
+        cls.__parse(item)
+        return item
+
+    @staticmethod
+    @Timings().stage('parse')
+    def __parse(item: MediaItem):
+        ParsedInfo.parse(item)
+
+    @classmethod
+    @Timings().stage('classify')
+    def __categorize(cls, item: MediaItem) -> MediaType:
         if runner.media_type is not None:
             return runner.media_type
 
-        match = next(tm for tm in self.__TYPE_MATCHERS if tm.matches(item.item_name))
+        match = next(tm for tm in cls.__TYPE_MATCHERS if tm.matches(item.item_name))
         return match.media_type if match else MediaType.UNKNOWN
 
-    def __language(self, item: MediaItem) -> Language:
+    @classmethod
+    @Timings().stage('language')
+    def __language(cls, item: MediaItem) -> Language:
         if runner.language is not None:
-            logger.info(f'{self._class}:: {item.item_name} :: using language :: {runner.language}')
+            logger.info(f'{cls.__name__}:: {item.item_name} :: using language :: {runner.language}')
             return runner.language
 
-        lang = Text(item.item_name).language.code
+        lang = LanguageDetector().detect(item.item_name)
         lang = lang if lang in Language.__members__.values() else Language.JA.value
 
-        logger.info(f'{self._class}:: {item.item_name} :: using language :: {lang}')
+        logger.info(f'{cls.__name__}:: {item.item_name} :: using language :: {lang}')
         return Language[lang.upper()]
+
+
+def _init_worker(media_type: Optional[MediaType], language: Optional[Language], clean_cache: int):
+    # the presets are not inherited by spawned processes
+    runner.media_type, runner.language = media_type, language
+    CleanCache().enable(maxsize=clean_cache)
+
+
+def _classify(item: MediaItem) -> MediaItem:
+    return Engine._classify(item)
+
+
+class AsyncEngine(Engine):
+    """
+    Engine scheduling the processing of the items in a single event loop with a shared session, so the network latency
+    of all the items overlaps. The tree is listed in a background thread while the listed directories are handled.
+    """
+
+    def __init__(self, path: Union[str, List[str]], **kwargs):
+        """
+        :param kwargs: #Engine arguments, the directories are always streamed and the items processed in the loop.
+        """
+        kwargs.update(streaming=True, jobs=1)
+        super().__init__(path, **kwargs)
+        self.__session: Optional['ClientSession'] = None
+        self.__tasks: List[asyncio.Task] = []
+
+    def run(self):
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        from aiohttp import ClientSession  # slow to import, only needed by this engine
+
+        logger.info(f'{self._class}:: running with configuration::{settings}')
+        Timings().reset()
+        errors = []
+        async with ClientSession() as self.__session:
+            for path in self._paths:
+                try:
+                    self._load(path)
+                    if self._tree.is_file:
+                        self.handle_file()
+                    if self._tree.is_directory:
+                        walk = self._tree.walk()
+                        while (directory := await asyncio.to_thread(next, walk, None)) is not None:
+                            self._handle_listed(directory)
+                except Exception as e:  # keep handling the other paths
+                    logger.error(f'{self._class}:: {path} :: {e}')
+                    errors.append(e)
+
+            results = await asyncio.gather(*self.__tasks, return_exceptions=True)
+
+        failed = [r for r in results if isinstance(r, Exception)]
+        [logger.error(f'{self._class}:: {e}') for e in failed]
+        errors.extend(failed)
+        if errors:
+            raise errors[0]
+
+        if settings.DEBUG:
+            logger.info(f'{self._class}:: directory predicates cache :: {dict(Directory.predicates_stats)}')
+            logger.info(f'{self._class}:: timings :: {json.dumps(Timings().summary())}')
+
+    def _process(self, item: MediaItem):
+        if not self._is_done(item):
+            self.__tasks.append(asyncio.create_task(self.__process_async(item)))
+
+    async def __process_async(self, item: MediaItem):
+        await self._processor(item.media_type).process_async(item, self.__session)
+        if self._journal is not None:
+            self._journal.done(item)
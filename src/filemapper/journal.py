@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+from src.core.datasources.models import AnilistData
+from src.core.datasources.models import APIData
+from src.core.datasources.models import ImdbData
+from src.core.datasources.models import MalData
+from src.core.models import MediaItem
+from src.core.models import VirtualSeason
+from src.core.models.metadata import AnimeMetadata
+from src.core.models.metadata import Metadata
+from src.core.types import DatasourceName
+from src.core.types import Language
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+
+class Journal(Object):
+    """
+    Progress of a run stored as each item completes, so an interrupted run can be resumed skipping the finished items
+    and reusing the metadata of the ones already looked up instead of querying the datasources again.
+
+    Every change is committed as soon as it happens, so the journal is valid whenever the run dies.
+    """
+    __SCHEMA_VERSION = 2
+
+    def __init__(self, path: str, resume: bool = False):
+        """
+        :param path: journal file path
+        :param resume: keep the progress stored by a previous run, otherwise it is discarded
+        """
+        self._path = path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+
+        version = self.__connection.execute('PRAGMA user_version').fetchone()[0]
+        if resume and version != self.__SCHEMA_VERSION:
+            logger.info(f'{self._class}:: discarding outdated journal :: {self._path}')
+        if not resume or version != self.__SCHEMA_VERSION:
+            self.__create()
+
+        self._done: Set[str] = {p for p, in self.__connection.execute('SELECT path FROM done')}
+        self._sources: Dict[str, str] = dict(self.__connection.execute('SELECT target, source FROM renames'))
+        if self._done:
+            logger.info(f'{self._class}:: resuming :: {len(self._done)} items already done')
+
+    @classmethod
+    def for_library(cls, path: str, resume: bool = False) -> 'Journal':
+        """
+        :return: the journal stored next to the library folder in #path
+        """
+        path = path.rstrip(os.sep)
+        return cls(os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.journal'), resume=resume)
+
+    def is_done(self, item: MediaItem) -> bool:
+        return all(p in self._done for p in self.__done_paths(item))
+
+    def done(self, item: MediaItem):
+        """
+        Marks the item as finished, found by its new name once renamed.
+        """
+        paths = self.__done_paths(item)
+        with self.__lock:
+            self.__connection.executemany('INSERT OR REPLACE INTO done VALUES (?)', [(p,) for p in paths])
+            self._done.update(paths)
+
+    def renamed(self, source: str, target: str):
+        """
+        Keeps the path the item was looked up with, so its metadata is found after the rename.
+        """
+        with self.__lock:
+            source = self.__source(source)
+            self.__connection.execute('INSERT OR REPLACE INTO renames VALUES (?, ?)', (target, source))
+            self._sources[target] = source
+
+    def looked_up(self, item: MediaItem):
+        """
+        Stores the metadata of the item and its childs.
+        """
+        with self.__lock:
+            rows = [(self.__key(i), _dumps(i._metadata)) for i in item.flatten() if i._metadata is not None]
+            self.__connection.executemany('INSERT OR REPLACE INTO metadata VALUES (?, ?)', rows)
+
+    def restore(self, item: MediaItem) -> bool:
+        """
+        Sets the metadata stored for the item and its childs.
+        :return: if the item was looked up by a previous run
+        """
+        with self.__lock:
+            stored = [(i, self.__metadata(self.__key(i))) for i in item.flatten()]
+        if stored[0][1] is None:  # the item itself
+            return False
+
+        for i, metadata in stored:
+            if metadata is not None:
+                i._metadata = _loads(metadata)
+        return True
+
+    def remove(self):
+        """
+        Drops the journal once the run completes.
+        """
+        self.__connection.close()
+        os.remove(self._path)
+
+    def __metadata(self, key: str) -> Optional[str]:
+        row = self.__connection.execute('SELECT data FROM metadata WHERE path = ?', (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def __key(self, item: MediaItem) -> str:
+        """
+        :return: the path the item had when it was looked up. Virtual seasons share their folder with other items so
+            they are identified by their episodes.
+        """
+        if isinstance(item, VirtualSeason):
+            return '\n'.join(sorted(self.__source(e.path) for e in item.episodes))
+        return self.__source(item.path)
+
+    def __source(self, path: str) -> str:
+        """
+        :return: the path before any of the renames of the item or its parent folders
+        """
+        if path in self._sources:
+            return self._sources[path]
+        parent, name = os.path.split(path)
+        if not name or parent == path:
+            return path
+        path = os.path.join(self.__source(parent), name)
+        return self._sources.get(path, path)
+
+    @staticmethod
+    def __done_paths(item: MediaItem) -> List[str]:
+        return [e.path for e in item.episodes] if isinstance(item, VirtualSeason) else [item.path]
+
+    def __create(self):
+        with self.__lock:
+            for table in ['done', 'renames', 'metadata']:
+                self.__connection.execute(f'DROP TABLE IF EXISTS {table}')
+            self.__connection.execute('CREATE TABLE done (path TEXT PRIMARY KEY)')
+            self.__connection.execute('CREATE TABLE renames (target TEXT PRIMARY KEY, source TEXT NOT NULL)')
+            self.__connection.execute('CREATE TABLE metadata (path TEXT PRIMARY KEY, data TEXT NOT NULL)')
+            self.__connection.execute(f'PRAGMA user_version = {self.__SCHEMA_VERSION}')
+
+
+_API_DATA = {c.__name__: c for c in [MalData, AnilistData, ImdbData]}
+
+
+def _dumps(metadata: Metadata) -> str:
+    data = {'title': metadata.title, 'title_lang': metadata.title_lang.value if metadata.title_lang else None}
+    if isinstance(metadata, AnimeMetadata):
+        is_single = isinstance(metadata.datasource_data, tuple)
+        datasource_data = dict([metadata.datasource_data]) if is_single else metadata.datasource_data
+        data.update(
+            season_name=metadata.season_name,
+            episode_name=metadata.episode_name,
+            is_single=is_single,
+            datasource_data=[
+                [name.value, {'type': type(d).__name__, 'id': d.id, 'title': d._title, 'titles': d.alternative_titles}]
+                for name, d in datasource_data.items()
+            ],
+        )
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _loads(stored: str) -> Metadata:
+    data = json.loads(stored)
+    title_lang = Language(data['title_lang']) if data['title_lang'] else None
+    if 'datasource_data' not in data:
+        return Metadata(title=data['title'], title_lang=title_lang)
+
+    datasource_data = {DatasourceName(name): _api_data(d) for name, d in data['datasource_data']}
+    return AnimeMetadata(
+        title=data['title'],
+        title_lang=title_lang,
+        datasource_data=next(iter(datasource_data.items())) if data['is_single'] else datasource_data,
+        season_name=data['season_name'],
+        episode_name=data['episode_name'],
+    )
+
+
+def _api_data(data: Dict) -> APIData:
+    api_data = object.__new__(_API_DATA[data['type']])  # built from the stored fields, not from an API response
+    api_data.id, api_data._title, api_data.alternative_titles = data['id'], data['title'], data['titles']
+    return api_data
@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from src import settings
+from src.core.models import MediaItem
+from src.core.models.metadata import AnimeMetadata
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+
+@dataclass
+class Rename:
+    source: str
+    target: str
+    item_type: str
+    metadata: Dict = field(default_factory=dict)  # where the new name comes from
+
+    @classmethod
+    def from_item(cls, item: MediaItem, target: str) -> 'Rename':
+        return cls(source=item.path, target=target, item_type=item._class, metadata=cls.__provenance(item))
+
+    @staticmethod
+    def __provenance(item: MediaItem) -> Dict:
+        metadata = item.metadata
+        if metadata is None:
+            return {}
+
+        provenance = {'title': metadata.title, 'title_lang': metadata.title_lang.value if metadata.title_lang else None}
+        if isinstance(metadata, AnimeMetadata):
+            data = metadata.datasource_data
+            data = dict([data]) if isinstance(data, tuple) else data
+            provenance.update(
+                season_name=metadata.season_name,
+                episode_name=metadata.episode_name,
+                datasources={name.value: d.id for name, d in data.items()},
+            )
+        return provenance
+
+
+class Plan(Object):
+    """
+    Renames resolved by the processors, kept in the order they must be done (the files before their folders) so they
+    can be applied later without looking anything up.
+
+    Plans are stored as NDJSON, one #Rename per line.
+    """
+
+    def __init__(self, renames: Optional[List[Rename]] = None):
+        self._renames: List[Rename] = renames if renames is not None else []
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._renames)
+
+    def __iter__(self):
+        return iter(self._renames)
+
+    def add(self, item: MediaItem, target: str):
+        if item.path == target:
+            return
+        with self.__lock:
+            self._renames.append(Rename.from_item(item, target))
+
+    def save(self, file_name: str):
+        with open(file_name, 'w') as file:
+            for rename in self._renames:
+                file.write(json.dumps(asdict(rename), ensure_ascii=False) + '\n')
+        logger.info(f'{self._class}:: {len(self)} renames planned in :: {file_name}')
+
+    @classmethod
+    def load(cls, file_name: str) -> 'Plan':
+        with open(file_name) as file:
+            return cls([Rename(**json.loads(line)) for line in file if line.strip()])
+
+    def apply(self) -> int:
+        """
+        Does the renames in order. A rename whose source is gone or whose target already exists is skipped, as the
+        library changed since it was planned.
+        :return: number of renames done
+        """
+        done = 0
+        for rename in self._renames:
+            if not os.path.exists(rename.source):
+                logger.error(f'{self._class}:: missing source :: {rename.source}')
+                continue
+            if os.path.exists(rename.target):
+                logger.error(f'{self._class}:: target exists :: {rename.target}')
+                continue
+
+            if not settings.DEBUG:
+                os.rename(rename.source, rename.target)
+            logger.info(f'{self._class}:: renamed :: \'{rename.source}\' -> \'{rename.target}\'')
+            done += 1
+
+        logger.info(f'{self._class}:: {done}/{len(self)} renames applied')
+        return done
@@ -1,5 +1,4 @@
 from src.filemapper.processors._processor import Processor
-from src.filemapper.processors.anime import AnimeProcessor
 
 __all__ = [
     Processor
@@ -1,7 +1,14 @@
+import importlib
 import logging
+import os
+import threading
 from abc import ABC
 from abc import abstractmethod
+from typing import Dict
+from typing import Optional
+from typing import TYPE_CHECKING
 
+from src import settings
 from src.core.formatter import Formatter
 from src.core.models import Episode
 from src.core.models import MediaItem
@@ -9,15 +16,29 @@ from src.core.models import Season
 from src.core.models import Show
 from src.core.types import MediaType
 from src.core.types import Object
+from src.core.utils.timings import Timings
+from src.filemapper.journal import Journal
+from src.filemapper.plan import Plan
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientSession
 
 logger = logging.getLogger()
 
 
 class Processor(ABC, Object):
     _registry = {}
+    _modules = {
+        MediaType.ANIME: 'src.filemapper.processors.anime',
+        MediaType.UNKNOWN: 'src.filemapper.processors.unknown',
+    }
+    _rename_locks: Dict[str, threading.Lock] = {}
+    __rename_locks_lock = threading.Lock()
 
     _media_type: MediaType
     _formatter: Formatter
+    _plan: Optional[Plan]
+    _journal: Optional[Journal]
 
     @property
     def media_type(self) -> MediaType:
@@ -33,14 +54,62 @@ class Processor(ABC, Object):
         cls._media_type = media_type
         cls._registry[media_type] = cls
 
-    def __new__(cls, media_type: MediaType, **kwargs):  # pragma: no cover
+    def __new__(
+            cls, media_type: MediaType, plan: Optional[Plan] = None, journal: Optional[Journal] = None, **kwargs,
+    ):  # pragma: no cover
+        if media_type not in cls._registry:  # implementations, and their dependencies, are imported on first use
+            importlib.import_module(cls._modules[media_type])
         subclass = cls._registry[media_type]
         final_obj = object.__new__(subclass)
         final_obj._media_type = media_type
         final_obj._formatter = Formatter(media_type=media_type)
+        final_obj._plan = plan
+        final_obj._journal = journal
 
         return final_obj
 
+    @classmethod
+    def rename_lock(cls, path: str) -> threading.Lock:
+        """
+        :return: the lock serializing the renames inside the #path directory when items are processed concurrently.
+        """
+        with cls.__rename_locks_lock:
+            return cls._rename_locks.setdefault(path, threading.Lock())
+
+    def _move(self, item: MediaItem, new_name: str):
+        """
+        Renames the item in disk, or only adds the rename to the plan if planning.
+        """
+        target = os.path.join(item.base_path, new_name)
+        with Timings().stage('rename'):
+            if self._plan is not None:
+                self._plan.add(item, target)
+            elif not settings.DEBUG:
+                with self.rename_lock(item.base_path):
+                    os.rename(item.path, target)
+                if self._journal is not None:
+                    self._journal.renamed(item.path, target)
+
+    def _resume(self, item: MediaItem) -> bool:
+        """
+        Renames the item with the metadata looked up by an interrupted run.
+        :return: if the item was renamed from the journal
+        """
+        if self._journal is None or not self._journal.restore(item):
+            return False
+
+        logger.info(f'{self._class}:: metadata restored from the journal :: {item}')
+        self.rename(item)
+        return True
+
+    def _resolved(self, item: MediaItem):
+        """
+        Renames the looked up item, journaling its metadata first so it is not looked up again if the run dies.
+        """
+        if self._journal is not None:
+            self._journal.looked_up(item)
+        self.rename(item)
+
     @abstractmethod
     def process_episode(self, episode: Episode):
         pass
@@ -53,6 +122,13 @@ class Processor(ABC, Object):
     def process_show(self, show: Show):
         pass
 
+    @abstractmethod
+    async def process_async(self, item: MediaItem, session: 'ClientSession'):
+        """
+        Same as the 'process_*' methods for any item, doing the network calls with the given session.
+        """
+        pass
+
     @abstractmethod
     def rename(self, item: MediaItem):
         logger.info(f'{self._class}:: renamed from :: \'{item.path}\'')
@@ -1,15 +1,17 @@
+import asyncio
 import logging
-import os
 from typing import List
 from typing import Optional
 from typing import Tuple
 
-from src import settings
+from aiohttp import ClientSession
+
 from src.core.datasources.api import AnilistAPI
 from src.core.datasources.api import ImdbAPI
 from src.core.datasources.api import MalAPI
 from src.core.datasources.datasource import AnimeDatasource
 from src.core.datasources.datasource import API
+from src.core.datasources.datasource import AnimeAPI
 from src.core.datasources.exceptions import NotFound
 from src.core.datasources.scrapper import ImdbScrapper
 from src.core.datasources.scrapper import WikipediaScrapper
@@ -17,10 +19,12 @@ from src.core.models import Episode
 from src.core.models import MediaItem
 from src.core.models import Season
 from src.core.models import Show
+from src.core.models import VirtualSeason
 from src.core.models.metadata import AnimeMetadata
 from src.core.types import Language
 from src.core.types import MediaType
 from src.core.utils.strings import closest_result
+from src.core.utils.timings import Timings
 from src.filemapper.processors import Processor
 
 logger = logging.getLogger()
@@ -51,17 +55,20 @@ class AnimeProcessor(Processor, media_type=MediaType.ANIME):
     def process_episode(self, episode: Episode):
         logger.info(f'{self._class}:: processing episode :: {episode}')
 
+        if self._resume(episode):
+            return
         self.__fill_metadata(episode)
 
         exceptions = []
         for scrapper in self._scrappers:
             try:
-                scrapper.fill_episode_name(episode)
+                with Timings().stage(f'scrapper.{scrapper.DATASOURCE.value}'):
+                    scrapper.fill_episode_name(episode)
             except NotFound as e:
                 exceptions.append(e)
                 continue
             else:
-                self.rename(episode)
+                self._resolved(episode)
                 return
 
         logger.error(f'{self._class}:: NOT FOUND')
@@ -70,17 +77,20 @@ class AnimeProcessor(Processor, media_type=MediaType.ANIME):
     def process_season(self, season: Season):
         logger.info(f'{self._class}:: processing season :: {season}')
 
+        if self._resume(season):
+            return
         self.__fill_metadata(season)
 
         exceptions = []
         for scrapper in self._scrappers:
             try:
-                scrapper.fill_season_names(season)
+                with Timings().stage(f'scrapper.{scrapper.DATASOURCE.value}'):
+                    scrapper.fill_season_names(season)
             except NotFound as e:
                 exceptions.append(e)
                 continue
             else:
-                self.rename(season)
+                self._resolved(season)
                 return
 
         logger.error(f'{self._class}:: NOT FOUND')
@@ -89,17 +99,42 @@ class AnimeProcessor(Processor, media_type=MediaType.ANIME):
     def process_show(self, show: Show):
         logger.info(f'{self._class}:: processing show :: {show}')
 
+        if self._resume(show):
+            return
         self.__fill_metadata(show)
 
         exceptions = []
         for scrapper in self._scrappers:
             try:
-                scrapper.fill_show_names(show)
+                with Timings().stage(f'scrapper.{scrapper.DATASOURCE.value}'):
+                    scrapper.fill_show_names(show)
+            except NotFound as e:
+                exceptions.append(e)
+                continue
+            else:
+                self._resolved(show)
+                return
+
+        logger.error(f'{self._class}:: NOT FOUND')
+        [logger.error(f'\t{e}') for e in exceptions]
+
+    async def process_async(self, item: MediaItem, session: ClientSession):
+        logger.info(f'{self._class}:: processing :: {item}')
+
+        if self._resume(item):
+            return
+        await self.__fill_metadata_async(item, session)
+
+        exceptions = []
+        for scrapper in self._scrappers:
+            try:
+                with Timings().stage(f'scrapper.{scrapper.DATASOURCE.value}'):
+                    await scrapper.fill_names_async(item, session)
             except NotFound as e:
                 exceptions.append(e)
                 continue
             else:
-                self.rename(show)
+                self._resolved(item)
                 return
 
         logger.error(f'{self._class}:: NOT FOUND')
@@ -109,13 +144,13 @@ class AnimeProcessor(Processor, media_type=MediaType.ANIME):
         if isinstance(item, Season):
             for f in item.episodes:
                 self.rename(f)
+        if isinstance(item, VirtualSeason):  # only groups loose episodes, there is no folder to rename
+            return
         if isinstance(item, Show):
             for s in item.seasons:
                 self.rename(s)
 
-        if not settings.DEBUG:
-            os.rename(item.path, os.path.join(item.base_path, self.formatter.new_name(item)))
-
+        self._move(item, self.formatter.new_name(item))
         super().rename(item)
 
     ########################
@@ -130,14 +165,36 @@ class AnimeProcessor(Processor, media_type=MediaType.ANIME):
     ########################
 
     def __fill_metadata(self, item: MediaItem):
-        season = item.parsed.season if not isinstance(item, Show) else 1
-        season_name = item.parsed.season_name if not isinstance(item, Show) else None
-        metadata = [api.search_anime(self.__format(item), item.language, season, season_name) for api in self._apis]
+        arguments = self.__search_arguments(item)
+        metadata = [self.__search(api, arguments) for api in self._apis]
+        metadata = self.__aggregate_metadata(item, metadata)
+
+        logger.info(f'{self._class}:: aggregated metadata :: {metadata}')
+        item.metadata = metadata
+
+    async def __fill_metadata_async(self, item: MediaItem, session: ClientSession):
+        arguments = self.__search_arguments(item)
+        metadata = await asyncio.gather(*[self.__search_async(api, session, arguments) for api in self._apis])
         metadata = self.__aggregate_metadata(item, metadata)
 
         logger.info(f'{self._class}:: aggregated metadata :: {metadata}')
         item.metadata = metadata
 
+    @staticmethod
+    def __search(api: AnimeAPI, arguments: Tuple) -> Optional[AnimeMetadata]:
+        with Timings().stage(f'api.{api.DATASOURCE.value}'):
+            return api.search_anime(*arguments)
+
+    @staticmethod
+    async def __search_async(api: AnimeAPI, session: ClientSession, arguments: Tuple) -> Optional[AnimeMetadata]:
+        with Timings().stage(f'api.{api.DATASOURCE.value}'):
+            return await api.search_anime_async(session, *arguments)
+
+    def __search_arguments(self, item: MediaItem) -> Tuple[str, Language, int, Optional[str]]:
+        season = item.parsed.season if not isinstance(item, Show) else 1
+        season_name = item.parsed.season_name if not isinstance(item, Show) else None
+        return self.__format(item), item.language, season, season_name
+
     def __aggregate_metadata(self, item: MediaItem, metadata: List[Optional[AnimeMetadata]]) -> AnimeMetadata:
         metadata = [m for m in metadata if m is not None]  # filter nulls
 
@@ -1,3 +1,5 @@
+from aiohttp import ClientSession
+
 from src.core.exceptions import UnsupportedMediaType
 from src.core.models import Episode
 from src.core.models import MediaItem
@@ -24,5 +26,8 @@ class UnknownProcessor(Processor, media_type=MediaType.UNKNOWN):
     def process_show(self, show: Show):
         raise UnsupportedMediaType()
 
+    async def process_async(self, item: MediaItem, session: ClientSession):
+        raise UnsupportedMediaType()
+
     def rename(self, item: MediaItem):
         raise UnsupportedMediaType()
@@ -1,5 +1,9 @@
+from src.filemapper.tbuilder.rules import WalkRules
+from src.filemapper.tbuilder.snapshot import Snapshot
 from src.filemapper.tbuilder.tbuilder import Tree
 
 __all__ = [
-    Tree
+    Snapshot,
+    Tree,
+    WalkRules,
 ]
@@ -1,14 +1,15 @@
-import itertools
+import functools
 import os
 import re
 from abc import ABC
 from abc import abstractmethod
-from dataclasses import dataclass
-from dataclasses import field
+from collections import Counter
 from difflib import SequenceMatcher
-from typing import Iterable
+from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from src import settings
 from src.core.utils.strings import apply_clean
@@ -19,26 +20,78 @@ from src.core.utils.strings import remove_parenthesis
 from src.core.utils.strings import remove_tracker
 from src.core.utils.strings import retrieve_extension
 
+SEASON_EPISODE_RE = re.compile(r'^(S\d+E\d+|E\d+).*')  # probably a limit case
+
+
+def memoized(predicate: Callable[..., bool]) -> Callable[..., bool]:
+    """
+    Caches the result of a #Directory structural predicate until the directory is invalidated.
+    """
+
+    @functools.wraps(predicate)
+    def wrapper(self: 'Directory', *args, **kwargs) -> bool:
+        key = (predicate.__name__, *args, *sorted(kwargs.items()))
+        if self._predicates is None:
+            self._predicates = {}
+        elif key in self._predicates:
+            Directory.predicates_stats['hits'] += 1
+            return self._predicates[key]
+
+        Directory.predicates_stats['misses'] += 1
+        self._predicates[key] = predicate(self, *args, **kwargs)
+        return self._predicates[key]
+
+    return wrapper
+
 
-@dataclass
 class Item(ABC):
-    base_path: str
-    name: str
+    """
+    Slotted tree node. Only the nodes created without a parent (the tree root) store a `base_path`, the rest derive it
+    from their parent so the path strings are not duplicated in every node.
+    """
+    __slots__ = ('name', '_parent', '_base_path', '_depth')
+
+    def __init__(self, name: str, parent: Optional['Directory'] = None, base_path: Optional[str] = None):
+        self.name = name
+        self._base_path = base_path
+        self.parent = parent
+
+    def __repr__(self):  # pragma: no cover
+        return f'{self.__class__.__name__}(path={self.path!r})'
+
+    @property
+    def parent(self) -> Optional['Directory']:
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Optional['Directory']):
+        self._parent = value
+        self._depth = 0 if value is None else value.depth + 1
+
+    @property
+    def base_path(self) -> str:
+        return self._base_path if self._base_path is not None else self._parent.path
 
     @property
     def path(self) -> str:
         return os.path.join(self.base_path, self.name)
 
+    @property
+    def depth(self) -> int:
+        """
+        Cached when the parent is set, moving a whole subtree doesn't update the depth of its descendants.
+        """
+        return self._depth
+
     @property
     @abstractmethod
     def is_valid(self) -> bool:
         pass
 
 
-@dataclass
 class File(Item):
+    __slots__ = ()
     __INVALID_EXTENSIONS = ['txt', 'exe']
-    parent: Optional['Directory'] = None
 
     @property
     def is_valid(self) -> bool:
@@ -52,21 +105,41 @@ class File(Item):
         return retrieve_extension(self.name)
 
 
-@dataclass
 class Directory(Item):
+    """
+    The structural predicates (#can_be_season, #can_be_show, #has_only_files) are computed once and cached, so
+    #invalidate must be called after changing the `childs` of a directory.
+    """
+    __slots__ = ('childs', '_predicates')
     __SPECIAL_FOLDERS = ['subs', 'extras', 'samples']
-    parent: Optional['Directory'] = None
-    childs: List[Item] = field(default_factory=list)
 
-    @property
-    def depth(self) -> int:
-        return 0 if self.parent is None else self.parent.depth + 1
+    predicates_stats: Counter = Counter()
+
+    def __init__(
+            self,
+            name: str,
+            parent: Optional['Directory'] = None,
+            base_path: Optional[str] = None,
+            childs: Optional[List[Item]] = None,
+    ):
+        super().__init__(name=name, parent=parent, base_path=base_path)
+        self.childs: List[Item] = childs if childs is not None else []
+        self._predicates: Optional[Dict[Tuple, bool]] = None
 
     @property
     def is_valid(self) -> bool:
         return self.name.lower() not in self.__SPECIAL_FOLDERS
 
+    def invalidate(self):
+        """
+        Drops the cached predicates of the directory and all its ancestors, as they depend on its childs.
+        """
+        self._predicates = None
+        if self.parent is not None:
+            self.parent.invalidate()
+
     @property
+    @memoized
     def can_be_season(self) -> bool:
         return (
                 self.has_only_files(ignore_invalid=True)
@@ -74,6 +147,7 @@ class Directory(Item):
         )
 
     @property
+    @memoized
     def can_be_show(self) -> bool:
         """
         :return: Match if all items are files or seasons, and we have at least one directory (season) inside.
@@ -86,6 +160,7 @@ class Directory(Item):
             for i in self.childs
         ) and not self.has_only_files(ignore_invalid=True)
 
+    @memoized
     def has_only_files(self, ignore_invalid=False) -> bool:
         if ignore_invalid:
             return all(isinstance(i, File) or (isinstance(i, Directory) and not i.is_valid) for i in self.childs)
@@ -93,12 +168,26 @@ class Directory(Item):
 
     @staticmethod
     @apply_clean(clean_functions=[generic_clean, remove_tracker, remove_parenthesis, remove_episode, remove_extension])
-    def __items_can_share_season(items: Iterable[str]) -> bool:
+    def __items_can_share_season(items: List[str]) -> bool:
         """
-        Check if all files share enough similarity to be considered of the same season or all strings match 'S1E01'
+        Check if all files share enough similarity to be considered of the same season or all strings match 'S1E01'.
+
+        Each name is compared against the first one instead of against every other name, so the check is linear in the
+        number of files, and the cheap upper bounds of the ratio are used to stop at the first dissimilar name.
         :param items: list of files to check
         :return: bool expressing if the list can be considered a season
         """
-        ratios = [SequenceMatcher(None, i[0], i[1]).ratio() for i in itertools.permutations(items, 2)]
-        se = re.compile(r'^(S\d+E\d+|E\d+).*')  # probably a limit case
-        return all(r >= settings.SIMILARITY_THRESHOLD for r in ratios) or all(se.match(s) for s in items)
+        if all(SEASON_EPISODE_RE.match(s) for s in items):
+            return True
+
+        # SequenceMatcher caches the analysis of the second sequence, so the representative is only processed once
+        matcher = SequenceMatcher(None, b=items[0])
+        for item in items[1:]:
+            matcher.set_seq1(item)
+            if (
+                    matcher.real_quick_ratio() < settings.SIMILARITY_THRESHOLD
+                    or matcher.quick_ratio() < settings.SIMILARITY_THRESHOLD
+                    or matcher.ratio() < settings.SIMILARITY_THRESHOLD
+            ):
+                return False
+        return True
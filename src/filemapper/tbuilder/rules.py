@@ -0,0 +1,80 @@
+import fnmatch
+import os
+import re
+from typing import List
+from typing import Optional
+from typing import Pattern
+
+from src.core.types import Object
+from src.core.utils.strings import retrieve_extension
+
+
+class WalkRules(Object):
+    """
+    Rules applied while the tree is being built. Excluded entries are never created, so an excluded directory is not
+    listed at all and the tree looks as if it didn't exist.
+
+    Glob patterns are case-insensitive and are matched against the entry name, or against the path relative to the
+    tree root when they contain a path separator (i.e. 'Extras', '*.nfo', 'season */samples').
+    """
+
+    def __init__(
+            self,
+            include: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            extensions: Optional[List[str]] = None,
+            max_depth: Optional[int] = None,
+    ):
+        """
+        :param include: file globs, if any only the matching files are kept. Directories are always descended into.
+        :param exclude: file and directory globs to skip.
+        :param extensions: allowed file extensions.
+        :param max_depth: maximum depth of the files kept, being the root childs at depth 1. Deeper directories are not
+            listed.
+        """
+        self._include = self.__compile(include)
+        self._include_paths = self.__compile(include, paths=True)
+        self._exclude = self.__compile(exclude)
+        self._exclude_paths = self.__compile(exclude, paths=True)
+        self._extensions = {e.lower().lstrip('.') for e in extensions} if extensions else None
+        self._max_depth = max_depth
+
+    def __str__(self):  # pragma: no cover
+        return f'{self._class}(include={self._include}, exclude={self._exclude}, ' \
+               f'extensions={self._extensions}, max_depth={self._max_depth})'
+
+    def allows(self, name: str, base_path: str, depth: int, is_directory: bool) -> bool:
+        """
+        :param base_path: path of the entry parent relative to the tree root
+        :param depth: entry depth, being the root childs at depth 1
+        """
+        # the files of a directory are one level deeper
+        if self._max_depth is not None and depth + is_directory > self._max_depth:
+            return False
+        if self.__matches(self._exclude, self._exclude_paths, name, base_path):
+            return False
+        if is_directory:
+            return True
+
+        if self._extensions is not None and (retrieve_extension(name) or '').lower() not in self._extensions:
+            return False
+        if self._include is not None or self._include_paths is not None:
+            return self.__matches(self._include, self._include_paths, name, base_path)
+        return True
+
+    @staticmethod
+    def __matches(names: Optional[Pattern], paths: Optional[Pattern], name: str, base_path: str) -> bool:
+        return (
+                (names is not None and names.match(name) is not None)
+                or (paths is not None and paths.match(os.path.join(base_path, name)) is not None)
+        )
+
+    @staticmethod
+    def __compile(patterns: Optional[List[str]], paths: bool = False) -> Optional[Pattern]:
+        """
+        :return: a single regex matching any of the name (or path) globs
+        """
+        patterns = [p.replace('/', os.sep) for p in patterns or [] if ('/' in p or os.sep in p) == paths]
+        if not patterns:
+            return None
+        return re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in patterns), re.IGNORECASE)
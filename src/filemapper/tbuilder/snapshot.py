@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+Listing = List[Tuple[str, bool, bool, int]]  # (name, is_directory, is_symlink, inode) entries
+
+
+class Snapshot(Object):
+    """
+    On-disk index of the directory listings of a tree keyed by the directory path and its modification time.
+
+    A directory mtime only changes when entries are added, removed or renamed inside it, so a directory whose mtime
+    didn't change since the last run reuses the stored listing, costing a 'stat' instead of listing it again.
+    """
+    __SCHEMA_VERSION = 2
+
+    def __init__(self, path: str):
+        """
+        :param path: snapshot file path
+        """
+        self._path = path
+        self._stored: Dict[str, Tuple[int, Listing]] = {}
+        self._visited: Dict[str, Tuple[int, Listing]] = {}
+        self.stats = Counter()
+        self.__lock = threading.Lock()  # listings are read from the walk_jobs threads
+
+        if os.path.exists(path):
+            self.__load()
+
+    @classmethod
+    def for_library(cls, path: str) -> 'Snapshot':
+        """
+        :return: the snapshot stored next to the library folder in #path
+        """
+        path = path.rstrip(os.sep)
+        return cls(os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.snapshot'))
+
+    def listing(self, path: str, mtime_ns: int) -> Optional[Listing]:
+        """
+        :return: the stored listing of the directory if it didn't change since the snapshot was saved.
+        """
+        mtime, items = self._stored.get(path, (None, None))
+        if mtime != mtime_ns:
+            with self.__lock:
+                self.stats['misses'] += 1
+            return None
+
+        with self.__lock:
+            self.stats['hits'] += 1
+        return items
+
+    def update(self, path: str, mtime_ns: int, items: Listing):
+        self._visited[path] = (mtime_ns, items)
+
+    def save(self):
+        """
+        Stores the directories visited since the snapshot was loaded, dropping the ones that no longer exist.
+        """
+        logger.info(f'{self._class}:: saving :: {self._path} :: {dict(self.stats)}')
+        with sqlite3.connect(self._path) as connection:
+            connection.execute('DROP TABLE IF EXISTS directories')
+            connection.execute(self.__create_table_query())
+            connection.executemany(
+                'INSERT INTO directories VALUES (?, ?, ?)',
+                (
+                    (path, mtime, json.dumps(items, separators=(',', ':')))
+                    for path, (mtime, items) in self._visited.items()
+                )
+            )
+            connection.execute(f'PRAGMA user_version = {self.__SCHEMA_VERSION}')
+        connection.close()
+
+        self._stored, self._visited = self._visited, {}
+
+    def __load(self):
+        try:
+            with sqlite3.connect(self._path) as connection:
+                version = connection.execute('PRAGMA user_version').fetchone()[0]
+                if version != self.__SCHEMA_VERSION:
+                    logger.info(f'{self._class}:: discarding outdated snapshot :: {self._path}')
+                    return
+
+                for path, mtime, entries in connection.execute('SELECT * FROM directories'):
+                    self._stored[path] = (mtime, [tuple(e) for e in json.loads(entries)])
+            connection.close()
+        except sqlite3.DatabaseError as e:
+            logger.error(f'{self._class}:: discarding invalid snapshot :: {self._path} :: {e}')
+
+    @staticmethod
+    def __create_table_query() -> str:
+        return """\
+            CREATE TABLE directories (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                entries TEXT NOT NULL
+            )"""
@@ -1,12 +1,31 @@
+import logging
 import os
+import stat
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from src.core.types import Object
+from src.core.types import SymlinkPolicy
+from src.core.utils.timings import Timings
 from src.filemapper.tbuilder.models import Directory
 from src.filemapper.tbuilder.models import File
 from src.filemapper.tbuilder.models import Item
+from src.filemapper.tbuilder.rules import WalkRules
+from src.filemapper.tbuilder.snapshot import Listing
+from src.filemapper.tbuilder.snapshot import Snapshot
+
+logger = logging.getLogger()
+
+Identity = Tuple[int, int]  # (st_dev, st_ino)
+Scan = Tuple[Identity, List[Tuple[str, bool, Identity]]]  # directory identity and (name, is_directory, identity) items
 
 
 class Tree(ABC, Object):
@@ -43,11 +62,18 @@ class Tree(ABC, Object):
     def childs(self) -> List[Item]:
         pass
 
+    @abstractmethod
+    def walk(self) -> Iterator[Directory]:
+        """
+        Yields each directory as soon as all its subtree has been listed (bottom-up).
+        """
+        pass
+
 
 class _SimpleTree(Tree):
     _item: File
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, **_):
         self._item = File(base_path=os.path.dirname(path), name=os.path.basename(path), parent=None)
 
     @property
@@ -58,13 +84,46 @@ class _SimpleTree(Tree):
     def childs(self) -> List[Item]:
         return []
 
+    def walk(self) -> Iterator[Directory]:
+        return iter([])
+
 
 class _Tree(Tree):
     _item: Directory
 
-    def __init__(self, path: str):
+    def __init__(
+            self,
+            path: str,
+            walk_jobs: int = 1,
+            lazy: bool = False,
+            snapshot: Optional[Snapshot] = None,
+            rules: Optional[WalkRules] = None,
+            symlinks: SymlinkPolicy = SymlinkPolicy.FOLLOW,
+    ):
+        """
+        :param walk_jobs: number of directories listed concurrently, useful on high-latency (network) filesystems.
+        :param lazy: if True the tree is not built until it is walked, letting the caller start working with the
+            completed directories while the rest of the tree is still being listed. A lazy tree can only be walked once.
+        :param snapshot: listings of a previous run, only the directories modified since then are listed again. It is
+            saved once the tree is built.
+        :param rules: include/exclude rules applied while listing, excluded directories are not listed.
+        :param symlinks: whether symlinked files and directories are followed or skipped.
+
+        A directory or file reachable through several paths (symlinks, bind mounts or hard links) is only added to the
+        tree the first time it is found, which also prevents symlink loops. When listing concurrently which of the paths
+        is kept depends on the listing order.
+        """
         self._item = Directory(base_path=os.path.dirname(path), name=os.path.basename(path), parent=None)
-        self.__build(self._item)
+        self._walk_jobs = walk_jobs
+        self._snapshot = snapshot
+        self._rules = rules
+        self._symlinks = symlinks
+        self._visited: Set[Identity] = set()  # directories
+        self._files: Dict[int, Set[int]] = {}  # file inodes by device, only storing the inodes takes less memory
+        self._built = False
+        if not lazy:
+            for _ in self.walk():
+                pass
 
     @property
     def root(self) -> Directory:
@@ -74,14 +133,141 @@ class _Tree(Tree):
     def childs(self) -> List[Item]:
         return self._item.childs
 
-    def __build(self, directory: Directory):
-        for item in os.listdir(directory.path):
-            full_path = os.path.join(directory.path, item)
+    def walk(self) -> Iterator[Directory]:
+        if self._built:
+            yield from self.__post_order(self._item)
+            return
+
+        self._built = True
+        if self._walk_jobs > 1:
+            yield from self.__build_concurrently(self._item)
+        else:
+            yield from self.__build(self._item)
+
+        if self._snapshot is not None:
+            self._snapshot.save()
+
+    def __post_order(self, directory: Directory) -> Iterator[Directory]:
+        for subdirectory in [i for i in directory.childs if isinstance(i, Directory)]:
+            yield from self.__post_order(subdirectory)
+        yield directory
+
+    def __build(self, directory: Directory) -> Iterator[Directory]:
+        subdirectories = self.__populate(directory, self.__scan(directory.path))
+        if subdirectories is None:
+            return
+
+        for subdirectory in subdirectories:
+            yield from self.__build(subdirectory)
+        yield directory
+
+    def __build_concurrently(self, root: Directory) -> Iterator[Directory]:
+        with ThreadPoolExecutor(max_workers=self._walk_jobs) as executor:
+            yield from self.__build_prefetched(executor, root, executor.submit(self.__scan, root.path))
+
+    def __build_prefetched(
+            self, executor: ThreadPoolExecutor, directory: Directory, scan: Future
+    ) -> Iterator[Directory]:
+        """
+        Same as #__build but the listings of all the subdirectories run in the pool as soon as they are known. Nodes are
+        always created from this thread and in the same order as #__build, so the tree doesn't depend on which listing
+        completes first (i.e. which of two paths to the same directory is kept).
+        """
+        subdirectories = self.__populate(directory, scan.result())
+        if subdirectories is None:
+            return
+
+        scans = [executor.submit(self.__scan, s.path) for s in subdirectories]
+        for subdirectory, subdirectory_scan in zip(subdirectories, scans):
+            yield from self.__build_prefetched(executor, subdirectory, subdirectory_scan)
+        yield directory
+
+    @Timings().stage('tree.scan')
+    def __scan(self, path: str) -> Scan:
+        """
+        :return: the identity of the directory and the sorted files and directories found in the path.
+        """
+        # A change deep in the tree doesn't update the mtime of the ancestors, so each directory is checked on its
+        # own. The mtime is read before listing so a change made meanwhile is seen by the next run.
+        stats = os.stat(path)
+        if self._snapshot is None:
+            entries = self.__list(path)
+        else:
+            entries = self._snapshot.listing(path, stats.st_mtime_ns)
+            if entries is None:
+                entries = self.__list(path)
+            self._snapshot.update(path, stats.st_mtime_ns, entries)
+
+        return (stats.st_dev, stats.st_ino), self.__resolve(path, stats.st_dev, entries)
+
+    @staticmethod
+    def __list(path: str) -> Listing:
+        # DirEntry caches the d_type and inode returned by the directory listing, so the checks cost no extra 'stat'
+        # call (one is only issued for filesystems not reporting d_type).
+        items = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    items.append((entry.name, False, True, entry.inode()))
+                elif entry.is_file(follow_symlinks=False):
+                    items.append((entry.name, False, False, entry.inode()))
+                elif entry.is_dir(follow_symlinks=False):
+                    items.append((entry.name, True, False, entry.inode()))
+        return sorted(items)
+
+    def __resolve(self, path: str, device: int, entries: Listing) -> List[Tuple[str, bool, Identity]]:
+        """
+        Applies the symlink policy to the listing.
+        """
+        items = []
+        for name, is_directory, is_symlink, inode in entries:
+            if not is_symlink:
+                items.append((name, is_directory, (device, inode)))
+                continue
+            if self._symlinks == SymlinkPolicy.SKIP:
+                continue
+
+            # the link target can change without changing the directory, so it is never taken from the snapshot
+            try:
+                stats = os.stat(os.path.join(path, name))
+            except OSError:  # broken link
+                continue
+            if stat.S_ISDIR(stats.st_mode) or stat.S_ISREG(stats.st_mode):
+                items.append((name, stat.S_ISDIR(stats.st_mode), (stats.st_dev, stats.st_ino)))
+        return items
+
+    def __populate(self, directory: Directory, scan: Scan) -> Optional[List[Directory]]:
+        """
+        Creates the child nodes of the directory allowed by the walk rules.
+        :return: the new subdirectories or None if the directory was already in the tree, removing it.
+        """
+        identity, items = scan
+        if identity in self._visited:
+            logger.info(f'{self._class}:: already visited :: {directory.path}')
+            directory.parent.childs.remove(directory)
+            directory.parent.invalidate()
+            return None
+        self._visited.add(identity)
+
+        if self._rules is not None:
+            depth = directory.depth + 1
+            base_path = os.path.relpath(directory.path, self._item.path) if directory is not self._item else ''
+            items = [(n, d, i) for n, d, i in items if self._rules.allows(n, base_path, depth, is_directory=d)]
+
+        subdirectories = []
+        for name, is_directory, (device, inode) in items:
+            if is_directory:
+                subdirectory = Directory(name=name, parent=directory)
+                subdirectories.append(subdirectory)
+                directory.childs.append(subdirectory)
+                continue
 
-            if os.path.isfile(full_path):
-                directory.childs.append(File(base_path=directory.path, name=item, parent=directory))
+            inodes = self._files.setdefault(device, set())
+            if inode in inodes:
+                logger.info(f'{self._class}:: already visited :: {os.path.join(directory.path, name)}')
                 continue
+            inodes.add(inode)
+            directory.childs.append(File(name=name, parent=directory))
 
-            new_directory = Directory(base_path=directory.path, name=item, parent=directory)
-            self.__build(new_directory)
-            directory.childs.append(new_directory)
+        directory.invalidate()
+        return subdirectories
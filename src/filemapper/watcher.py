@@ -0,0 +1,228 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC
+from abc import abstractmethod
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from src.core.types import Object
+
+logger = logging.getLogger()
+
+
+class Watcher(ABC, Object):
+    """
+    Reports the top-level entries of a folder where new content arrived, once no more changes are seen on them for a
+    while (i.e. the downloads settled).
+
+    Only new or modified files and directories count as arrivals, entries renamed inside the folder don't. This keeps
+    the renames done by the engine from being reported again.
+    """
+
+    def __new__(cls, *args, **kwargs):  # pragma: no cover
+        if _InotifyWatcher.is_supported():
+            return object.__new__(_InotifyWatcher)
+        return object.__new__(_PollingWatcher)
+
+    def __init__(self, path: str, settle: float = 60, interval: float = 5):
+        """
+        :param settle: seconds without changes before an entry is reported
+        :param interval: seconds between scans when the filesystem events are not available
+        """
+        self._path = path
+        self._settle = settle
+        self._interval = interval
+        self._pending: Dict[str, float] = {}  # last change time by top-level entry
+
+    def changes(self) -> Iterator[List[str]]:
+        """
+        Blocks until some entries settle.
+        :return: sorted paths of the settled top-level entries
+        """
+        while True:
+            now = time.monotonic()
+            timeout = min((t + self._settle - now for t in self._pending.values()), default=None)
+            self._poll(max(timeout, 0) if timeout is not None else None)
+
+            now = time.monotonic()
+            settled = sorted(e for e, t in self._pending.items() if now - t >= self._settle)
+            if settled:
+                for entry in settled:
+                    del self._pending[entry]
+                logger.info(f'{self._class}:: settled :: {settled}')
+                yield [os.path.join(self._path, e) for e in settled]
+
+    def close(self):
+        pass
+
+    @abstractmethod
+    def _poll(self, timeout: Optional[float]):
+        """
+        Waits up to #timeout seconds (forever if None) for changes and records them.
+        """
+        pass
+
+    def _entry(self, path: str) -> str:
+        """
+        :return: the top-level entry containing the path
+        """
+        return os.path.relpath(path, self._path).split(os.sep)[0]
+
+    def _touch(self, path: str):
+        self._pending[self._entry(path)] = time.monotonic()
+
+    def _move(self, source: str, target: str):
+        # A pending entry renamed before settling (i.e. 'download.part' -> 'download.mkv') keeps pending as the new one
+        source, target = self._entry(source), self._entry(target)
+        if source != target and source in self._pending:
+            del self._pending[source]
+            self._pending[target] = time.monotonic()
+
+
+class _InotifyWatcher(Watcher):
+    __IN_MODIFY = 0x00000002
+    __IN_CLOSE_WRITE = 0x00000008
+    __IN_MOVED_FROM = 0x00000040
+    __IN_MOVED_TO = 0x00000080
+    __IN_CREATE = 0x00000100
+    __IN_Q_OVERFLOW = 0x00004000
+    __IN_IGNORED = 0x00008000
+    __IN_ONLYDIR = 0x01000000
+    __IN_ISDIR = 0x40000000
+    __MASK = __IN_MODIFY | __IN_CLOSE_WRITE | __IN_MOVED_FROM | __IN_MOVED_TO | __IN_CREATE | __IN_ONLYDIR
+
+    __EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+    __libc = None
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        if cls.__libc is None:
+            cls.__libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        return hasattr(cls.__libc, 'inotify_init1')
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._fd = self.__libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+        self._watches: Dict[int, str] = {}  # watched directory by watch descriptor
+        self.__watch(path)
+
+    def close(self):
+        os.close(self._fd)
+
+    def _poll(self, timeout: Optional[float]):
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return
+
+        moves: Dict[int, Tuple[str, bool]] = {}  # moved out paths by cookie
+        for wd, mask, cookie, name in self.__read():
+            if mask & self.__IN_Q_OVERFLOW:
+                logger.info(f'{self._class}:: events overflow')
+                [self._touch(e.path) for e in os.scandir(self._path)]
+                continue
+            if mask & self.__IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if wd not in self._watches:
+                continue
+
+            path = os.path.join(self._watches[wd], name)
+            is_directory = bool(mask & self.__IN_ISDIR)
+            if mask & self.__IN_MOVED_FROM:
+                moves[cookie] = (path, is_directory)
+            elif mask & self.__IN_MOVED_TO and cookie in moves:
+                self.__moved(moves.pop(cookie)[0], path, is_directory)
+            else:
+                if is_directory:  # the directory content may be there before it is watched
+                    self.__watch(path)
+                self._touch(path)
+
+        # Both halves of a move are queued together, so the unmatched ones were moved out of the folder
+        for path, is_directory in moves.values():
+            if is_directory:
+                self.__unwatch(path)
+
+    def __read(self) -> Iterator[Tuple[int, int, int, str]]:
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, cookie, length = self.__EVENT.unpack_from(buffer, offset)
+            offset += self.__EVENT.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            yield wd, mask, cookie, name
+
+    def __watch(self, path: str):
+        """
+        Watches the directory and all its subdirectories.
+        """
+        for directory, _, _ in os.walk(path):
+            wd = self.__libc.inotify_add_watch(self._fd, os.fsencode(directory), self.__MASK)
+            if wd >= 0:
+                self._watches[wd] = directory
+
+    def __unwatch(self, path: str):
+        for wd, directory in list(self._watches.items()):
+            if directory == path or directory.startswith(path + os.sep):
+                self.__libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    def __moved(self, source: str, target: str, is_directory: bool):
+        if is_directory:
+            # watches follow the moved directory, only their paths change
+            for wd, directory in self._watches.items():
+                if directory == source or directory.startswith(source + os.sep):
+                    self._watches[wd] = target + directory[len(source):]
+        self._move(source, target)
+
+
+class _PollingWatcher(Watcher):
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._files = self.__scan()
+
+    def _poll(self, timeout: Optional[float]):
+        time.sleep(min(timeout, self._interval) if timeout is not None else self._interval)
+
+        # Files are tracked by inode so a rename is not seen as a new file
+        files = self.__scan()
+        for inode, (path, stamp) in files.items():
+            previous = self._files.get(inode)
+            if previous is None or previous[1] != stamp:
+                self._touch(path)
+            elif previous[0] != path:
+                self._move(previous[0], path)
+        self._files = files
+
+    def __scan(self) -> Dict[Tuple[int, int], Tuple[str, Tuple[int, int]]]:
+        """
+        :return: (path, (size, mtime)) of the files by inode
+        """
+        files = {}
+        for directory, _, names in os.walk(self._path):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path, follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                files[(stat.st_dev, stat.st_ino)] = (path, (stat.st_size, stat.st_mtime_ns))
+        return files
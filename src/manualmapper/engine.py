@@ -5,9 +5,6 @@ import re
 from typing import List
 from typing import Optional
 
-import inquirer
-from polyglot.text import Text
-
 from src import runner
 from src import settings
 from src.core.matchers import AnimeTypeMatcher
@@ -22,11 +19,11 @@ from src.core.types import MediaType
 from src.core.types import Object
 from src.core.types import PathType
 from src.core.types import SubtitleAction
+from src.core.utils.language import LanguageDetector
 from src.manualmapper.loader import load_media_item
 from src.manualmapper.loader import load_subtitle_files
 from src.manualmapper.logger import OutputLog
 from src.manualmapper.processors import Processor
-from src.manualmapper.processors import SubsProcessor
 
 logger = logging.getLogger()
 
@@ -51,7 +48,7 @@ class Engine(Object):
         self.__common_configuration()
         parser = Parser(media_type=runner.media_type)
         processor: Processor = Processor(media_type=runner.media_type)
-        subtitles: Optional[SubsProcessor] = None
+        subtitles: Optional[Processor] = None
 
         self.__item = ParsedInfo.parse(load_media_item(self.__path, path_type=runner.path_type), parser)
         self.__item.media_type = runner.media_type
@@ -59,8 +56,10 @@ class Engine(Object):
         # load and parse subtitle files if required
         subs: List[SubsFile] = []
         if runner.subs_acton:
-            subtitles = SubsProcessor(media_type=MediaType.SUBS)
-            subs = [ParsedInfo.parse(s, parser) for s in load_subtitle_files(self.__path)]
+            subtitles = Processor(media_type=MediaType.SUBS)
+            subs = load_subtitle_files(self.__path)
+            for sub, parsed in zip(subs, parser.parse_many(subs)):
+                sub.parsed = parsed
             subtitles.process(subs=subs, episodes=[e for e in self.__item.flatten() if isinstance(e, Episode)])
 
         # init the logger with the items we will be mapping
@@ -76,6 +75,8 @@ class Engine(Object):
         OutputLog().log(self.__item, to='output.csv')
 
     def undo(self, forced=False):
+        import inquirer  # slow to import, only needed to confirm
+
         path = self.__path if 'output.csv' in self.__path else os.path.join(self.__path, 'output.csv')
         with open(path) as file:
             reader = csv.reader(file, delimiter=',')
@@ -88,6 +89,8 @@ class Engine(Object):
     ########################
 
     def __common_configuration(self):
+        import inquirer  # slow to import, not needed to undo
+
         logger.debug(f'{self._class}:: running pre-configuration')
 
         answers = inquirer.prompt([
@@ -129,7 +132,7 @@ class Engine(Object):
     ########################
 
     def __language(self, item_name: str) -> Language:
-        lang = Text(item_name).language.code
+        lang = LanguageDetector().detect(item_name)
         lang = lang if lang in Language.__members__.values() else DEFAULT_LANGUAGE.value
 
         logger.debug(f'{self._class}:: {item_name} :: using language :: {lang}')
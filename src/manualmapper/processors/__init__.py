@@ -1,7 +1,5 @@
 from src.manualmapper.processors._processor import Processor
-from src.manualmapper.processors.anime import AnimeProcessor
-from src.manualmapper.processors.subs import SubsProcessor
 
 __all__ = [
-    Processor, SubsProcessor
+    Processor
 ]
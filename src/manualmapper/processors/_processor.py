@@ -1,3 +1,4 @@
+import importlib
 import logging
 from abc import ABC
 from abc import abstractmethod
@@ -11,6 +12,10 @@ logger = logging.getLogger()
 
 class Processor(ABC, Object):
     _registry = {}
+    _modules = {
+        MediaType.ANIME: 'src.manualmapper.processors.anime',
+        MediaType.SUBS: 'src.manualmapper.processors.subs',
+    }
 
     _formatter: Formatter
     _media_type: MediaType
@@ -30,6 +35,8 @@ class Processor(ABC, Object):
         cls._registry[media_type] = cls
 
     def __new__(cls, media_type: MediaType, **kwargs):  # pragma: no cover
+        if media_type not in cls._registry:  # implementations, and their dependencies, are imported on first use
+            importlib.import_module(cls._modules[media_type])
         subclass = cls._registry[media_type]
         final_obj = object.__new__(subclass)
         final_obj._formatter = Formatter(media_type=media_type)
@@ -1,18 +1,24 @@
-from environs import Env
+import os
+
+from dotenv import find_dotenv
+from dotenv import load_dotenv
 
 from src.core.types import DatasourceName
 
-env = Env()
-env.read_env()
+load_dotenv(find_dotenv())  # searched from this directory up
 
 # Testing flags
 DEBUG = False
 ENABLE_PROFILE = False
 
 # Application configurations
-MAL_CLIENT_ID = env.str('MAL_CLIENT_ID', '')
-IMDB_API_KEY = env.str('IMDB_API_KEY', '')
+MAL_CLIENT_ID = os.environ.get('MAL_CLIENT_ID', '')
+IMDB_API_KEY = os.environ.get('IMDB_API_KEY', '')
 SIMILARITY_THRESHOLD = 0.9
+CACHE_DIR = os.environ.get(
+    'FILE_MAPPER_CACHE_DIR',
+    os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'file-mapper'),
+)
 
 DATASOURCE_WEIGHT = {
     DatasourceName.MAL: 100,
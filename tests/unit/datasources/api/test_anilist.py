@@ -0,0 +1,71 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import aiohttp
+from aioresponses import aioresponses
+
+from src.core.datasources import datasource
+from src.core.datasources.api import AnilistAPI
+from src.core.types import Language
+
+
+class TestAnilistAPI(unittest.TestCase):
+    content = {
+        'data': {'Page': {'media': [{'id': 1, 'title': {'romaji': 'Ahiru no Sora', 'english': 'Ahiru no Sora'}}]}}
+    }
+
+    def test_search_is_cached(self):
+        api = AnilistAPI()
+        response = mock.Mock(status_code=200, content=json.dumps(self.content))
+        with mock.patch.object(AnilistAPI, '_session') as session:
+            session.post.return_value = response
+            first = api.search_anime('Ahiru no Sora', Language.JA, 1, None)
+            second = api.search_anime('Ahiru no Sora', Language.JA, 1, None)
+            api.search_anime('Ahiru no Sora', Language.EN, 1, None)
+
+        self.assertIs(first, second)
+        self.assertEqual('Ahiru no Sora', first.title)
+        self.assertEqual(2, session.post.call_count)
+
+    def test_empty_searches_are_retried(self):
+        api = AnilistAPI()
+        empty = mock.Mock(status_code=200, content=json.dumps({'data': {'Page': {'media': []}}}))
+        with mock.patch.object(AnilistAPI, '_session') as session:
+            session.post.return_value = empty
+            self.assertIsNone(api.search_anime('Ahiru no Sora', Language.JA, 1, None))
+            session.post.return_value = mock.Mock(status_code=200, content=json.dumps(self.content))
+            self.assertEqual('Ahiru no Sora', api.search_anime('Ahiru no Sora', Language.JA, 1, None).title)
+
+        self.assertEqual(2, session.post.call_count)
+
+    def test_concurrent_searches_are_bounded(self):
+        def search(index: int):
+            return api.search_anime(f'Ahiru no Sora {index % 32}', Language.JA, 1, None)
+
+        api = AnilistAPI()
+        response = mock.Mock(status_code=200, content=json.dumps(self.content))
+        with mock.patch.object(AnilistAPI, '_session') as session, mock.patch.object(datasource, '_SEARCHES_SIZE', 8):
+            session.post.return_value = response
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(search, range(2000)))
+
+        self.assertTrue(all(r.title == 'Ahiru no Sora' for r in results))
+        self.assertEqual(8, len(api._searches))
+
+    def test_search_async_shares_the_cache(self):
+        async def search():
+            async with aiohttp.ClientSession() as session:
+                return await api.search_anime_async(session, 'Ahiru no Sora', Language.JA, 1, None)
+
+        api = AnilistAPI()
+        with aioresponses() as responses:
+            responses.post(AnilistAPI.BASE_URL, payload=self.content)
+            metadata = asyncio.run(search())
+            self.assertIs(metadata, asyncio.run(search()))  # only one response is mocked
+
+        with mock.patch.object(AnilistAPI, '_session') as session:
+            self.assertIs(metadata, api.search_anime('Ahiru no Sora', Language.JA, 1, None))
+            session.post.assert_not_called()
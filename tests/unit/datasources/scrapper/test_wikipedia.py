@@ -1,7 +1,9 @@
+import asyncio
 import os
 import re
 import unittest
 
+import aiohttp
 from aioresponses import aioresponses
 
 from src.core.datasources.scrapper import WikipediaScrapper
@@ -48,6 +50,30 @@ class TestWikipediaScrapper(unittest.TestCase):
         assert isinstance(metadata, AnimeMetadata)
         self.assertEqual(metadata.episode_name, 'CASE1_1: Los Angeles Connection')
 
+    @aioresponses()
+    def test_load_from_episode_page_async(self, mocked_response):
+        data = load_page(os.path.join(settings.WIKIPEDIA_FIXTURES_DIR, 'episode_page_great_pretender.html'))
+        mocked_response.get(re.compile('.*'), status=200, body=data)
+
+        self.episode.parsed = ParsedInfo(
+            episode=1,
+            season=1,
+            episode_part=None,
+            season_name=None,
+            media_title='',
+            extension=None
+        )
+
+        async def fill():
+            async with aiohttp.ClientSession() as session:
+                await WikipediaScrapper().fill_names_async(self.episode, session)
+
+        asyncio.run(fill())
+
+        metadata = self.episode.metadata
+        assert isinstance(metadata, AnimeMetadata)
+        self.assertEqual(metadata.episode_name, 'CASE1_1: Los Angeles Connection')
+
     @aioresponses()
     def test_load_from_main_page(self, mocked_response):
         data = load_page(os.path.join(settings.WIKIPEDIA_FIXTURES_DIR, 'main_page_ahiru_no_sora.html'))
@@ -0,0 +1,93 @@
+import unittest
+from typing import List
+from typing import Tuple
+from unittest import mock
+
+from src.core.parsers import Parser
+from src.core.parsers.lexer import ReleaseName
+from src.core.parsers.lexer import TokenType
+from src.core.types import MediaType
+from tests.factories import EpisodeFactory
+from tests.factories import SeasonFactory
+from tests.factories import ShowFactory
+
+
+# noinspection LongLine
+class TestLexer(unittest.TestCase):
+    episode_names = [
+        '[Judas] Ahiru no Sora - S01E01.mkv',
+        '[Cleo]Great_Pretender_-_02_(Dual Audio_10bit_1080p_x265).mkv',
+        '[SubsPlease] Tate no Yuusha no Nariagari S2 - 08 (1080p) [1B2526A8].mkv',
+        '[Anipakku] Overlord E01.mkv',
+        'The Case Study of Vanitas S01E12.5-Recap [E94DA148].mkv',
+        'Great Pretender (1) - 03.ass',
+        'Mr.Robot H.264 [x]05 (TV)',  # a longer extension once the tag is removed
+        'Show (a[x]b) 01.mkv',  # a new parenthesis once the tag is removed
+    ]
+    season_names = [
+        'Kobayashi-san Chi no Maid Dragon [v3][1080]',
+        'Great Pretender',
+        'Seikon no Qwaser II',
+        '[Judas] Tate no Yuusha no Noriagari (The Rising of the Shield Hero) (Season 2) [1080p][HEVC x265 10bit][Multi-Subs]',
+    ]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.parser = Parser(media_type=MediaType.ANIME)
+
+    def test_tokens(self):
+        name = ReleaseName('[SubsPlease] Tate no Yuusha no Nariagari S2 - 08 (1080p) [1B2526A8].mkv')
+        self.assertEqual(name.name, ''.join(t.text for t in name.tokens))
+        expected: List[Tuple[TokenType, str]] = [
+            (TokenType.GROUP, '[SubsPlease]'),
+            (TokenType.SEASON, 'S2'),
+            (TokenType.SEPARATOR, '-'),
+            (TokenType.NUMBER, '08'),
+            (TokenType.QUALITY, '(1080p)'),
+            (TokenType.CRC, '[1B2526A8]'),
+            (TokenType.EXTENSION, '.mkv'),
+        ]
+        self.assertEqual(expected, [t for t in name.tokens if t.type not in (TokenType.WORD, TokenType.SPACE)])
+        self.assertEqual('Tate no Yuusha no Nariagari S2 - 08', name.untagged)
+        self.assertEqual('Tate no Yuusha no Nariagari S2 - 08 (1080p)', name.unbracketed)
+        self.assertEqual('mkv', name.extension)
+
+        name = ReleaseName('The Case Study of Vanitas S01E12.5-Recap [E94DA148].mkv')
+        self.assertIn((TokenType.SEASON, 'S01'), name.tokens)
+        self.assertIn((TokenType.PART, 'E12.5'), name.tokens)
+
+    def test_parity(self):
+        items = [(EpisodeFactory, n) for n in self.episode_names]
+        items += [(f, n) for n in self.season_names + self.episode_names for f in [SeasonFactory, ShowFactory]]
+        for factory, name in items:
+            with self.subTest(name=f'{factory.__name__}:: {name}'):
+                item = factory.create(item_name=name)
+                self.assertEqual(Parser.parsed_info(self.parser, item), self.parser.parsed_info(item))
+
+    def test_shared_scans(self):
+        scans = {}
+        first = ReleaseName('[Judas] Show - S01E01 [x263].mkv', scans=scans)
+        second = ReleaseName('[Judas] Show - S01E12 [x264].mkv', scans=scans)
+        ReleaseName('Great Pretender (1) - 03.ass', scans=scans)
+        self.assertEqual(2, len(scans))
+        self.assertEqual(('Show - S01E01', 'Show - S01E12'), (first.untagged, second.untagged))
+        self.assertEqual((TokenType.TAG, TokenType.QUALITY), (first.tokens[-2].type, second.tokens[-2].type))
+
+    def test_parse_many(self):
+        names = [n.replace('01', f'{e:02d}') for e in range(1, 13) for n in self.episode_names]
+        items = [EpisodeFactory.create(item_name=n) for n in names]
+        self.assertEqual([Parser.parsed_info(self.parser, i) for i in items], self.parser.parse_many(items))
+
+    def test_unstable_names_are_parsed_field_by_field(self):
+        self.assertTrue(ReleaseName(self.episode_names[0]).is_stable)
+        self.assertFalse(ReleaseName('Show (a[x]b) 01.mkv').is_stable)
+        self.assertFalse(ReleaseName('Show H.264(1080p)E05').is_stable)
+
+        with mock.patch.object(Parser, 'parsed_info') as field_by_field:
+            self.parser.parsed_info(EpisodeFactory.create(item_name='Show H.264(1080p)E05'))
+            self.parser.parsed_info(EpisodeFactory.create(item_name=self.episode_names[0]))
+            self.assertEqual(1, field_by_field.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.core.models import ParsedInfo
+from src.core.models import Season
+from src.core.models import Show
+from src.core.parsers import Parser
+from src.core.types import Language
+from src.core.types import MediaType
+from src.filemapper.cache import ParseCache
+from src.filemapper.engine import Engine
+from src.filemapper.tbuilder import Tree
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.directory.name, 'parsed.sqlite')
+        self.show_path = os.path.join(self.directory.name, '[Judas] Ahiru no Sora')
+        self.season_path = os.path.join(self.show_path, '[Judas] Ahiru no Sora (Season 1)')
+        os.makedirs(self.season_path)
+        self.__add_episodes(1, 2)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_parses_the_new_childs(self):
+        cache = ParseCache(self.cache_file)
+        self.assertFalse(cache.restore(self.__season()))
+        cache.store(Engine._classify(self.__season()))
+        cache.close()
+
+        self.__add_episodes(3)
+        expected = Engine._classify(self.__season())
+        cache = ParseCache(self.cache_file)
+        season = self.__season()
+        with mock.patch.object(ParsedInfo, 'parse') as parse, mock.patch.object(Engine, '_classify') as classify:
+            self.assertTrue(cache.restore(season))
+            parse.assert_not_called()
+            classify.assert_not_called()
+
+        self.assertEqual(MediaType.ANIME, season.media_type)
+        self.assertEqual(Language.JA, season.language)
+        self.assertEqual(
+            [(i.item_name, i.media_type, i.language, i.parsed) for i in expected.flatten()],
+            [(i.item_name, i.media_type, i.language, i.parsed) for i in season.flatten()],
+        )
+
+        with mock.patch.object(type(Parser(media_type=MediaType.ANIME)), 'parse_many') as parse_many:
+            self.assertTrue(cache.restore(self.__season()))
+            parse_many.assert_not_called()
+
+    def test_childs_are_not_restored_as_items(self):
+        cache = ParseCache(self.cache_file)
+        show = Engine._classify(Show.from_directory(Tree(path=self.show_path).root))
+        self.assertIsNone(show.seasons[0].language)
+        cache.store(show)
+
+        self.assertFalse(cache.restore(self.__season()))  # only the show got a language
+        self.assertTrue(cache.restore(Show.from_directory(Tree(path=self.show_path).root)))
+
+    def test_discards_the_results_of_other_parsers(self):
+        cache = ParseCache(self.cache_file)
+        cache.store(Engine._classify(self.__season()))
+        cache.close()
+        self.assertTrue(ParseCache(self.cache_file).restore(self.__season()))
+
+        with mock.patch('src.filemapper.cache.parser_version', return_value='changed'):
+            self.assertFalse(ParseCache(self.cache_file).restore(self.__season()))
+
+    def __add_episodes(self, *episodes: int):
+        for episode in episodes:
+            open(os.path.join(self.season_path, f'[Judas] Ahiru no Sora - S01E{episode:02d}.mkv'), 'w').close()
+
+    def __season(self) -> Season:
+        return Season.from_directory(Tree(path=self.season_path).root)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+from typing import List
+from typing import Tuple
+from unittest import mock
+
+from src import runner
+from src.core.models import VirtualSeason
+from src.core.utils.timings import Timings
+from src.filemapper.cache import ParseCache
+from src.filemapper.engine import AsyncEngine
+from src.filemapper.engine import Engine
+from src.filemapper.journal import Journal
+
+
+class TestEngine(unittest.TestCase):
+    library = {
+        'Hajime no Ippo/season 1': ['S1E01.mkv', 'S1E02.mkv'],
+        'Hajime no Ippo/season 2': ['S2E01.mkv', 'S2E02.mkv'],
+        '[Judas] Ahiru no Sora (Season 1)': [
+            '[Judas] Ahiru no Sora - S01E01.mkv', '[Judas] Ahiru no Sora - S01E02.mkv',
+        ],
+        'Overlord/[Anipakku] Overlord II': ['[Anipakku] Overlord II 01.mkv', '[Anipakku] Overlord II 02.mkv'],
+        'Overlord/[Anipakku] Overlord II/extras': ['Opening.mkv'],
+        '': ['[Cleo]Great_Pretender_-_02_(Dual Audio_10bit_1080p_x265).mkv', 'notes.txt'],
+    }
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        for folder, files in self.library.items():
+            os.makedirs(os.path.join(self.directory.name, folder), exist_ok=True)
+            for file in files:
+                open(os.path.join(self.directory.name, folder, file), 'w').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        runner.media_type = runner.language = None
+
+    def test_handles_the_same_items(self):
+        expected = [
+            ('process_episode', '[Cleo]Great_Pretender_-_02_(Dual Audio_10bit_1080p_x265).mkv'),
+            ('process_season', '[Anipakku] Overlord II'),
+            ('process_season', '[Judas] Ahiru no Sora (Season 1)'),
+            ('process_show', 'Hajime no Ippo'),
+        ]
+        self.assertEqual(expected, sorted(self.__run(streaming=False)))
+        self.assertEqual(expected, sorted(self.__run(streaming=True)))
+        self.assertEqual(expected, sorted(self.__run(streaming=True, walk_jobs=4)))
+        self.assertEqual(expected, sorted(self.__run(jobs=4)))
+        self.assertEqual(expected, sorted(self.__run(streaming=True, jobs=4)))
+        self.assertEqual(expected, sorted(self.__run(cpu_jobs=2)))
+        self.assertEqual(sorted(n for _, n in expected), sorted(self.__run_async()))
+        self.assertEqual(sorted(n for _, n in expected), sorted(self.__run_async(walk_jobs=4)))
+
+    def test_groups_loose_files(self):
+        for file in ['[Cleo]Great_Pretender_-_03_(Dual Audio_10bit_1080p_x265).mkv', '[Judas] Ahiru no Sora - 01.mkv']:
+            open(os.path.join(self.directory.name, file), 'w').close()
+
+        with mock.patch('src.filemapper.engine.Processor') as processor:
+            Engine(self.directory.name, media_type='anime', language='ja').run()
+            calls = {c[1][0].item_name: c for c in processor.return_value.method_calls}
+
+        self.assertEqual('process_episode', calls['[Judas] Ahiru no Sora - 01.mkv'][0])
+        name, (season,), _ = calls[os.path.basename(self.directory.name)]
+        self.assertEqual('process_season', name)
+        self.assertIsInstance(season, VirtualSeason)
+        self.assertEqual(self.directory.name, season.path)
+        self.assertEqual('Great Pretender', season.parsed.media_title)
+        self.assertEqual(
+            [
+                '[Cleo]Great_Pretender_-_02_(Dual Audio_10bit_1080p_x265).mkv',
+                '[Cleo]Great_Pretender_-_03_(Dual Audio_10bit_1080p_x265).mkv',
+            ],
+            [e.item_name for e in season.episodes],
+        )
+        self.assertTrue(all(e.season is season for e in season.episodes))
+
+    def test_classifies_in_processes(self):
+        for file in ['[Cleo]Great_Pretender_-_03_(Dual Audio_10bit_1080p_x265).mkv', '[Judas] Ahiru no Sora - 01.mkv']:
+            open(os.path.join(self.directory.name, file), 'w').close()
+
+        def parsed(**kwargs):
+            with mock.patch('src.filemapper.engine.Processor') as processor:
+                Engine(self.directory.name, media_type='anime', **kwargs).run()
+                items = [c[1][0] for c in processor.return_value.method_calls]
+            return sorted((i.path, i.media_type, i.language, i.parsed) for m in items for i in m.flatten())
+
+        self.assertEqual(parsed(), parsed(cpu_jobs=2))
+
+    def test_reuses_the_cached_parsing(self):
+        def parsed(**kwargs):
+            with mock.patch('src.filemapper.engine.Processor') as processor:
+                Engine(self.directory.name, media_type='anime', **kwargs).run()
+                items = [c[1][0] for c in processor.return_value.method_calls]
+            return sorted((i.path, i.media_type, i.language, i.parsed) for m in items for i in m.flatten())
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            cache_file = os.path.join(cache_directory, 'parsed.sqlite')
+            expected = parsed()
+
+            cache = ParseCache(cache_file)
+            self.assertEqual(expected, parsed(parse_cache=cache))
+            cache.close()
+            with mock.patch.object(Engine, '_classify') as classify:
+                for cpu_jobs in [1, 2]:
+                    cache = ParseCache(cache_file)
+                    self.assertEqual(expected, parsed(parse_cache=cache, cpu_jobs=cpu_jobs))
+                    self.assertEqual({'hits': 4}, dict(cache.stats))
+                    cache.close()
+                classify.assert_not_called()
+
+    def test_skips_the_done_items(self):
+        with tempfile.TemporaryDirectory() as journal_directory:
+            journal_file = os.path.join(journal_directory, 'journal')
+            self.assertEqual(4, len(self.__run(journal=Journal(journal_file))))
+            self.assertEqual([], self.__run(journal=Journal(journal_file, resume=True)))
+            self.assertEqual(4, len(self.__run(journal=Journal(journal_file))))
+
+    def test_handles_many_paths(self):
+        paths = [
+            os.path.join(self.directory.name, 'Hajime no Ippo'),
+            os.path.join(self.directory.name, '[Judas] Ahiru no Sora (Season 1)'),
+            os.path.join(self.directory.name, 'Hajime no Ippo', 'season 1'),  # inside another path
+            os.path.join(self.directory.name, 'missing'),
+        ]
+        with mock.patch('src.filemapper.engine.Processor') as processor:
+            with self.assertRaises(FileNotFoundError):  # raised once the other paths are handled
+                Engine(paths, media_type='anime', language='ja').run()
+            calls = [(c[0], c[1][0].item_name) for c in processor.return_value.method_calls]
+
+        self.assertEqual(1, processor.call_count)  # shared by all the paths
+        self.assertEqual(
+            [('process_show', 'Hajime no Ippo'), ('process_season', '[Judas] Ahiru no Sora (Season 1)')],
+            calls,
+        )
+
+    def test_records_the_stage_timings(self):
+        self.__run()
+        summary = Timings().summary()
+        self.assertEqual({'classify', 'language', 'parse', 'tree', 'tree.scan'}, set(summary.keys()))
+        self.assertEqual(8, summary['tree.scan']['count'])  # one per directory
+
+    def __run(self, **kwargs) -> List[Tuple[str, str]]:
+        with mock.patch('src.filemapper.engine.Processor') as processor:
+            Engine(self.directory.name, media_type='anime', language='ja', **kwargs).run()
+            return [(c[0], c[1][0].item_name) for c in processor.return_value.method_calls]
+
+    def __run_async(self, **kwargs) -> List[str]:
+        with mock.patch('src.filemapper.engine.Processor') as processor:
+            processor.return_value.process_async = mock.AsyncMock()
+            AsyncEngine(self.directory.name, media_type='anime', language='ja', **kwargs).run()
+            return [c[0][0].item_name for c in processor.return_value.process_async.await_args_list]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from typing import Tuple
+from unittest import mock
+
+from src.core.datasources.models import MalData
+from src.core.models import Season
+from src.core.models.metadata import AnimeMetadata
+from src.core.types import DatasourceName
+from src.core.types import Language
+from src.core.types import MediaType
+from src.filemapper.journal import Journal
+from src.filemapper.processors import Processor
+from src.filemapper.tbuilder import Tree
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.library = os.path.join(self.directory.name, 'library')
+        self.season_path = os.path.join(self.library, '[Judas] Ahiru no Sora (Season 1)')
+        os.makedirs(self.season_path)
+        for file in ['[Judas] Ahiru no Sora - S01E01.mkv', '[Judas] Ahiru no Sora - S01E02.mkv']:
+            open(os.path.join(self.season_path, file), 'w').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_resumes_an_interrupted_run(self):
+        journal = Journal.for_library(self.library)
+        processor, season = self.__season(journal)
+        mal_data = MalData({'id': 1, 'title': 'Ahiru no Sora', 'alternative_titles': {'en': 'Ahiru no Sora'}})
+        metadata = AnimeMetadata(
+            datasource_data={DatasourceName.MAL: mal_data}, title='Ahiru no Sora', title_lang=Language.JA,
+        )
+        season.metadata = metadata
+        journal.looked_up(season)
+        processor.rename(season.episodes[0])  # dies after the first rename
+
+        journal = Journal.for_library(self.library, resume=True)
+        processor, season = self.__season(journal)
+        with mock.patch.object(processor, '_AnimeProcessor__fill_metadata') as fill_metadata:
+            processor.process_season(season)
+            fill_metadata.assert_not_called()
+
+        self.assertEqual(['Ahiru no Sora (Season 1)'], os.listdir(self.library))
+        self.assertEqual(
+            ['Ahiru no Sora - S01E01.mkv', 'Ahiru no Sora - S01E02.mkv'],
+            sorted(os.listdir(os.path.join(self.library, 'Ahiru no Sora (Season 1)'))),
+        )
+        self.assertEqual(['1', '1'], [e.metadata.datasource_data[DatasourceName.MAL].id for e in season.episodes])
+        self.assertEqual(metadata, season.metadata)
+
+        journal.done(season)
+        self.assertTrue(Journal.for_library(self.library, resume=True).is_done(season))
+        self.assertFalse(Journal.for_library(self.library).is_done(season))  # not resuming discards the progress
+
+        journal.remove()
+        self.assertEqual(['library'], os.listdir(self.directory.name))
+
+    def __season(self, journal: Journal) -> Tuple[Processor, Season]:
+        processor = Processor(media_type=MediaType.ANIME, journal=journal)
+        processor._formatter = mock.Mock(new_name=lambda i: i.item_name.replace('[Judas] ', ''))
+
+        season = Season.from_directory(Tree(path=self.season_path).root)
+        return processor, season
+
+
+if __name__ == '__main__':
+    unittest.main()
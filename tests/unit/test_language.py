@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+
+from polyglot.detect import Detector
+
+from src.core.utils.language import LanguageDetector
+
+
+class TestLanguageDetector(unittest.TestCase):
+    def setUp(self) -> None:
+        LanguageDetector.cache_clear()
+
+    def test_detect(self):
+        self.assertEqual(LanguageDetector().detect('進撃の巨人'), 'ja')
+        self.assertEqual(LanguageDetector().detect('进击的巨人'), 'zh')
+        self.assertEqual(LanguageDetector().detect('Attack on Titan - 01 [1080p].mkv'), 'en')
+        self.assertEqual(LanguageDetector().detect('[01]'), 'un')
+
+    def test_cache(self):
+        with mock.patch('polyglot.detect.Detector', wraps=Detector) as detector:
+            LanguageDetector().detect('Attack on Titan - 01')
+            LanguageDetector().detect('attack on titan - 02')
+            self.assertEqual(detector.call_count, 1)
+
+            # kana texts are answered without the detector
+            LanguageDetector().detect('アニメ')
+            self.assertEqual(detector.call_count, 1)
+
+    def test_detect_many(self):
+        texts = ['Hello there, my friend.', 'こんにちは', 'Hello there, my friend!', 'hello there my friend']
+        with mock.patch('polyglot.detect.Detector', wraps=Detector) as detector:
+            self.assertEqual(LanguageDetector().detect_many(texts), ['en', 'ja', 'en', 'en'])
+            self.assertEqual(detector.call_count, 1)
@@ -0,0 +1,48 @@
+import logging
+import threading
+import unittest
+
+from src.core.utils.logs import GroupedLogs
+
+
+class TestGroupedLogs(unittest.TestCase):
+    def setUp(self) -> None:
+        self.records = []
+        self.handler = logging.Handler()
+        self.handler.emit = lambda r: self.records.append(r.getMessage())
+        self.logger = logging.getLogger()
+        self.logger.addHandler(self.handler)
+        self.level = self.logger.level
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self) -> None:
+        self.logger.removeHandler(self.handler)
+        self.logger.setLevel(self.level)
+
+    def test_group(self):
+        barrier = threading.Barrier(2)
+
+        def work(name: str):
+            with GroupedLogs().group():
+                for i in range(3):
+                    self.logger.info(f'{name}:: {i}')
+                    barrier.wait()  # force the interleaving
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in ['first', 'second']]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+
+        self.assertEqual(6, len(self.records))
+        self.assertEqual(1, len({r.split('::')[0] for r in self.records[:3]}))
+        self.assertEqual(1, len({r.split('::')[0] for r in self.records[3:]}))
+
+    def test_not_grouped(self):
+        with GroupedLogs().group():
+            pass
+        self.logger.info('outside')
+
+        self.assertEqual(['outside'], self.records)
+
+
+if __name__ == '__main__':
+    unittest.main()
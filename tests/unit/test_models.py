@@ -1,6 +1,8 @@
 import unittest
+from collections import Counter
 from typing import List
 
+from src.filemapper.tbuilder.models import Directory
 from tests.factories import DirectoryFactory
 from tests.factories import FileFactory
 
@@ -21,12 +23,51 @@ class TestModels(unittest.TestCase):
         ]
     ]
 
+    not_seasons: List[List[str]] = [
+        [
+            'Downloads',
+            '[Cleo]Great_Pretender_-_01_(Dual Audio_10bit_1080p_x265).mkv',
+            '[Judas] Ahiru no Sora - 01.mkv',
+            '[DB]Kaguya-sama wa Kokurasetai Tensai-tachi no Renai Zunousen_-_03_(10bit_BD1080p_x265).mkv',
+        ],
+        [
+            'Overlord',
+            '[Anipakku] Overlord 01.mkv',
+            '[Anipakku] Overlord 02.mkv',
+            '[Cleo]Great_Pretender_-_01_(Dual Audio_10bit_1080p_x265).mkv',
+        ],
+    ]
+
     def test_can_be_season(self):
         for season in self.seasons:
             directory = DirectoryFactory.create(name=season[0], childs=[FileFactory.create(name=n) for n in season[1:]])
             with self.subTest(name=f'matches:: {directory}'):
                 self.assertTrue(directory.can_be_season)
 
+    def test_can_not_be_season(self):
+        for season in self.not_seasons:
+            directory = DirectoryFactory.create(name=season[0], childs=[FileFactory.create(name=n) for n in season[1:]])
+            with self.subTest(name=f'not matches:: {directory}'):
+                self.assertFalse(directory.can_be_season)
+
+    def test_predicates_are_cached(self):
+        season = self.seasons[0]
+        directory = DirectoryFactory.create(name=season[0], childs=[FileFactory.create(name=n) for n in season[1:]])
+        show = DirectoryFactory.create(name='show', childs=[directory, FileFactory.create(name='notes.txt')])
+        directory.parent = show
+
+        self.assertTrue(show.can_be_show)
+        stats = Counter(Directory.predicates_stats)
+        self.assertTrue(directory.can_be_season)
+        self.assertTrue(show.can_be_show)
+        self.assertEqual(stats['misses'], Directory.predicates_stats['misses'])
+        self.assertEqual(stats['hits'] + 2, Directory.predicates_stats['hits'])
+
+        directory.childs.append(FileFactory.create(name='[Judas] Ahiru no Sora - 01.mkv'))
+        directory.invalidate()
+        self.assertFalse(directory.can_be_season)
+        self.assertFalse(show.can_be_show)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.core.datasources.models import MalData
+from src.core.models import Season
+from src.core.models.metadata import AnimeMetadata
+from src.core.types import DatasourceName
+from src.core.types import Language
+from src.core.types import MediaType
+from src.filemapper.plan import Plan
+from src.filemapper.processors import Processor
+from src.filemapper.tbuilder import Tree
+
+
+class TestPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.season_path = os.path.join(self.directory.name, '[Judas] Ahiru no Sora (Season 1)')
+        os.makedirs(self.season_path)
+        for file in ['[Judas] Ahiru no Sora - S01E01.mkv', '[Judas] Ahiru no Sora - S01E02.mkv']:
+            open(os.path.join(self.season_path, file), 'w').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_plan_and_apply(self):
+        plan = Plan()
+        processor = Processor(media_type=MediaType.ANIME, plan=plan)
+        processor._formatter = mock.Mock(new_name=lambda i: i.item_name.replace('[Judas] ', ''))
+
+        season = Season.from_directory(Tree(path=self.season_path).root)
+        mal_data = MalData({'id': 1, 'title': 'Ahiru no Sora', 'alternative_titles': {'en': 'Ahiru no Sora'}})
+        season.metadata = AnimeMetadata(
+            datasource_data={DatasourceName.MAL: mal_data}, title='Ahiru no Sora', title_lang=Language.JA,
+        )
+        processor.rename(season)
+
+        # nothing renamed yet, the episodes go before their season
+        self.assertEqual(['[Judas] Ahiru no Sora (Season 1)'], os.listdir(self.directory.name))
+        self.assertEqual(
+            [
+                ('[Judas] Ahiru no Sora - S01E01.mkv', 'Ahiru no Sora - S01E01.mkv', 'Episode'),
+                ('[Judas] Ahiru no Sora - S01E02.mkv', 'Ahiru no Sora - S01E02.mkv', 'Episode'),
+                ('[Judas] Ahiru no Sora (Season 1)', 'Ahiru no Sora (Season 1)', 'Season'),
+            ],
+            [(os.path.basename(r.source), os.path.basename(r.target), r.item_type) for r in plan],
+        )
+        self.assertEqual({'MAL': '1'}, next(iter(plan)).metadata['datasources'])
+
+        plan_file = os.path.join(self.directory.name, 'plan.ndjson')
+        plan.save(plan_file)
+        self.assertEqual(3, Plan.load(plan_file).apply())
+
+        renamed = os.path.join(self.directory.name, 'Ahiru no Sora (Season 1)')
+        self.assertEqual(['Ahiru no Sora (Season 1)', 'plan.ndjson'], sorted(os.listdir(self.directory.name)))
+        self.assertEqual(['Ahiru no Sora - S01E01.mkv', 'Ahiru no Sora - S01E02.mkv'], sorted(os.listdir(renamed)))
+
+        # the library changed since it was planned
+        self.assertEqual(0, Plan.load(plan_file).apply())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from src.core.utils.strings import apply
+from src.core.utils.strings import apply_clean
+from src.core.utils.strings import CleanCache
+from src.core.utils.strings import generic_clean
+from src.core.utils.strings import remove_extension
+from src.core.utils.strings import remove_tracker
+
+
+class TestStrings(unittest.TestCase):
+    def tearDown(self) -> None:
+        CleanCache().disable()
+
+    def test_apply_clean(self):
+        @apply_clean(clean_functions=[generic_clean, remove_tracker, remove_extension])
+        def clean(*args, **kwargs):
+            return args, kwargs
+
+        self.assertEqual(
+            ((1, 'Ahiru no Sora - S01E01', ['Ahiru no Sora', 'S01E02']), {'word': 'Great Pretender'}),
+            clean(1, '[Judas] Ahiru_no_Sora - S01E01.mkv', ['Ahiru no Sora.mkv', 'S01E02.ass'], word='Great Pretender'),
+        )
+
+    def test_clean_cache(self):
+        functions = [generic_clean, remove_tracker, remove_extension]
+        apply(functions, '[Judas] Ahiru no Sora - S01E01.mkv')
+        self.assertEqual({'hits': 0, 'misses': 0, 'size': 0}, CleanCache().stats())
+
+        CleanCache().enable(maxsize=2)
+        for _ in range(3):
+            self.assertEqual('Ahiru no Sora - S01E01', apply(functions, '[Judas] Ahiru no Sora - S01E01.mkv'))
+        self.assertEqual('[Judas] Ahiru no Sora - S01E01', apply(functions[:1], '[Judas] Ahiru no Sora - S01E01'))
+        self.assertEqual({'hits': 2, 'misses': 2, 'size': 2}, CleanCache().stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
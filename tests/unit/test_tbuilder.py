@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.core.types import SymlinkPolicy
+from src.filemapper.tbuilder import Snapshot
+from src.filemapper.tbuilder import Tree
+from src.filemapper.tbuilder import WalkRules
+from src.filemapper.tbuilder.models import Directory
+from src.filemapper.tbuilder.models import File
+
+
+class TestTree(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'Hajime no Ippo')
+        for season in ['season 1', 'season 2']:
+            os.makedirs(os.path.join(self.path, season))
+            for episode in ['S1E01.mkv', 'S1E02.mkv']:
+                open(os.path.join(self.path, season, episode), 'w').close()
+        open(os.path.join(self.path, 'notes.txt'), 'w').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_build(self):
+        tree = Tree(path=self.path)
+
+        self.assertTrue(tree.is_directory)
+        self.assertEqual(self.directory.name, tree.path)
+        self.assertEqual(
+            {('season 1', Directory), ('season 2', Directory), ('notes.txt', File)},
+            {(i.name, type(i)) for i in tree.childs},
+        )
+        for season in [i for i in tree.childs if isinstance(i, Directory)]:
+            self.assertEqual({'S1E01.mkv', 'S1E02.mkv'}, {i.name for i in season.childs})
+            self.assertTrue(all(i.parent is season and i.base_path == season.path for i in season.childs))
+            self.assertTrue(all(i.depth == 2 for i in season.childs))
+
+    def test_compact_nodes(self):
+        tree = Tree(path=self.path)
+        episode = next(i for i in tree.childs if isinstance(i, Directory)).childs[0]
+
+        self.assertFalse(hasattr(episode, '__dict__'))
+        self.assertEqual(os.path.join(self.path, 'season 1', 'S1E01.mkv'), episode.path)
+
+    def test_build_concurrently(self):
+        def as_tuple(item):
+            return item.name, [as_tuple(c) for c in item.childs] if isinstance(item, Directory) else None
+
+        tree = Tree(path=self.path)
+        concurrent_tree = Tree(path=self.path, walk_jobs=4)
+
+        self.assertEqual(as_tuple(tree.root), as_tuple(concurrent_tree.root))
+        self.assertEqual(['notes.txt', 'season 1', 'season 2'], [i.name for i in concurrent_tree.childs])
+
+    def test_walk_bottom_up(self):
+        for walk_jobs in [1, 4]:
+            with self.subTest(name=f'walk_jobs:: {walk_jobs}'):
+                tree = Tree(path=self.path, walk_jobs=walk_jobs, lazy=True)
+                self.assertEqual([], tree.childs)
+
+                walked = [d.name for d in tree.walk()]
+                self.assertEqual(['season 1', 'season 2', 'Hajime no Ippo'], sorted(walked[:2]) + walked[2:])
+                self.assertEqual(3, len(tree.childs))
+                self.assertEqual(['season 1', 'season 2', 'Hajime no Ippo'], [d.name for d in tree.walk()])
+
+    def test_snapshot(self):
+        def as_tuple(item):
+            return item.name, [as_tuple(c) for c in item.childs] if isinstance(item, Directory) else None
+
+        snapshot = Snapshot.for_library(self.path)
+        Tree(path=self.path, snapshot=snapshot)
+        self.assertTrue(os.path.isfile(os.path.join(self.directory.name, '.Hajime no Ippo.snapshot')))
+
+        open(os.path.join(self.path, 'season 2', 'S1E03.mkv'), 'w').close()
+        snapshot = Snapshot.for_library(self.path)
+        tree = Tree(path=self.path, snapshot=snapshot)
+
+        self.assertEqual(as_tuple(Tree(path=self.path).root), as_tuple(tree.root))
+        self.assertEqual({'hits': 2, 'misses': 1}, dict(snapshot.stats))
+
+    def test_walk_rules(self):
+        os.makedirs(os.path.join(self.path, 'season 1', 'Samples'))
+        open(os.path.join(self.path, 'season 1', 'Samples', 'S1E01.mkv'), 'w').close()
+        open(os.path.join(self.path, 'season 2', 'S1E01.ass'), 'w').close()
+
+        def names(rules):
+            tree = Tree(path=self.path, rules=rules)
+            return sorted(os.path.relpath(f.path, self.path) for d in tree.walk() for f in d.childs)
+
+        with mock.patch('os.scandir', side_effect=os.scandir) as scandir:
+            self.assertEqual(
+                ['notes.txt', 'season 1', 'season 1/S1E01.mkv', 'season 1/S1E02.mkv', 'season 2'],
+                names(WalkRules(exclude=['samples', 'season 2/*'])),
+            )
+            listed = [c.args[0] for c in scandir.call_args_list]
+            self.assertNotIn(os.path.join(self.path, 'season 1', 'Samples'), listed)
+
+        self.assertEqual(
+            ['season 1', 'season 2', 'season 2/S1E01.mkv', 'season 2/S1E02.mkv'],
+            names(WalkRules(include=['season 2/*'], extensions=['MKV'], max_depth=2)),
+        )
+        self.assertEqual(['notes.txt'], names(WalkRules(max_depth=1)))
+
+    def test_duplicates(self):
+        os.symlink(self.path, os.path.join(self.path, 'season 1', 'loop'))
+        os.symlink(os.path.join(self.path, 'season 1'), os.path.join(self.path, 'season 3'))
+        season = os.path.join(self.path, 'season 2')
+        os.link(os.path.join(season, 'S1E01.mkv'), os.path.join(season, 'S1E01 (copy).mkv'))
+        os.symlink(os.path.join(self.path, 'notes.txt'), os.path.join(self.path, 'season 2', 'notes.txt'))
+
+        kept = None
+        for walk_jobs in [1, 4]:
+            with self.subTest(name=f'walk_jobs:: {walk_jobs}'):
+                tree = Tree(path=self.path, walk_jobs=walk_jobs)
+                # either 'season 1' or its 'season 3' symlink is kept, the same one whatever the walk_jobs
+                files = [
+                    os.path.relpath(f.path, self.path) for d in tree.walk() for f in d.childs if isinstance(f, File)
+                ]
+                kept = kept or files
+                self.assertEqual(kept, files)
+                self.assertEqual(5, len(files))
+                self.assertEqual(
+                    ['S1E01 (copy).mkv', 'S1E01.mkv', 'S1E02.mkv', 'S1E02.mkv', 'notes.txt'],
+                    sorted(os.path.basename(f) for f in files),
+                )
+                self.assertIn(os.path.join('season 2', 'S1E01 (copy).mkv'), files)
+                self.assertEqual(3, len([d for d in tree.walk()]))
+
+        tree = Tree(path=self.path, symlinks=SymlinkPolicy.SKIP)
+        self.assertEqual(['notes.txt', 'season 1', 'season 2'], [i.name for i in tree.childs])
+        self.assertEqual(['S1E01 (copy).mkv', 'S1E02.mkv'], [i.name for i in tree.childs[2].childs])
+
+    def test_build_file(self):
+        tree = Tree(path=os.path.join(self.path, 'notes.txt'))
+
+        self.assertTrue(tree.is_file)
+        self.assertEqual([], tree.childs)
+
+
+if __name__ == '__main__':
+    unittest.main()
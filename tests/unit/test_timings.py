@@ -0,0 +1,42 @@
+import unittest
+from unittest import mock
+
+from src.core.utils.timings import Timings
+
+
+class TestTimings(unittest.TestCase):
+    def setUp(self) -> None:
+        Timings().reset()
+
+    def tearDown(self) -> None:
+        Timings().reset()
+
+    def test_summary(self):
+        @Timings().stage('decorated')
+        def decorated():
+            pass
+
+        with mock.patch('time.perf_counter', side_effect=[v for i in range(1, 101) for v in (0, i / 100)]):
+            for _ in range(100):
+                with Timings().stage('stage'):
+                    pass
+        decorated()
+        decorated()
+
+        summary = Timings().summary()
+        self.assertEqual(['decorated', 'stage'], list(summary.keys()))
+        self.assertEqual(2, summary['decorated']['count'])
+        self.assertEqual({'count': 100, 'total': 50.5, 'p50': 0.5, 'p95': 0.95, 'max': 1.0}, summary['stage'])
+
+        Timings().reset()
+        self.assertEqual({}, Timings().summary())
+
+    def test_records_failed_stages(self):
+        with self.assertRaises(ValueError):
+            with Timings().stage('failed'):
+                raise ValueError()
+        self.assertEqual(1, Timings().summary()['failed']['count'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+from typing import List
+from unittest import mock
+
+from src.filemapper.watcher import _InotifyWatcher
+from src.filemapper.watcher import Watcher
+
+
+class TestWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        os.makedirs(os.path.join(self.path, 'Hajime no Ippo'))
+        open(os.path.join(self.path, 'Hajime no Ippo', 'S1E01.mkv'), 'w').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_inotify(self):
+        if not _InotifyWatcher.is_supported():
+            self.skipTest('inotify not available')
+        self.__test_changes()
+
+    def test_polling(self):
+        with mock.patch.object(_InotifyWatcher, 'is_supported', return_value=False):
+            self.__test_changes()
+
+    def __test_changes(self):
+        watcher = Watcher(path=self.path, settle=0.2, interval=0.05)
+        try:
+            # renamed entries are not reported, arrivals in renamed ones are
+            os.rename(os.path.join(self.path, 'Hajime no Ippo'), os.path.join(self.path, 'Hajime no Ippo (2000)'))
+            open(os.path.join(self.path, 'Hajime no Ippo (2000)', 'S1E02.mkv'), 'w').close()
+            os.makedirs(os.path.join(self.path, 'Ahiru no Sora'))
+            with open(os.path.join(self.path, 'Ahiru no Sora', 'S1E01.mkv.part'), 'w') as file:
+                file.write('downloading')
+            os.rename(os.path.join(self.path, 'Ahiru no Sora'), os.path.join(self.path, 'Ahiru no Sora (2019)'))
+            open(os.path.join(self.path, 'S1E01.mkv'), 'w').close()
+
+            self.assertEqual(
+                [os.path.join(self.path, e) for e in ['Ahiru no Sora (2019)', 'Hajime no Ippo (2000)', 'S1E01.mkv']],
+                sorted(self.__settled(watcher, count=3)),
+            )
+        finally:
+            watcher.close()
+
+    def __settled(self, watcher: Watcher, count: int, timeout: float = 5) -> List[str]:
+        """
+        :return: the first #count settled entries, entries changed at almost the same time can settle separately
+        """
+        def collect():
+            try:
+                [batches.put(b) for b in watcher.changes()]
+            except (OSError, ValueError):  # closed watcher
+                pass
+
+        batches = queue.Queue()
+        threading.Thread(target=collect, daemon=True).start()
+
+        settled, deadline = [], time.monotonic() + timeout
+        while len(settled) < count:
+            try:
+                settled += batches.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.fail(f'only {settled} settled in {timeout} seconds')
+        return settled
+
+
+if __name__ == '__main__':
+    unittest.main()